@@ -0,0 +1,95 @@
+"""Generate src/_generated_validators.py from the schemas in src/schemas.py.
+
+fastjsonschema.compile() re-parses each schema and regenerates Python
+source on every process start. The schema set here is fixed, so this
+script runs fastjsonschema.compile_to_code() once per schema at build
+time and writes the results into one importable module; runtime lookup
+is then a dict probe instead of a compile.
+
+Regenerate after editing src/schemas.py:
+
+    python devtools/build_validators.py
+
+A stale (or missing) generated module is safe: src.validators keys the
+lookup by the sha256 of each schema's canonical dump, so an edited
+schema simply misses and falls back to runtime compilation.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from hashlib import sha256
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import fastjsonschema
+import orjson
+
+import src.schemas as schemas
+from src.validators import _FORMATS
+
+OUTPUT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "src", "_generated_validators.py")
+)
+
+HEADER = '''"""AOT-compiled fastjsonschema validators. GENERATED FILE - DO NOT EDIT.
+
+Regenerate with: python devtools/build_validators.py
+"""
+
+import re
+
+'''
+
+_SIGNATURE = "def validate(data, custom_formats={}, name_prefix=None):"
+
+
+def main() -> None:
+    names = sorted(
+        n for n in dir(schemas)
+        if n.endswith("_SCHEMA") and isinstance(getattr(schemas, n), dict)
+    )
+    parts = [HEADER]
+
+    # Formats referenced by the generated code. The patterns are recovered
+    # from the runtime table so src.validators._FORMATS stays the single
+    # source of truth.
+    fmt_lines = ",\n".join(
+        f'    "{name}": re.compile(r"{check.__self__.pattern}").fullmatch'
+        for name, check in sorted(_FORMATS.items())
+    )
+    parts.append(f"_FORMATS = {{\n{fmt_lines},\n}}\n\n")
+
+    prelude_done = False
+    table = []
+    for name in names:
+        schema = getattr(schemas, name)
+        code = fastjsonschema.compile_to_code(schema, formats=_FORMATS)
+        cut = code.index(_SIGNATURE)
+        if not prelude_done:
+            # Identical across schemas (imports, NoneType); emit once.
+            parts.append(code[:cut])
+            prelude_done = True
+        fn = f"validate_{name.lower()}"
+        body = code[cut:].replace(
+            _SIGNATURE,
+            f"def {fn}(data, custom_formats=_FORMATS, name_prefix=None):",
+            1,
+        )
+        parts.append("\n" + body)
+        digest = sha256(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        table.append(f'    "{digest}": {fn},  # {name}')
+
+    parts.append(
+        "\n\n# canonical-dump sha256 -> compiled validator\nVALIDATORS = {\n"
+        + "\n".join(table)
+        + "\n}\n"
+    )
+    with open(OUTPUT, "w") as f:
+        f.write("".join(parts))
+    print(f"Wrote {len(names)} validators to {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1803 @@
+"""AOT-compiled fastjsonschema validators. GENERATED FILE - DO NOT EDIT.
+
+Regenerate with: python devtools/build_validators.py
+"""
+
+import re
+
+_FORMATS = {
+    "mac": re.compile(r"[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5}").fullmatch,
+}
+
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+
+def validate_firewall_policy_create_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'ruleset', 'action', 'index'], 'properties': {'name': {'type': 'string', 'minLength': 1, 'description': 'Name of the firewall policy.', 'examples': ['Block Xbox LAN Out']}, 'ruleset': {'type': 'string', 'enum': ['WAN_IN', 'WAN_OUT', 'WAN_LOCAL', 'LAN_IN', 'LAN_OUT', 'LAN_LOCAL', 'GUEST_IN', 'GUEST_OUT', 'GUEST_LOCAL', 'VPN_IN', 'VPN_OUT', 'VPN_LOCAL'], 'description': 'Target firewall ruleset.', 'examples': ['LAN_OUT']}, 'action': {'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Action for matched traffic (must be lowercase).', 'examples': ['drop']}, 'index': {'type': 'integer', 'minimum': 1, 'description': "Rule priority index (lower numbers execute first). API uses 'index' for V2.", 'examples': [2010]}, 'enabled': {'type': 'boolean', 'default': True, 'description': 'Whether the rule is enabled upon creation.', 'examples': [True]}, 'description': {'type': 'string', 'default': '', 'description': 'Optional description for the rule.', 'examples': ['Block specific Xbox device from WAN']}, 'logging': {'type': 'boolean', 'default': False, 'description': 'Enable logging for matched traffic.', 'examples': [True]}, 'protocol': {'type': 'string', 'default': 'all', 'description': "Network protocol (e.g., 'tcp', 'udp', 'icmp', 'all').", 'examples': ['all']}, 'connection_state_type': {'type': 'string', 'enum': ['inclusive', 'exclusive'], 'default': 'inclusive', 'description': 'How connection states are matched.', 'examples': ['inclusive']}, 'connection_states': {'type': 'array', 'items': {'type': 'string', 'enum': ['new', 'established', 'related', 'invalid']}, 'default': ['new', 'established', 'related', 'invalid'], 'description': 'Connection states to match.', 'examples': [['new', 'established', 'related', 'invalid']]}, 'source': {'type': 'object', 'required': ['match_opposite_ports', 'matching_target', 'port_matching_type', 'zone_id'], 'properties': {'match_opposite_ports': {'type': 'boolean', 'default': False}, 'matching_target': {'type': 'string', 'enum': ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region'], 'description': 'How source is matched.', 'examples': ['client_macs']}, 'port_matching_type': {'type': 'string', 'enum': ['any', 'single_port', 'port_range'], 'default': 'any', 'description': 'How ports are matched.', 'examples': ['any']}, 'zone_id': {'type': 'string', 'description': "Source zone ID (e.g., 'trusted', 'guest', 'iot').", 'examples': ['trusted']}, 'client_macs': {'type': 'array', 'items': {'type': 'string', 'format': 'mac'}, 'description': "Required if matching_target is 'client_macs'.", 'examples': [['4c:3b:df:2c:c8:c6']]}, 'network_id': {'type': 'string', 'description': "Required if matching_target is 'network_id'."}, 'ip_group_id': {'type': 'string', 'description': "Required if matching_target is 'ip_group_id'."}, 'port': {'type': 'string', 'description': "Required if port_matching_type is 'single_port'."}, 'port_range_start': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'port_range_end': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'region': {'type': 'string', 'description': "Required if matching_target is 'region'."}}, 'additionalProperties': True}, 'destination': {'type': 'object', 'required': ['match_opposite_ports', 'matching_target', 'port_matching_type', 'zone_id'], 'properties': {'match_opposite_ports': {'type': 'boolean', 'default': False}, 'matching_target': {'type': 'string', 'enum': ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region'], 'description': 'How destination is matched.', 'examples': ['zone']}, 'port_matching_type': {'type': 'string', 'enum': ['any', 'single_port', 'port_range'], 'default': 'any', 'description': 'How ports are matched.', 'examples': ['any']}, 'zone_id': {'type': 'string', 'description': "Destination zone ID (e.g., 'wan', 'trusted', 'guest').", 'examples': ['wan']}, 'client_macs': {'type': 'array', 'items': {'type': 'string', 'format': 'mac'}, 'description': "Required if matching_target is 'client_macs'."}, 'network_id': {'type': 'string', 'description': "Required if matching_target is 'network_id'."}, 'ip_group_id': {'type': 'string', 'description': "Required if matching_target is 'ip_group_id'."}, 'port': {'type': 'string', 'description': "Required if port_matching_type is 'single_port'."}, 'port_range_start': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'port_range_end': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'region': {'type': 'string', 'description': "Required if matching_target is 'region'."}}, 'additionalProperties': True}, 'icmp_typename': {'type': 'string', 'description': "ICMP type name (if protocol is 'icmp')."}, 'icmp_v6_typename': {'type': 'string', 'description': "ICMPv6 type name (if protocol is 'icmpv6')."}, 'ip_version': {'type': 'string', 'enum': ['ipv4', 'ipv6', 'both'], 'default': 'ipv4', 'description': 'IP version to apply the rule to.', 'examples': ['ipv4']}, 'match_ip_sec': {'type': 'boolean', 'default': False, 'description': 'Match IPSec traffic.', 'examples': [False]}, 'match_opposite_protocol': {'type': 'boolean', 'default': False, 'description': 'Match opposite protocol.', 'examples': [False]}, 'schedule': {'type': 'object', 'properties': {'mode': {'type': 'string', 'enum': ['always', 'specific_time', 'disabled']}, 'repeat_on_days': {'type': 'array', 'items': {'type': 'string'}}, 'time_all_day': {'type': 'boolean'}}, 'description': 'Rule schedule configuration (optional).'}, 'create_allow_respond': {'type': 'boolean', 'default': False, 'description': 'Whether to create an allow respond rule automatically.', 'examples': [False]}}, 'additionalProperties': True}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name', 'ruleset', 'action', 'index']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'ruleset', 'action', 'index'], 'properties': {'name': {'type': 'string', 'minLength': 1, 'description': 'Name of the firewall policy.', 'examples': ['Block Xbox LAN Out']}, 'ruleset': {'type': 'string', 'enum': ['WAN_IN', 'WAN_OUT', 'WAN_LOCAL', 'LAN_IN', 'LAN_OUT', 'LAN_LOCAL', 'GUEST_IN', 'GUEST_OUT', 'GUEST_LOCAL', 'VPN_IN', 'VPN_OUT', 'VPN_LOCAL'], 'description': 'Target firewall ruleset.', 'examples': ['LAN_OUT']}, 'action': {'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Action for matched traffic (must be lowercase).', 'examples': ['drop']}, 'index': {'type': 'integer', 'minimum': 1, 'description': "Rule priority index (lower numbers execute first). API uses 'index' for V2.", 'examples': [2010]}, 'enabled': {'type': 'boolean', 'default': True, 'description': 'Whether the rule is enabled upon creation.', 'examples': [True]}, 'description': {'type': 'string', 'default': '', 'description': 'Optional description for the rule.', 'examples': ['Block specific Xbox device from WAN']}, 'logging': {'type': 'boolean', 'default': False, 'description': 'Enable logging for matched traffic.', 'examples': [True]}, 'protocol': {'type': 'string', 'default': 'all', 'description': "Network protocol (e.g., 'tcp', 'udp', 'icmp', 'all').", 'examples': ['all']}, 'connection_state_type': {'type': 'string', 'enum': ['inclusive', 'exclusive'], 'default': 'inclusive', 'description': 'How connection states are matched.', 'examples': ['inclusive']}, 'connection_states': {'type': 'array', 'items': {'type': 'string', 'enum': ['new', 'established', 'related', 'invalid']}, 'default': ['new', 'established', 'related', 'invalid'], 'description': 'Connection states to match.', 'examples': [['new', 'established', 'related', 'invalid']]}, 'source': {'type': 'object', 'required': ['match_opposite_ports', 'matching_target', 'port_matching_type', 'zone_id'], 'properties': {'match_opposite_ports': {'type': 'boolean', 'default': False}, 'matching_target': {'type': 'string', 'enum': ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region'], 'description': 'How source is matched.', 'examples': ['client_macs']}, 'port_matching_type': {'type': 'string', 'enum': ['any', 'single_port', 'port_range'], 'default': 'any', 'description': 'How ports are matched.', 'examples': ['any']}, 'zone_id': {'type': 'string', 'description': "Source zone ID (e.g., 'trusted', 'guest', 'iot').", 'examples': ['trusted']}, 'client_macs': {'type': 'array', 'items': {'type': 'string', 'format': 'mac'}, 'description': "Required if matching_target is 'client_macs'.", 'examples': [['4c:3b:df:2c:c8:c6']]}, 'network_id': {'type': 'string', 'description': "Required if matching_target is 'network_id'."}, 'ip_group_id': {'type': 'string', 'description': "Required if matching_target is 'ip_group_id'."}, 'port': {'type': 'string', 'description': "Required if port_matching_type is 'single_port'."}, 'port_range_start': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'port_range_end': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'region': {'type': 'string', 'description': "Required if matching_target is 'region'."}}, 'additionalProperties': True}, 'destination': {'type': 'object', 'required': ['match_opposite_ports', 'matching_target', 'port_matching_type', 'zone_id'], 'properties': {'match_opposite_ports': {'type': 'boolean', 'default': False}, 'matching_target': {'type': 'string', 'enum': ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region'], 'description': 'How destination is matched.', 'examples': ['zone']}, 'port_matching_type': {'type': 'string', 'enum': ['any', 'single_port', 'port_range'], 'default': 'any', 'description': 'How ports are matched.', 'examples': ['any']}, 'zone_id': {'type': 'string', 'description': "Destination zone ID (e.g., 'wan', 'trusted', 'guest').", 'examples': ['wan']}, 'client_macs': {'type': 'array', 'items': {'type': 'string', 'format': 'mac'}, 'description': "Required if matching_target is 'client_macs'."}, 'network_id': {'type': 'string', 'description': "Required if matching_target is 'network_id'."}, 'ip_group_id': {'type': 'string', 'description': "Required if matching_target is 'ip_group_id'."}, 'port': {'type': 'string', 'description': "Required if port_matching_type is 'single_port'."}, 'port_range_start': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'port_range_end': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'region': {'type': 'string', 'description': "Required if matching_target is 'region'."}}, 'additionalProperties': True}, 'icmp_typename': {'type': 'string', 'description': "ICMP type name (if protocol is 'icmp')."}, 'icmp_v6_typename': {'type': 'string', 'description': "ICMPv6 type name (if protocol is 'icmpv6')."}, 'ip_version': {'type': 'string', 'enum': ['ipv4', 'ipv6', 'both'], 'default': 'ipv4', 'description': 'IP version to apply the rule to.', 'examples': ['ipv4']}, 'match_ip_sec': {'type': 'boolean', 'default': False, 'description': 'Match IPSec traffic.', 'examples': [False]}, 'match_opposite_protocol': {'type': 'boolean', 'default': False, 'description': 'Match opposite protocol.', 'examples': [False]}, 'schedule': {'type': 'object', 'properties': {'mode': {'type': 'string', 'enum': ['always', 'specific_time', 'disabled']}, 'repeat_on_days': {'type': 'array', 'items': {'type': 'string'}}, 'time_all_day': {'type': 'boolean'}}, 'description': 'Rule schedule configuration (optional).'}, 'create_allow_respond': {'type': 'boolean', 'default': False, 'description': 'Whether to create an allow respond rule automatically.', 'examples': [False]}}, 'additionalProperties': True}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'minLength': 1, 'description': 'Name of the firewall policy.', 'examples': ['Block Xbox LAN Out']}, rule='type')
+            if isinstance(data__name, str):
+                data__name_len = len(data__name)
+                if data__name_len < 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be longer than or equal to 1 characters", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'minLength': 1, 'description': 'Name of the firewall policy.', 'examples': ['Block Xbox LAN Out']}, rule='minLength')
+        if "ruleset" in data_keys:
+            data_keys.remove("ruleset")
+            data__ruleset = data["ruleset"]
+            if not isinstance(data__ruleset, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ruleset must be string", value=data__ruleset, name="" + (name_prefix or "data") + ".ruleset", definition={'type': 'string', 'enum': ['WAN_IN', 'WAN_OUT', 'WAN_LOCAL', 'LAN_IN', 'LAN_OUT', 'LAN_LOCAL', 'GUEST_IN', 'GUEST_OUT', 'GUEST_LOCAL', 'VPN_IN', 'VPN_OUT', 'VPN_LOCAL'], 'description': 'Target firewall ruleset.', 'examples': ['LAN_OUT']}, rule='type')
+            if not (isinstance(data__ruleset, str) and data__ruleset == 'WAN_IN' or isinstance(data__ruleset, str) and data__ruleset == 'WAN_OUT' or isinstance(data__ruleset, str) and data__ruleset == 'WAN_LOCAL' or isinstance(data__ruleset, str) and data__ruleset == 'LAN_IN' or isinstance(data__ruleset, str) and data__ruleset == 'LAN_OUT' or isinstance(data__ruleset, str) and data__ruleset == 'LAN_LOCAL' or isinstance(data__ruleset, str) and data__ruleset == 'GUEST_IN' or isinstance(data__ruleset, str) and data__ruleset == 'GUEST_OUT' or isinstance(data__ruleset, str) and data__ruleset == 'GUEST_LOCAL' or isinstance(data__ruleset, str) and data__ruleset == 'VPN_IN' or isinstance(data__ruleset, str) and data__ruleset == 'VPN_OUT' or isinstance(data__ruleset, str) and data__ruleset == 'VPN_LOCAL'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ruleset must be one of ['WAN_IN', 'WAN_OUT', 'WAN_LOCAL', 'LAN_IN', 'LAN_OUT', 'LAN_LOCAL', 'GUEST_IN', 'GUEST_OUT', 'GUEST_LOCAL', 'VPN_IN', 'VPN_OUT', 'VPN_LOCAL']", value=data__ruleset, name="" + (name_prefix or "data") + ".ruleset", definition={'type': 'string', 'enum': ['WAN_IN', 'WAN_OUT', 'WAN_LOCAL', 'LAN_IN', 'LAN_OUT', 'LAN_LOCAL', 'GUEST_IN', 'GUEST_OUT', 'GUEST_LOCAL', 'VPN_IN', 'VPN_OUT', 'VPN_LOCAL'], 'description': 'Target firewall ruleset.', 'examples': ['LAN_OUT']}, rule='enum')
+        if "action" in data_keys:
+            data_keys.remove("action")
+            data__action = data["action"]
+            if not isinstance(data__action, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".action must be string", value=data__action, name="" + (name_prefix or "data") + ".action", definition={'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Action for matched traffic (must be lowercase).', 'examples': ['drop']}, rule='type')
+            if not (isinstance(data__action, str) and data__action == 'accept' or isinstance(data__action, str) and data__action == 'drop' or isinstance(data__action, str) and data__action == 'reject'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".action must be one of ['accept', 'drop', 'reject']", value=data__action, name="" + (name_prefix or "data") + ".action", definition={'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Action for matched traffic (must be lowercase).', 'examples': ['drop']}, rule='enum')
+        if "index" in data_keys:
+            data_keys.remove("index")
+            data__index = data["index"]
+            if not isinstance(data__index, (int)) and not (isinstance(data__index, float) and data__index.is_integer()) or isinstance(data__index, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".index must be integer", value=data__index, name="" + (name_prefix or "data") + ".index", definition={'type': 'integer', 'minimum': 1, 'description': "Rule priority index (lower numbers execute first). API uses 'index' for V2.", 'examples': [2010]}, rule='type')
+            if isinstance(data__index, (int, float, Decimal)):
+                if data__index < 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".index must be bigger than or equal to 1", value=data__index, name="" + (name_prefix or "data") + ".index", definition={'type': 'integer', 'minimum': 1, 'description': "Rule priority index (lower numbers execute first). API uses 'index' for V2.", 'examples': [2010]}, rule='minimum')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'default': True, 'description': 'Whether the rule is enabled upon creation.', 'examples': [True]}, rule='type')
+        else: data["enabled"] = True
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'default': '', 'description': 'Optional description for the rule.', 'examples': ['Block specific Xbox device from WAN']}, rule='type')
+        else: data["description"] = ''
+        if "logging" in data_keys:
+            data_keys.remove("logging")
+            data__logging = data["logging"]
+            if not isinstance(data__logging, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".logging must be boolean", value=data__logging, name="" + (name_prefix or "data") + ".logging", definition={'type': 'boolean', 'default': False, 'description': 'Enable logging for matched traffic.', 'examples': [True]}, rule='type')
+        else: data["logging"] = False
+        if "protocol" in data_keys:
+            data_keys.remove("protocol")
+            data__protocol = data["protocol"]
+            if not isinstance(data__protocol, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".protocol must be string", value=data__protocol, name="" + (name_prefix or "data") + ".protocol", definition={'type': 'string', 'default': 'all', 'description': "Network protocol (e.g., 'tcp', 'udp', 'icmp', 'all').", 'examples': ['all']}, rule='type')
+        else: data["protocol"] = 'all'
+        if "connection_state_type" in data_keys:
+            data_keys.remove("connection_state_type")
+            data__connectionstatetype = data["connection_state_type"]
+            if not isinstance(data__connectionstatetype, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".connection_state_type must be string", value=data__connectionstatetype, name="" + (name_prefix or "data") + ".connection_state_type", definition={'type': 'string', 'enum': ['inclusive', 'exclusive'], 'default': 'inclusive', 'description': 'How connection states are matched.', 'examples': ['inclusive']}, rule='type')
+            if not (isinstance(data__connectionstatetype, str) and data__connectionstatetype == 'inclusive' or isinstance(data__connectionstatetype, str) and data__connectionstatetype == 'exclusive'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".connection_state_type must be one of ['inclusive', 'exclusive']", value=data__connectionstatetype, name="" + (name_prefix or "data") + ".connection_state_type", definition={'type': 'string', 'enum': ['inclusive', 'exclusive'], 'default': 'inclusive', 'description': 'How connection states are matched.', 'examples': ['inclusive']}, rule='enum')
+        else: data["connection_state_type"] = 'inclusive'
+        if "connection_states" in data_keys:
+            data_keys.remove("connection_states")
+            data__connectionstates = data["connection_states"]
+            if not isinstance(data__connectionstates, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".connection_states must be array", value=data__connectionstates, name="" + (name_prefix or "data") + ".connection_states", definition={'type': 'array', 'items': {'type': 'string', 'enum': ['new', 'established', 'related', 'invalid']}, 'default': ['new', 'established', 'related', 'invalid'], 'description': 'Connection states to match.', 'examples': [['new', 'established', 'related', 'invalid']]}, rule='type')
+            data__connectionstates_is_list = isinstance(data__connectionstates, (list, tuple))
+            if data__connectionstates_is_list:
+                data__connectionstates_len = len(data__connectionstates)
+                for data__connectionstates_x, data__connectionstates_item in enumerate(data__connectionstates):
+                    if not isinstance(data__connectionstates_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".connection_states[{data__connectionstates_x}]".format(**locals()) + " must be string", value=data__connectionstates_item, name="" + (name_prefix or "data") + ".connection_states[{data__connectionstates_x}]".format(**locals()) + "", definition={'type': 'string', 'enum': ['new', 'established', 'related', 'invalid']}, rule='type')
+                    if not (isinstance(data__connectionstates_item, str) and data__connectionstates_item == 'new' or isinstance(data__connectionstates_item, str) and data__connectionstates_item == 'established' or isinstance(data__connectionstates_item, str) and data__connectionstates_item == 'related' or isinstance(data__connectionstates_item, str) and data__connectionstates_item == 'invalid'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".connection_states[{data__connectionstates_x}]".format(**locals()) + " must be one of ['new', 'established', 'related', 'invalid']", value=data__connectionstates_item, name="" + (name_prefix or "data") + ".connection_states[{data__connectionstates_x}]".format(**locals()) + "", definition={'type': 'string', 'enum': ['new', 'established', 'related', 'invalid']}, rule='enum')
+        else: data["connection_states"] = ['new', 'established', 'related', 'invalid']
+        if "source" in data_keys:
+            data_keys.remove("source")
+            data__source = data["source"]
+            if not isinstance(data__source, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".source must be object", value=data__source, name="" + (name_prefix or "data") + ".source", definition={'type': 'object', 'required': ['match_opposite_ports', 'matching_target', 'port_matching_type', 'zone_id'], 'properties': {'match_opposite_ports': {'type': 'boolean', 'default': False}, 'matching_target': {'type': 'string', 'enum': ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region'], 'description': 'How source is matched.', 'examples': ['client_macs']}, 'port_matching_type': {'type': 'string', 'enum': ['any', 'single_port', 'port_range'], 'default': 'any', 'description': 'How ports are matched.', 'examples': ['any']}, 'zone_id': {'type': 'string', 'description': "Source zone ID (e.g., 'trusted', 'guest', 'iot').", 'examples': ['trusted']}, 'client_macs': {'type': 'array', 'items': {'type': 'string', 'format': 'mac'}, 'description': "Required if matching_target is 'client_macs'.", 'examples': [['4c:3b:df:2c:c8:c6']]}, 'network_id': {'type': 'string', 'description': "Required if matching_target is 'network_id'."}, 'ip_group_id': {'type': 'string', 'description': "Required if matching_target is 'ip_group_id'."}, 'port': {'type': 'string', 'description': "Required if port_matching_type is 'single_port'."}, 'port_range_start': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'port_range_end': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'region': {'type': 'string', 'description': "Required if matching_target is 'region'."}}, 'additionalProperties': True}, rule='type')
+            data__source_is_dict = isinstance(data__source, dict)
+            if data__source_is_dict:
+                data__source__missing_keys = set(['match_opposite_ports', 'matching_target', 'port_matching_type', 'zone_id']) - data__source.keys()
+                if data__source__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".source must contain " + (str(sorted(data__source__missing_keys)) + " properties"), value=data__source, name="" + (name_prefix or "data") + ".source", definition={'type': 'object', 'required': ['match_opposite_ports', 'matching_target', 'port_matching_type', 'zone_id'], 'properties': {'match_opposite_ports': {'type': 'boolean', 'default': False}, 'matching_target': {'type': 'string', 'enum': ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region'], 'description': 'How source is matched.', 'examples': ['client_macs']}, 'port_matching_type': {'type': 'string', 'enum': ['any', 'single_port', 'port_range'], 'default': 'any', 'description': 'How ports are matched.', 'examples': ['any']}, 'zone_id': {'type': 'string', 'description': "Source zone ID (e.g., 'trusted', 'guest', 'iot').", 'examples': ['trusted']}, 'client_macs': {'type': 'array', 'items': {'type': 'string', 'format': 'mac'}, 'description': "Required if matching_target is 'client_macs'.", 'examples': [['4c:3b:df:2c:c8:c6']]}, 'network_id': {'type': 'string', 'description': "Required if matching_target is 'network_id'."}, 'ip_group_id': {'type': 'string', 'description': "Required if matching_target is 'ip_group_id'."}, 'port': {'type': 'string', 'description': "Required if port_matching_type is 'single_port'."}, 'port_range_start': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'port_range_end': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'region': {'type': 'string', 'description': "Required if matching_target is 'region'."}}, 'additionalProperties': True}, rule='required')
+                data__source_keys = set(data__source.keys())
+                if "match_opposite_ports" in data__source_keys:
+                    data__source_keys.remove("match_opposite_ports")
+                    data__source__matchoppositeports = data__source["match_opposite_ports"]
+                    if not isinstance(data__source__matchoppositeports, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.match_opposite_ports must be boolean", value=data__source__matchoppositeports, name="" + (name_prefix or "data") + ".source.match_opposite_ports", definition={'type': 'boolean', 'default': False}, rule='type')
+                else: data__source["match_opposite_ports"] = False
+                if "matching_target" in data__source_keys:
+                    data__source_keys.remove("matching_target")
+                    data__source__matchingtarget = data__source["matching_target"]
+                    if not isinstance(data__source__matchingtarget, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.matching_target must be string", value=data__source__matchingtarget, name="" + (name_prefix or "data") + ".source.matching_target", definition={'type': 'string', 'enum': ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region'], 'description': 'How source is matched.', 'examples': ['client_macs']}, rule='type')
+                    if not (isinstance(data__source__matchingtarget, str) and data__source__matchingtarget == 'zone' or isinstance(data__source__matchingtarget, str) and data__source__matchingtarget == 'client_macs' or isinstance(data__source__matchingtarget, str) and data__source__matchingtarget == 'network_id' or isinstance(data__source__matchingtarget, str) and data__source__matchingtarget == 'ip_group_id' or isinstance(data__source__matchingtarget, str) and data__source__matchingtarget == 'region'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.matching_target must be one of ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region']", value=data__source__matchingtarget, name="" + (name_prefix or "data") + ".source.matching_target", definition={'type': 'string', 'enum': ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region'], 'description': 'How source is matched.', 'examples': ['client_macs']}, rule='enum')
+                if "port_matching_type" in data__source_keys:
+                    data__source_keys.remove("port_matching_type")
+                    data__source__portmatchingtype = data__source["port_matching_type"]
+                    if not isinstance(data__source__portmatchingtype, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.port_matching_type must be string", value=data__source__portmatchingtype, name="" + (name_prefix or "data") + ".source.port_matching_type", definition={'type': 'string', 'enum': ['any', 'single_port', 'port_range'], 'default': 'any', 'description': 'How ports are matched.', 'examples': ['any']}, rule='type')
+                    if not (isinstance(data__source__portmatchingtype, str) and data__source__portmatchingtype == 'any' or isinstance(data__source__portmatchingtype, str) and data__source__portmatchingtype == 'single_port' or isinstance(data__source__portmatchingtype, str) and data__source__portmatchingtype == 'port_range'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.port_matching_type must be one of ['any', 'single_port', 'port_range']", value=data__source__portmatchingtype, name="" + (name_prefix or "data") + ".source.port_matching_type", definition={'type': 'string', 'enum': ['any', 'single_port', 'port_range'], 'default': 'any', 'description': 'How ports are matched.', 'examples': ['any']}, rule='enum')
+                else: data__source["port_matching_type"] = 'any'
+                if "zone_id" in data__source_keys:
+                    data__source_keys.remove("zone_id")
+                    data__source__zoneid = data__source["zone_id"]
+                    if not isinstance(data__source__zoneid, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.zone_id must be string", value=data__source__zoneid, name="" + (name_prefix or "data") + ".source.zone_id", definition={'type': 'string', 'description': "Source zone ID (e.g., 'trusted', 'guest', 'iot').", 'examples': ['trusted']}, rule='type')
+                if "client_macs" in data__source_keys:
+                    data__source_keys.remove("client_macs")
+                    data__source__clientmacs = data__source["client_macs"]
+                    if not isinstance(data__source__clientmacs, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.client_macs must be array", value=data__source__clientmacs, name="" + (name_prefix or "data") + ".source.client_macs", definition={'type': 'array', 'items': {'type': 'string', 'format': 'mac'}, 'description': "Required if matching_target is 'client_macs'.", 'examples': [['4c:3b:df:2c:c8:c6']]}, rule='type')
+                    data__source__clientmacs_is_list = isinstance(data__source__clientmacs, (list, tuple))
+                    if data__source__clientmacs_is_list:
+                        data__source__clientmacs_len = len(data__source__clientmacs)
+                        for data__source__clientmacs_x, data__source__clientmacs_item in enumerate(data__source__clientmacs):
+                            if not isinstance(data__source__clientmacs_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.client_macs[{data__source__clientmacs_x}]".format(**locals()) + " must be string", value=data__source__clientmacs_item, name="" + (name_prefix or "data") + ".source.client_macs[{data__source__clientmacs_x}]".format(**locals()) + "", definition={'type': 'string', 'format': 'mac'}, rule='type')
+                            if isinstance(data__source__clientmacs_item, str):
+                                if not custom_formats["mac"](data__source__clientmacs_item):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.client_macs[{data__source__clientmacs_x}]".format(**locals()) + " must be mac", value=data__source__clientmacs_item, name="" + (name_prefix or "data") + ".source.client_macs[{data__source__clientmacs_x}]".format(**locals()) + "", definition={'type': 'string', 'format': 'mac'}, rule='format')
+                if "network_id" in data__source_keys:
+                    data__source_keys.remove("network_id")
+                    data__source__networkid = data__source["network_id"]
+                    if not isinstance(data__source__networkid, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.network_id must be string", value=data__source__networkid, name="" + (name_prefix or "data") + ".source.network_id", definition={'type': 'string', 'description': "Required if matching_target is 'network_id'."}, rule='type')
+                if "ip_group_id" in data__source_keys:
+                    data__source_keys.remove("ip_group_id")
+                    data__source__ipgroupid = data__source["ip_group_id"]
+                    if not isinstance(data__source__ipgroupid, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.ip_group_id must be string", value=data__source__ipgroupid, name="" + (name_prefix or "data") + ".source.ip_group_id", definition={'type': 'string', 'description': "Required if matching_target is 'ip_group_id'."}, rule='type')
+                if "port" in data__source_keys:
+                    data__source_keys.remove("port")
+                    data__source__port = data__source["port"]
+                    if not isinstance(data__source__port, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.port must be string", value=data__source__port, name="" + (name_prefix or "data") + ".source.port", definition={'type': 'string', 'description': "Required if port_matching_type is 'single_port'."}, rule='type')
+                if "port_range_start" in data__source_keys:
+                    data__source_keys.remove("port_range_start")
+                    data__source__portrangestart = data__source["port_range_start"]
+                    if not isinstance(data__source__portrangestart, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.port_range_start must be string", value=data__source__portrangestart, name="" + (name_prefix or "data") + ".source.port_range_start", definition={'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, rule='type')
+                if "port_range_end" in data__source_keys:
+                    data__source_keys.remove("port_range_end")
+                    data__source__portrangeend = data__source["port_range_end"]
+                    if not isinstance(data__source__portrangeend, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.port_range_end must be string", value=data__source__portrangeend, name="" + (name_prefix or "data") + ".source.port_range_end", definition={'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, rule='type')
+                if "region" in data__source_keys:
+                    data__source_keys.remove("region")
+                    data__source__region = data__source["region"]
+                    if not isinstance(data__source__region, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".source.region must be string", value=data__source__region, name="" + (name_prefix or "data") + ".source.region", definition={'type': 'string', 'description': "Required if matching_target is 'region'."}, rule='type')
+        if "destination" in data_keys:
+            data_keys.remove("destination")
+            data__destination = data["destination"]
+            if not isinstance(data__destination, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination must be object", value=data__destination, name="" + (name_prefix or "data") + ".destination", definition={'type': 'object', 'required': ['match_opposite_ports', 'matching_target', 'port_matching_type', 'zone_id'], 'properties': {'match_opposite_ports': {'type': 'boolean', 'default': False}, 'matching_target': {'type': 'string', 'enum': ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region'], 'description': 'How destination is matched.', 'examples': ['zone']}, 'port_matching_type': {'type': 'string', 'enum': ['any', 'single_port', 'port_range'], 'default': 'any', 'description': 'How ports are matched.', 'examples': ['any']}, 'zone_id': {'type': 'string', 'description': "Destination zone ID (e.g., 'wan', 'trusted', 'guest').", 'examples': ['wan']}, 'client_macs': {'type': 'array', 'items': {'type': 'string', 'format': 'mac'}, 'description': "Required if matching_target is 'client_macs'."}, 'network_id': {'type': 'string', 'description': "Required if matching_target is 'network_id'."}, 'ip_group_id': {'type': 'string', 'description': "Required if matching_target is 'ip_group_id'."}, 'port': {'type': 'string', 'description': "Required if port_matching_type is 'single_port'."}, 'port_range_start': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'port_range_end': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'region': {'type': 'string', 'description': "Required if matching_target is 'region'."}}, 'additionalProperties': True}, rule='type')
+            data__destination_is_dict = isinstance(data__destination, dict)
+            if data__destination_is_dict:
+                data__destination__missing_keys = set(['match_opposite_ports', 'matching_target', 'port_matching_type', 'zone_id']) - data__destination.keys()
+                if data__destination__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination must contain " + (str(sorted(data__destination__missing_keys)) + " properties"), value=data__destination, name="" + (name_prefix or "data") + ".destination", definition={'type': 'object', 'required': ['match_opposite_ports', 'matching_target', 'port_matching_type', 'zone_id'], 'properties': {'match_opposite_ports': {'type': 'boolean', 'default': False}, 'matching_target': {'type': 'string', 'enum': ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region'], 'description': 'How destination is matched.', 'examples': ['zone']}, 'port_matching_type': {'type': 'string', 'enum': ['any', 'single_port', 'port_range'], 'default': 'any', 'description': 'How ports are matched.', 'examples': ['any']}, 'zone_id': {'type': 'string', 'description': "Destination zone ID (e.g., 'wan', 'trusted', 'guest').", 'examples': ['wan']}, 'client_macs': {'type': 'array', 'items': {'type': 'string', 'format': 'mac'}, 'description': "Required if matching_target is 'client_macs'."}, 'network_id': {'type': 'string', 'description': "Required if matching_target is 'network_id'."}, 'ip_group_id': {'type': 'string', 'description': "Required if matching_target is 'ip_group_id'."}, 'port': {'type': 'string', 'description': "Required if port_matching_type is 'single_port'."}, 'port_range_start': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'port_range_end': {'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, 'region': {'type': 'string', 'description': "Required if matching_target is 'region'."}}, 'additionalProperties': True}, rule='required')
+                data__destination_keys = set(data__destination.keys())
+                if "match_opposite_ports" in data__destination_keys:
+                    data__destination_keys.remove("match_opposite_ports")
+                    data__destination__matchoppositeports = data__destination["match_opposite_ports"]
+                    if not isinstance(data__destination__matchoppositeports, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.match_opposite_ports must be boolean", value=data__destination__matchoppositeports, name="" + (name_prefix or "data") + ".destination.match_opposite_ports", definition={'type': 'boolean', 'default': False}, rule='type')
+                else: data__destination["match_opposite_ports"] = False
+                if "matching_target" in data__destination_keys:
+                    data__destination_keys.remove("matching_target")
+                    data__destination__matchingtarget = data__destination["matching_target"]
+                    if not isinstance(data__destination__matchingtarget, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.matching_target must be string", value=data__destination__matchingtarget, name="" + (name_prefix or "data") + ".destination.matching_target", definition={'type': 'string', 'enum': ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region'], 'description': 'How destination is matched.', 'examples': ['zone']}, rule='type')
+                    if not (isinstance(data__destination__matchingtarget, str) and data__destination__matchingtarget == 'zone' or isinstance(data__destination__matchingtarget, str) and data__destination__matchingtarget == 'client_macs' or isinstance(data__destination__matchingtarget, str) and data__destination__matchingtarget == 'network_id' or isinstance(data__destination__matchingtarget, str) and data__destination__matchingtarget == 'ip_group_id' or isinstance(data__destination__matchingtarget, str) and data__destination__matchingtarget == 'region'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.matching_target must be one of ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region']", value=data__destination__matchingtarget, name="" + (name_prefix or "data") + ".destination.matching_target", definition={'type': 'string', 'enum': ['zone', 'client_macs', 'network_id', 'ip_group_id', 'region'], 'description': 'How destination is matched.', 'examples': ['zone']}, rule='enum')
+                if "port_matching_type" in data__destination_keys:
+                    data__destination_keys.remove("port_matching_type")
+                    data__destination__portmatchingtype = data__destination["port_matching_type"]
+                    if not isinstance(data__destination__portmatchingtype, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.port_matching_type must be string", value=data__destination__portmatchingtype, name="" + (name_prefix or "data") + ".destination.port_matching_type", definition={'type': 'string', 'enum': ['any', 'single_port', 'port_range'], 'default': 'any', 'description': 'How ports are matched.', 'examples': ['any']}, rule='type')
+                    if not (isinstance(data__destination__portmatchingtype, str) and data__destination__portmatchingtype == 'any' or isinstance(data__destination__portmatchingtype, str) and data__destination__portmatchingtype == 'single_port' or isinstance(data__destination__portmatchingtype, str) and data__destination__portmatchingtype == 'port_range'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.port_matching_type must be one of ['any', 'single_port', 'port_range']", value=data__destination__portmatchingtype, name="" + (name_prefix or "data") + ".destination.port_matching_type", definition={'type': 'string', 'enum': ['any', 'single_port', 'port_range'], 'default': 'any', 'description': 'How ports are matched.', 'examples': ['any']}, rule='enum')
+                else: data__destination["port_matching_type"] = 'any'
+                if "zone_id" in data__destination_keys:
+                    data__destination_keys.remove("zone_id")
+                    data__destination__zoneid = data__destination["zone_id"]
+                    if not isinstance(data__destination__zoneid, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.zone_id must be string", value=data__destination__zoneid, name="" + (name_prefix or "data") + ".destination.zone_id", definition={'type': 'string', 'description': "Destination zone ID (e.g., 'wan', 'trusted', 'guest').", 'examples': ['wan']}, rule='type')
+                if "client_macs" in data__destination_keys:
+                    data__destination_keys.remove("client_macs")
+                    data__destination__clientmacs = data__destination["client_macs"]
+                    if not isinstance(data__destination__clientmacs, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.client_macs must be array", value=data__destination__clientmacs, name="" + (name_prefix or "data") + ".destination.client_macs", definition={'type': 'array', 'items': {'type': 'string', 'format': 'mac'}, 'description': "Required if matching_target is 'client_macs'."}, rule='type')
+                    data__destination__clientmacs_is_list = isinstance(data__destination__clientmacs, (list, tuple))
+                    if data__destination__clientmacs_is_list:
+                        data__destination__clientmacs_len = len(data__destination__clientmacs)
+                        for data__destination__clientmacs_x, data__destination__clientmacs_item in enumerate(data__destination__clientmacs):
+                            if not isinstance(data__destination__clientmacs_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.client_macs[{data__destination__clientmacs_x}]".format(**locals()) + " must be string", value=data__destination__clientmacs_item, name="" + (name_prefix or "data") + ".destination.client_macs[{data__destination__clientmacs_x}]".format(**locals()) + "", definition={'type': 'string', 'format': 'mac'}, rule='type')
+                            if isinstance(data__destination__clientmacs_item, str):
+                                if not custom_formats["mac"](data__destination__clientmacs_item):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.client_macs[{data__destination__clientmacs_x}]".format(**locals()) + " must be mac", value=data__destination__clientmacs_item, name="" + (name_prefix or "data") + ".destination.client_macs[{data__destination__clientmacs_x}]".format(**locals()) + "", definition={'type': 'string', 'format': 'mac'}, rule='format')
+                if "network_id" in data__destination_keys:
+                    data__destination_keys.remove("network_id")
+                    data__destination__networkid = data__destination["network_id"]
+                    if not isinstance(data__destination__networkid, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.network_id must be string", value=data__destination__networkid, name="" + (name_prefix or "data") + ".destination.network_id", definition={'type': 'string', 'description': "Required if matching_target is 'network_id'."}, rule='type')
+                if "ip_group_id" in data__destination_keys:
+                    data__destination_keys.remove("ip_group_id")
+                    data__destination__ipgroupid = data__destination["ip_group_id"]
+                    if not isinstance(data__destination__ipgroupid, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.ip_group_id must be string", value=data__destination__ipgroupid, name="" + (name_prefix or "data") + ".destination.ip_group_id", definition={'type': 'string', 'description': "Required if matching_target is 'ip_group_id'."}, rule='type')
+                if "port" in data__destination_keys:
+                    data__destination_keys.remove("port")
+                    data__destination__port = data__destination["port"]
+                    if not isinstance(data__destination__port, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.port must be string", value=data__destination__port, name="" + (name_prefix or "data") + ".destination.port", definition={'type': 'string', 'description': "Required if port_matching_type is 'single_port'."}, rule='type')
+                if "port_range_start" in data__destination_keys:
+                    data__destination_keys.remove("port_range_start")
+                    data__destination__portrangestart = data__destination["port_range_start"]
+                    if not isinstance(data__destination__portrangestart, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.port_range_start must be string", value=data__destination__portrangestart, name="" + (name_prefix or "data") + ".destination.port_range_start", definition={'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, rule='type')
+                if "port_range_end" in data__destination_keys:
+                    data__destination_keys.remove("port_range_end")
+                    data__destination__portrangeend = data__destination["port_range_end"]
+                    if not isinstance(data__destination__portrangeend, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.port_range_end must be string", value=data__destination__portrangeend, name="" + (name_prefix or "data") + ".destination.port_range_end", definition={'type': 'string', 'description': "Required if port_matching_type is 'port_range'."}, rule='type')
+                if "region" in data__destination_keys:
+                    data__destination_keys.remove("region")
+                    data__destination__region = data__destination["region"]
+                    if not isinstance(data__destination__region, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destination.region must be string", value=data__destination__region, name="" + (name_prefix or "data") + ".destination.region", definition={'type': 'string', 'description': "Required if matching_target is 'region'."}, rule='type')
+        if "icmp_typename" in data_keys:
+            data_keys.remove("icmp_typename")
+            data__icmptypename = data["icmp_typename"]
+            if not isinstance(data__icmptypename, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".icmp_typename must be string", value=data__icmptypename, name="" + (name_prefix or "data") + ".icmp_typename", definition={'type': 'string', 'description': "ICMP type name (if protocol is 'icmp')."}, rule='type')
+        if "icmp_v6_typename" in data_keys:
+            data_keys.remove("icmp_v6_typename")
+            data__icmpv6typename = data["icmp_v6_typename"]
+            if not isinstance(data__icmpv6typename, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".icmp_v6_typename must be string", value=data__icmpv6typename, name="" + (name_prefix or "data") + ".icmp_v6_typename", definition={'type': 'string', 'description': "ICMPv6 type name (if protocol is 'icmpv6')."}, rule='type')
+        if "ip_version" in data_keys:
+            data_keys.remove("ip_version")
+            data__ipversion = data["ip_version"]
+            if not isinstance(data__ipversion, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_version must be string", value=data__ipversion, name="" + (name_prefix or "data") + ".ip_version", definition={'type': 'string', 'enum': ['ipv4', 'ipv6', 'both'], 'default': 'ipv4', 'description': 'IP version to apply the rule to.', 'examples': ['ipv4']}, rule='type')
+            if not (isinstance(data__ipversion, str) and data__ipversion == 'ipv4' or isinstance(data__ipversion, str) and data__ipversion == 'ipv6' or isinstance(data__ipversion, str) and data__ipversion == 'both'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_version must be one of ['ipv4', 'ipv6', 'both']", value=data__ipversion, name="" + (name_prefix or "data") + ".ip_version", definition={'type': 'string', 'enum': ['ipv4', 'ipv6', 'both'], 'default': 'ipv4', 'description': 'IP version to apply the rule to.', 'examples': ['ipv4']}, rule='enum')
+        else: data["ip_version"] = 'ipv4'
+        if "match_ip_sec" in data_keys:
+            data_keys.remove("match_ip_sec")
+            data__matchipsec = data["match_ip_sec"]
+            if not isinstance(data__matchipsec, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".match_ip_sec must be boolean", value=data__matchipsec, name="" + (name_prefix or "data") + ".match_ip_sec", definition={'type': 'boolean', 'default': False, 'description': 'Match IPSec traffic.', 'examples': [False]}, rule='type')
+        else: data["match_ip_sec"] = False
+        if "match_opposite_protocol" in data_keys:
+            data_keys.remove("match_opposite_protocol")
+            data__matchoppositeprotocol = data["match_opposite_protocol"]
+            if not isinstance(data__matchoppositeprotocol, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".match_opposite_protocol must be boolean", value=data__matchoppositeprotocol, name="" + (name_prefix or "data") + ".match_opposite_protocol", definition={'type': 'boolean', 'default': False, 'description': 'Match opposite protocol.', 'examples': [False]}, rule='type')
+        else: data["match_opposite_protocol"] = False
+        if "schedule" in data_keys:
+            data_keys.remove("schedule")
+            data__schedule = data["schedule"]
+            if not isinstance(data__schedule, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".schedule must be object", value=data__schedule, name="" + (name_prefix or "data") + ".schedule", definition={'type': 'object', 'properties': {'mode': {'type': 'string', 'enum': ['always', 'specific_time', 'disabled']}, 'repeat_on_days': {'type': 'array', 'items': {'type': 'string'}}, 'time_all_day': {'type': 'boolean'}}, 'description': 'Rule schedule configuration (optional).'}, rule='type')
+            data__schedule_is_dict = isinstance(data__schedule, dict)
+            if data__schedule_is_dict:
+                data__schedule_keys = set(data__schedule.keys())
+                if "mode" in data__schedule_keys:
+                    data__schedule_keys.remove("mode")
+                    data__schedule__mode = data__schedule["mode"]
+                    if not isinstance(data__schedule__mode, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".schedule.mode must be string", value=data__schedule__mode, name="" + (name_prefix or "data") + ".schedule.mode", definition={'type': 'string', 'enum': ['always', 'specific_time', 'disabled']}, rule='type')
+                    if not (isinstance(data__schedule__mode, str) and data__schedule__mode == 'always' or isinstance(data__schedule__mode, str) and data__schedule__mode == 'specific_time' or isinstance(data__schedule__mode, str) and data__schedule__mode == 'disabled'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".schedule.mode must be one of ['always', 'specific_time', 'disabled']", value=data__schedule__mode, name="" + (name_prefix or "data") + ".schedule.mode", definition={'type': 'string', 'enum': ['always', 'specific_time', 'disabled']}, rule='enum')
+                if "repeat_on_days" in data__schedule_keys:
+                    data__schedule_keys.remove("repeat_on_days")
+                    data__schedule__repeatondays = data__schedule["repeat_on_days"]
+                    if not isinstance(data__schedule__repeatondays, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".schedule.repeat_on_days must be array", value=data__schedule__repeatondays, name="" + (name_prefix or "data") + ".schedule.repeat_on_days", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__schedule__repeatondays_is_list = isinstance(data__schedule__repeatondays, (list, tuple))
+                    if data__schedule__repeatondays_is_list:
+                        data__schedule__repeatondays_len = len(data__schedule__repeatondays)
+                        for data__schedule__repeatondays_x, data__schedule__repeatondays_item in enumerate(data__schedule__repeatondays):
+                            if not isinstance(data__schedule__repeatondays_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".schedule.repeat_on_days[{data__schedule__repeatondays_x}]".format(**locals()) + " must be string", value=data__schedule__repeatondays_item, name="" + (name_prefix or "data") + ".schedule.repeat_on_days[{data__schedule__repeatondays_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                if "time_all_day" in data__schedule_keys:
+                    data__schedule_keys.remove("time_all_day")
+                    data__schedule__timeallday = data__schedule["time_all_day"]
+                    if not isinstance(data__schedule__timeallday, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".schedule.time_all_day must be boolean", value=data__schedule__timeallday, name="" + (name_prefix or "data") + ".schedule.time_all_day", definition={'type': 'boolean'}, rule='type')
+        if "create_allow_respond" in data_keys:
+            data_keys.remove("create_allow_respond")
+            data__createallowrespond = data["create_allow_respond"]
+            if not isinstance(data__createallowrespond, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".create_allow_respond must be boolean", value=data__createallowrespond, name="" + (name_prefix or "data") + ".create_allow_respond", definition={'type': 'boolean', 'default': False, 'description': 'Whether to create an allow respond rule automatically.', 'examples': [False]}, rule='type')
+        else: data["create_allow_respond"] = False
+    return data
+def validate_firewall_policy_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'ruleset', 'action', 'rule_index'], 'properties': {'name': {'type': 'string', 'description': 'Name of the firewall policy'}, 'ruleset': {'type': 'string', 'description': "The firewall ruleset (e.g., 'WAN_IN', 'LAN_OUT')"}, 'action': {'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Policy action'}, 'rule_index': {'type': 'integer', 'description': 'Rule index/order (lower numbers process first)'}, 'protocol': {'type': 'string', 'enum': ['all', 'tcp', 'udp', 'icmp'], 'default': 'all', 'description': 'Protocol'}, 'src_address': {'type': 'string', 'description': 'Source address or CIDR'}, 'dst_address': {'type': 'string', 'description': 'Destination address or CIDR'}, 'src_port': {'type': 'string', 'description': "Source port or range (e.g., '80' or '80-443')"}, 'dst_port': {'type': 'string', 'description': "Destination port or range (e.g., '80' or '80-443')"}, 'enabled': {'type': 'boolean', 'default': True, 'description': 'Whether the policy is enabled'}, 'description': {'type': 'string', 'description': 'Description of the rule'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name', 'ruleset', 'action', 'rule_index']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'ruleset', 'action', 'rule_index'], 'properties': {'name': {'type': 'string', 'description': 'Name of the firewall policy'}, 'ruleset': {'type': 'string', 'description': "The firewall ruleset (e.g., 'WAN_IN', 'LAN_OUT')"}, 'action': {'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Policy action'}, 'rule_index': {'type': 'integer', 'description': 'Rule index/order (lower numbers process first)'}, 'protocol': {'type': 'string', 'enum': ['all', 'tcp', 'udp', 'icmp'], 'default': 'all', 'description': 'Protocol'}, 'src_address': {'type': 'string', 'description': 'Source address or CIDR'}, 'dst_address': {'type': 'string', 'description': 'Destination address or CIDR'}, 'src_port': {'type': 'string', 'description': "Source port or range (e.g., '80' or '80-443')"}, 'dst_port': {'type': 'string', 'description': "Destination port or range (e.g., '80' or '80-443')"}, 'enabled': {'type': 'boolean', 'default': True, 'description': 'Whether the policy is enabled'}, 'description': {'type': 'string', 'description': 'Description of the rule'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Name of the firewall policy'}, rule='type')
+        if "ruleset" in data_keys:
+            data_keys.remove("ruleset")
+            data__ruleset = data["ruleset"]
+            if not isinstance(data__ruleset, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ruleset must be string", value=data__ruleset, name="" + (name_prefix or "data") + ".ruleset", definition={'type': 'string', 'description': "The firewall ruleset (e.g., 'WAN_IN', 'LAN_OUT')"}, rule='type')
+        if "action" in data_keys:
+            data_keys.remove("action")
+            data__action = data["action"]
+            if not isinstance(data__action, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".action must be string", value=data__action, name="" + (name_prefix or "data") + ".action", definition={'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Policy action'}, rule='type')
+            if not (isinstance(data__action, str) and data__action == 'accept' or isinstance(data__action, str) and data__action == 'drop' or isinstance(data__action, str) and data__action == 'reject'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".action must be one of ['accept', 'drop', 'reject']", value=data__action, name="" + (name_prefix or "data") + ".action", definition={'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Policy action'}, rule='enum')
+        if "rule_index" in data_keys:
+            data_keys.remove("rule_index")
+            data__ruleindex = data["rule_index"]
+            if not isinstance(data__ruleindex, (int)) and not (isinstance(data__ruleindex, float) and data__ruleindex.is_integer()) or isinstance(data__ruleindex, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".rule_index must be integer", value=data__ruleindex, name="" + (name_prefix or "data") + ".rule_index", definition={'type': 'integer', 'description': 'Rule index/order (lower numbers process first)'}, rule='type')
+        if "protocol" in data_keys:
+            data_keys.remove("protocol")
+            data__protocol = data["protocol"]
+            if not isinstance(data__protocol, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".protocol must be string", value=data__protocol, name="" + (name_prefix or "data") + ".protocol", definition={'type': 'string', 'enum': ['all', 'tcp', 'udp', 'icmp'], 'default': 'all', 'description': 'Protocol'}, rule='type')
+            if not (isinstance(data__protocol, str) and data__protocol == 'all' or isinstance(data__protocol, str) and data__protocol == 'tcp' or isinstance(data__protocol, str) and data__protocol == 'udp' or isinstance(data__protocol, str) and data__protocol == 'icmp'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".protocol must be one of ['all', 'tcp', 'udp', 'icmp']", value=data__protocol, name="" + (name_prefix or "data") + ".protocol", definition={'type': 'string', 'enum': ['all', 'tcp', 'udp', 'icmp'], 'default': 'all', 'description': 'Protocol'}, rule='enum')
+        else: data["protocol"] = 'all'
+        if "src_address" in data_keys:
+            data_keys.remove("src_address")
+            data__srcaddress = data["src_address"]
+            if not isinstance(data__srcaddress, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".src_address must be string", value=data__srcaddress, name="" + (name_prefix or "data") + ".src_address", definition={'type': 'string', 'description': 'Source address or CIDR'}, rule='type')
+        if "dst_address" in data_keys:
+            data_keys.remove("dst_address")
+            data__dstaddress = data["dst_address"]
+            if not isinstance(data__dstaddress, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dst_address must be string", value=data__dstaddress, name="" + (name_prefix or "data") + ".dst_address", definition={'type': 'string', 'description': 'Destination address or CIDR'}, rule='type')
+        if "src_port" in data_keys:
+            data_keys.remove("src_port")
+            data__srcport = data["src_port"]
+            if not isinstance(data__srcport, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".src_port must be string", value=data__srcport, name="" + (name_prefix or "data") + ".src_port", definition={'type': 'string', 'description': "Source port or range (e.g., '80' or '80-443')"}, rule='type')
+        if "dst_port" in data_keys:
+            data_keys.remove("dst_port")
+            data__dstport = data["dst_port"]
+            if not isinstance(data__dstport, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dst_port must be string", value=data__dstport, name="" + (name_prefix or "data") + ".dst_port", definition={'type': 'string', 'description': "Destination port or range (e.g., '80' or '80-443')"}, rule='type')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'default': True, 'description': 'Whether the policy is enabled'}, rule='type')
+        else: data["enabled"] = True
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'description': 'Description of the rule'}, rule='type')
+    return data
+def validate_firewall_policy_simple_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'ruleset', 'action', 'src', 'dst'], 'properties': {'name': {'type': 'string', 'description': 'User-friendly name of the policy'}, 'ruleset': {'type': 'string', 'enum': ['WAN_IN', 'WAN_OUT', 'WAN_LOCAL', 'LAN_IN', 'LAN_OUT', 'LAN_LOCAL', 'GUEST_IN', 'GUEST_OUT', 'GUEST_LOCAL', 'VPN_IN', 'VPN_OUT', 'VPN_LOCAL'], 'description': 'Target firewall ruleset'}, 'action': {'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Policy action'}, 'src': {'type': 'object', 'required': ['type', 'value'], 'properties': {'type': {'type': 'string', 'enum': ['zone', 'network', 'client_mac', 'ip_group'], 'description': 'Selector type for source'}, 'value': {'type': 'string', 'description': 'Selector value (name, id, MAC, etc.)'}}}, 'dst': {'type': 'object', 'required': ['type', 'value'], 'properties': {'type': {'type': 'string', 'enum': ['zone', 'network', 'client_mac', 'ip_group'], 'description': 'Selector type for destination'}, 'value': {'type': 'string', 'description': 'Selector value (name, id, MAC, etc.)'}}}, 'index': {'type': 'integer', 'description': 'Priority index (optional)'}, 'enabled': {'type': 'boolean', 'description': 'Enable rule (default true)'}, 'log': {'type': 'boolean', 'description': 'Enable logging (default false)'}, 'protocol': {'type': 'string', 'enum': ['all', 'tcp', 'udp', 'icmp'], 'default': 'all'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name', 'ruleset', 'action', 'src', 'dst']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'ruleset', 'action', 'src', 'dst'], 'properties': {'name': {'type': 'string', 'description': 'User-friendly name of the policy'}, 'ruleset': {'type': 'string', 'enum': ['WAN_IN', 'WAN_OUT', 'WAN_LOCAL', 'LAN_IN', 'LAN_OUT', 'LAN_LOCAL', 'GUEST_IN', 'GUEST_OUT', 'GUEST_LOCAL', 'VPN_IN', 'VPN_OUT', 'VPN_LOCAL'], 'description': 'Target firewall ruleset'}, 'action': {'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Policy action'}, 'src': {'type': 'object', 'required': ['type', 'value'], 'properties': {'type': {'type': 'string', 'enum': ['zone', 'network', 'client_mac', 'ip_group'], 'description': 'Selector type for source'}, 'value': {'type': 'string', 'description': 'Selector value (name, id, MAC, etc.)'}}}, 'dst': {'type': 'object', 'required': ['type', 'value'], 'properties': {'type': {'type': 'string', 'enum': ['zone', 'network', 'client_mac', 'ip_group'], 'description': 'Selector type for destination'}, 'value': {'type': 'string', 'description': 'Selector value (name, id, MAC, etc.)'}}}, 'index': {'type': 'integer', 'description': 'Priority index (optional)'}, 'enabled': {'type': 'boolean', 'description': 'Enable rule (default true)'}, 'log': {'type': 'boolean', 'description': 'Enable logging (default false)'}, 'protocol': {'type': 'string', 'enum': ['all', 'tcp', 'udp', 'icmp'], 'default': 'all'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'User-friendly name of the policy'}, rule='type')
+        if "ruleset" in data_keys:
+            data_keys.remove("ruleset")
+            data__ruleset = data["ruleset"]
+            if not isinstance(data__ruleset, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ruleset must be string", value=data__ruleset, name="" + (name_prefix or "data") + ".ruleset", definition={'type': 'string', 'enum': ['WAN_IN', 'WAN_OUT', 'WAN_LOCAL', 'LAN_IN', 'LAN_OUT', 'LAN_LOCAL', 'GUEST_IN', 'GUEST_OUT', 'GUEST_LOCAL', 'VPN_IN', 'VPN_OUT', 'VPN_LOCAL'], 'description': 'Target firewall ruleset'}, rule='type')
+            if not (isinstance(data__ruleset, str) and data__ruleset == 'WAN_IN' or isinstance(data__ruleset, str) and data__ruleset == 'WAN_OUT' or isinstance(data__ruleset, str) and data__ruleset == 'WAN_LOCAL' or isinstance(data__ruleset, str) and data__ruleset == 'LAN_IN' or isinstance(data__ruleset, str) and data__ruleset == 'LAN_OUT' or isinstance(data__ruleset, str) and data__ruleset == 'LAN_LOCAL' or isinstance(data__ruleset, str) and data__ruleset == 'GUEST_IN' or isinstance(data__ruleset, str) and data__ruleset == 'GUEST_OUT' or isinstance(data__ruleset, str) and data__ruleset == 'GUEST_LOCAL' or isinstance(data__ruleset, str) and data__ruleset == 'VPN_IN' or isinstance(data__ruleset, str) and data__ruleset == 'VPN_OUT' or isinstance(data__ruleset, str) and data__ruleset == 'VPN_LOCAL'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ruleset must be one of ['WAN_IN', 'WAN_OUT', 'WAN_LOCAL', 'LAN_IN', 'LAN_OUT', 'LAN_LOCAL', 'GUEST_IN', 'GUEST_OUT', 'GUEST_LOCAL', 'VPN_IN', 'VPN_OUT', 'VPN_LOCAL']", value=data__ruleset, name="" + (name_prefix or "data") + ".ruleset", definition={'type': 'string', 'enum': ['WAN_IN', 'WAN_OUT', 'WAN_LOCAL', 'LAN_IN', 'LAN_OUT', 'LAN_LOCAL', 'GUEST_IN', 'GUEST_OUT', 'GUEST_LOCAL', 'VPN_IN', 'VPN_OUT', 'VPN_LOCAL'], 'description': 'Target firewall ruleset'}, rule='enum')
+        if "action" in data_keys:
+            data_keys.remove("action")
+            data__action = data["action"]
+            if not isinstance(data__action, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".action must be string", value=data__action, name="" + (name_prefix or "data") + ".action", definition={'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Policy action'}, rule='type')
+            if not (isinstance(data__action, str) and data__action == 'accept' or isinstance(data__action, str) and data__action == 'drop' or isinstance(data__action, str) and data__action == 'reject'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".action must be one of ['accept', 'drop', 'reject']", value=data__action, name="" + (name_prefix or "data") + ".action", definition={'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Policy action'}, rule='enum')
+        if "src" in data_keys:
+            data_keys.remove("src")
+            data__src = data["src"]
+            if not isinstance(data__src, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".src must be object", value=data__src, name="" + (name_prefix or "data") + ".src", definition={'type': 'object', 'required': ['type', 'value'], 'properties': {'type': {'type': 'string', 'enum': ['zone', 'network', 'client_mac', 'ip_group'], 'description': 'Selector type for source'}, 'value': {'type': 'string', 'description': 'Selector value (name, id, MAC, etc.)'}}}, rule='type')
+            data__src_is_dict = isinstance(data__src, dict)
+            if data__src_is_dict:
+                data__src__missing_keys = set(['type', 'value']) - data__src.keys()
+                if data__src__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".src must contain " + (str(sorted(data__src__missing_keys)) + " properties"), value=data__src, name="" + (name_prefix or "data") + ".src", definition={'type': 'object', 'required': ['type', 'value'], 'properties': {'type': {'type': 'string', 'enum': ['zone', 'network', 'client_mac', 'ip_group'], 'description': 'Selector type for source'}, 'value': {'type': 'string', 'description': 'Selector value (name, id, MAC, etc.)'}}}, rule='required')
+                data__src_keys = set(data__src.keys())
+                if "type" in data__src_keys:
+                    data__src_keys.remove("type")
+                    data__src__type = data__src["type"]
+                    if not isinstance(data__src__type, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".src.type must be string", value=data__src__type, name="" + (name_prefix or "data") + ".src.type", definition={'type': 'string', 'enum': ['zone', 'network', 'client_mac', 'ip_group'], 'description': 'Selector type for source'}, rule='type')
+                    if not (isinstance(data__src__type, str) and data__src__type == 'zone' or isinstance(data__src__type, str) and data__src__type == 'network' or isinstance(data__src__type, str) and data__src__type == 'client_mac' or isinstance(data__src__type, str) and data__src__type == 'ip_group'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".src.type must be one of ['zone', 'network', 'client_mac', 'ip_group']", value=data__src__type, name="" + (name_prefix or "data") + ".src.type", definition={'type': 'string', 'enum': ['zone', 'network', 'client_mac', 'ip_group'], 'description': 'Selector type for source'}, rule='enum')
+                if "value" in data__src_keys:
+                    data__src_keys.remove("value")
+                    data__src__value = data__src["value"]
+                    if not isinstance(data__src__value, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".src.value must be string", value=data__src__value, name="" + (name_prefix or "data") + ".src.value", definition={'type': 'string', 'description': 'Selector value (name, id, MAC, etc.)'}, rule='type')
+        if "dst" in data_keys:
+            data_keys.remove("dst")
+            data__dst = data["dst"]
+            if not isinstance(data__dst, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dst must be object", value=data__dst, name="" + (name_prefix or "data") + ".dst", definition={'type': 'object', 'required': ['type', 'value'], 'properties': {'type': {'type': 'string', 'enum': ['zone', 'network', 'client_mac', 'ip_group'], 'description': 'Selector type for destination'}, 'value': {'type': 'string', 'description': 'Selector value (name, id, MAC, etc.)'}}}, rule='type')
+            data__dst_is_dict = isinstance(data__dst, dict)
+            if data__dst_is_dict:
+                data__dst__missing_keys = set(['type', 'value']) - data__dst.keys()
+                if data__dst__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".dst must contain " + (str(sorted(data__dst__missing_keys)) + " properties"), value=data__dst, name="" + (name_prefix or "data") + ".dst", definition={'type': 'object', 'required': ['type', 'value'], 'properties': {'type': {'type': 'string', 'enum': ['zone', 'network', 'client_mac', 'ip_group'], 'description': 'Selector type for destination'}, 'value': {'type': 'string', 'description': 'Selector value (name, id, MAC, etc.)'}}}, rule='required')
+                data__dst_keys = set(data__dst.keys())
+                if "type" in data__dst_keys:
+                    data__dst_keys.remove("type")
+                    data__dst__type = data__dst["type"]
+                    if not isinstance(data__dst__type, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".dst.type must be string", value=data__dst__type, name="" + (name_prefix or "data") + ".dst.type", definition={'type': 'string', 'enum': ['zone', 'network', 'client_mac', 'ip_group'], 'description': 'Selector type for destination'}, rule='type')
+                    if not (isinstance(data__dst__type, str) and data__dst__type == 'zone' or isinstance(data__dst__type, str) and data__dst__type == 'network' or isinstance(data__dst__type, str) and data__dst__type == 'client_mac' or isinstance(data__dst__type, str) and data__dst__type == 'ip_group'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".dst.type must be one of ['zone', 'network', 'client_mac', 'ip_group']", value=data__dst__type, name="" + (name_prefix or "data") + ".dst.type", definition={'type': 'string', 'enum': ['zone', 'network', 'client_mac', 'ip_group'], 'description': 'Selector type for destination'}, rule='enum')
+                if "value" in data__dst_keys:
+                    data__dst_keys.remove("value")
+                    data__dst__value = data__dst["value"]
+                    if not isinstance(data__dst__value, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".dst.value must be string", value=data__dst__value, name="" + (name_prefix or "data") + ".dst.value", definition={'type': 'string', 'description': 'Selector value (name, id, MAC, etc.)'}, rule='type')
+        if "index" in data_keys:
+            data_keys.remove("index")
+            data__index = data["index"]
+            if not isinstance(data__index, (int)) and not (isinstance(data__index, float) and data__index.is_integer()) or isinstance(data__index, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".index must be integer", value=data__index, name="" + (name_prefix or "data") + ".index", definition={'type': 'integer', 'description': 'Priority index (optional)'}, rule='type')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'description': 'Enable rule (default true)'}, rule='type')
+        if "log" in data_keys:
+            data_keys.remove("log")
+            data__log = data["log"]
+            if not isinstance(data__log, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".log must be boolean", value=data__log, name="" + (name_prefix or "data") + ".log", definition={'type': 'boolean', 'description': 'Enable logging (default false)'}, rule='type')
+        if "protocol" in data_keys:
+            data_keys.remove("protocol")
+            data__protocol = data["protocol"]
+            if not isinstance(data__protocol, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".protocol must be string", value=data__protocol, name="" + (name_prefix or "data") + ".protocol", definition={'type': 'string', 'enum': ['all', 'tcp', 'udp', 'icmp'], 'default': 'all'}, rule='type')
+            if not (isinstance(data__protocol, str) and data__protocol == 'all' or isinstance(data__protocol, str) and data__protocol == 'tcp' or isinstance(data__protocol, str) and data__protocol == 'udp' or isinstance(data__protocol, str) and data__protocol == 'icmp'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".protocol must be one of ['all', 'tcp', 'udp', 'icmp']", value=data__protocol, name="" + (name_prefix or "data") + ".protocol", definition={'type': 'string', 'enum': ['all', 'tcp', 'udp', 'icmp'], 'default': 'all'}, rule='enum')
+        else: data["protocol"] = 'all'
+    return data
+def validate_firewall_policy_update_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'name': {'type': 'string', 'description': 'Name of the firewall policy'}, 'ruleset': {'type': 'string', 'description': "The firewall ruleset (e.g., 'WAN_IN', 'LAN_OUT')"}, 'action': {'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Policy action'}, 'rule_index': {'type': 'integer', 'description': 'Rule index/order (lower numbers process first)'}, 'protocol': {'type': 'string', 'enum': ['all', 'tcp', 'udp', 'icmp'], 'description': 'Protocol'}, 'src_address': {'type': 'string', 'description': 'Source address or CIDR'}, 'dst_address': {'type': 'string', 'description': 'Destination address or CIDR'}, 'src_port': {'type': 'string', 'description': "Source port or range (e.g., '80' or '80-443')"}, 'dst_port': {'type': 'string', 'description': "Destination port or range (e.g., '80' or '80-443')"}, 'enabled': {'type': 'boolean', 'description': 'Whether the policy is enabled'}, 'description': {'type': 'string', 'description': 'Description of the rule'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Name of the firewall policy'}, rule='type')
+        if "ruleset" in data_keys:
+            data_keys.remove("ruleset")
+            data__ruleset = data["ruleset"]
+            if not isinstance(data__ruleset, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ruleset must be string", value=data__ruleset, name="" + (name_prefix or "data") + ".ruleset", definition={'type': 'string', 'description': "The firewall ruleset (e.g., 'WAN_IN', 'LAN_OUT')"}, rule='type')
+        if "action" in data_keys:
+            data_keys.remove("action")
+            data__action = data["action"]
+            if not isinstance(data__action, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".action must be string", value=data__action, name="" + (name_prefix or "data") + ".action", definition={'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Policy action'}, rule='type')
+            if not (isinstance(data__action, str) and data__action == 'accept' or isinstance(data__action, str) and data__action == 'drop' or isinstance(data__action, str) and data__action == 'reject'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".action must be one of ['accept', 'drop', 'reject']", value=data__action, name="" + (name_prefix or "data") + ".action", definition={'type': 'string', 'enum': ['accept', 'drop', 'reject'], 'description': 'Policy action'}, rule='enum')
+        if "rule_index" in data_keys:
+            data_keys.remove("rule_index")
+            data__ruleindex = data["rule_index"]
+            if not isinstance(data__ruleindex, (int)) and not (isinstance(data__ruleindex, float) and data__ruleindex.is_integer()) or isinstance(data__ruleindex, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".rule_index must be integer", value=data__ruleindex, name="" + (name_prefix or "data") + ".rule_index", definition={'type': 'integer', 'description': 'Rule index/order (lower numbers process first)'}, rule='type')
+        if "protocol" in data_keys:
+            data_keys.remove("protocol")
+            data__protocol = data["protocol"]
+            if not isinstance(data__protocol, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".protocol must be string", value=data__protocol, name="" + (name_prefix or "data") + ".protocol", definition={'type': 'string', 'enum': ['all', 'tcp', 'udp', 'icmp'], 'description': 'Protocol'}, rule='type')
+            if not (isinstance(data__protocol, str) and data__protocol == 'all' or isinstance(data__protocol, str) and data__protocol == 'tcp' or isinstance(data__protocol, str) and data__protocol == 'udp' or isinstance(data__protocol, str) and data__protocol == 'icmp'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".protocol must be one of ['all', 'tcp', 'udp', 'icmp']", value=data__protocol, name="" + (name_prefix or "data") + ".protocol", definition={'type': 'string', 'enum': ['all', 'tcp', 'udp', 'icmp'], 'description': 'Protocol'}, rule='enum')
+        if "src_address" in data_keys:
+            data_keys.remove("src_address")
+            data__srcaddress = data["src_address"]
+            if not isinstance(data__srcaddress, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".src_address must be string", value=data__srcaddress, name="" + (name_prefix or "data") + ".src_address", definition={'type': 'string', 'description': 'Source address or CIDR'}, rule='type')
+        if "dst_address" in data_keys:
+            data_keys.remove("dst_address")
+            data__dstaddress = data["dst_address"]
+            if not isinstance(data__dstaddress, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dst_address must be string", value=data__dstaddress, name="" + (name_prefix or "data") + ".dst_address", definition={'type': 'string', 'description': 'Destination address or CIDR'}, rule='type')
+        if "src_port" in data_keys:
+            data_keys.remove("src_port")
+            data__srcport = data["src_port"]
+            if not isinstance(data__srcport, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".src_port must be string", value=data__srcport, name="" + (name_prefix or "data") + ".src_port", definition={'type': 'string', 'description': "Source port or range (e.g., '80' or '80-443')"}, rule='type')
+        if "dst_port" in data_keys:
+            data_keys.remove("dst_port")
+            data__dstport = data["dst_port"]
+            if not isinstance(data__dstport, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dst_port must be string", value=data__dstport, name="" + (name_prefix or "data") + ".dst_port", definition={'type': 'string', 'description': "Destination port or range (e.g., '80' or '80-443')"}, rule='type')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'description': 'Whether the policy is enabled'}, rule='type')
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'description': 'Description of the rule'}, rule='type')
+    return data
+def validate_network_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'purpose'], 'properties': {'name': {'type': 'string', 'description': 'Network name'}, 'purpose': {'type': 'string', 'enum': ['corporate', 'guest', 'wan', 'vlan-only'], 'description': 'Network purpose/type'}, 'vlan_enabled': {'type': 'boolean', 'default': False, 'description': 'Whether VLAN is enabled'}, 'vlan': {'type': 'string', 'description': 'VLAN ID (if VLAN is enabled)'}, 'ip_subnet': {'type': 'string', 'description': "IP subnet in CIDR notation (e.g., '192.168.1.0/24')"}, 'dhcp_enabled': {'type': 'boolean', 'default': True, 'description': 'Whether DHCP is enabled'}, 'dhcp_start': {'type': 'string', 'description': 'Start of DHCP range'}, 'dhcp_stop': {'type': 'string', 'description': 'End of DHCP range'}, 'enabled': {'type': 'boolean', 'default': True, 'description': 'Whether the network is enabled'}}, 'allOf': [{'if': {'properties': {'vlan_enabled': {'enum': [True]}}}, 'then': {'required': ['vlan']}}]}, rule='type')
+    try:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data_keys = set(data.keys())
+            if "vlan_enabled" in data_keys:
+                data_keys.remove("vlan_enabled")
+                data__vlanenabled = data["vlan_enabled"]
+                if not (isinstance(data__vlanenabled, bool) and data__vlanenabled is True):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".vlan_enabled must be one of [True]", value=data__vlanenabled, name="" + (name_prefix or "data") + ".vlan_enabled", definition={'enum': [True]}, rule='enum')
+    except (JsonSchemaValueException, JsonSchemaValuesException):
+        pass
+    else:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['vlan']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'required': ['vlan']}, rule='required')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name', 'purpose']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'purpose'], 'properties': {'name': {'type': 'string', 'description': 'Network name'}, 'purpose': {'type': 'string', 'enum': ['corporate', 'guest', 'wan', 'vlan-only'], 'description': 'Network purpose/type'}, 'vlan_enabled': {'type': 'boolean', 'default': False, 'description': 'Whether VLAN is enabled'}, 'vlan': {'type': 'string', 'description': 'VLAN ID (if VLAN is enabled)'}, 'ip_subnet': {'type': 'string', 'description': "IP subnet in CIDR notation (e.g., '192.168.1.0/24')"}, 'dhcp_enabled': {'type': 'boolean', 'default': True, 'description': 'Whether DHCP is enabled'}, 'dhcp_start': {'type': 'string', 'description': 'Start of DHCP range'}, 'dhcp_stop': {'type': 'string', 'description': 'End of DHCP range'}, 'enabled': {'type': 'boolean', 'default': True, 'description': 'Whether the network is enabled'}}, 'allOf': [{'if': {'properties': {'vlan_enabled': {'enum': [True]}}}, 'then': {'required': ['vlan']}}]}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Network name'}, rule='type')
+        if "purpose" in data_keys:
+            data_keys.remove("purpose")
+            data__purpose = data["purpose"]
+            if not isinstance(data__purpose, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".purpose must be string", value=data__purpose, name="" + (name_prefix or "data") + ".purpose", definition={'type': 'string', 'enum': ['corporate', 'guest', 'wan', 'vlan-only'], 'description': 'Network purpose/type'}, rule='type')
+            if not (isinstance(data__purpose, str) and data__purpose == 'corporate' or isinstance(data__purpose, str) and data__purpose == 'guest' or isinstance(data__purpose, str) and data__purpose == 'wan' or isinstance(data__purpose, str) and data__purpose == 'vlan-only'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".purpose must be one of ['corporate', 'guest', 'wan', 'vlan-only']", value=data__purpose, name="" + (name_prefix or "data") + ".purpose", definition={'type': 'string', 'enum': ['corporate', 'guest', 'wan', 'vlan-only'], 'description': 'Network purpose/type'}, rule='enum')
+        if "vlan_enabled" in data_keys:
+            data_keys.remove("vlan_enabled")
+            data__vlanenabled = data["vlan_enabled"]
+            if not isinstance(data__vlanenabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".vlan_enabled must be boolean", value=data__vlanenabled, name="" + (name_prefix or "data") + ".vlan_enabled", definition={'type': 'boolean', 'default': False, 'description': 'Whether VLAN is enabled'}, rule='type')
+        else: data["vlan_enabled"] = False
+        if "vlan" in data_keys:
+            data_keys.remove("vlan")
+            data__vlan = data["vlan"]
+            if not isinstance(data__vlan, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".vlan must be string", value=data__vlan, name="" + (name_prefix or "data") + ".vlan", definition={'type': 'string', 'description': 'VLAN ID (if VLAN is enabled)'}, rule='type')
+        if "ip_subnet" in data_keys:
+            data_keys.remove("ip_subnet")
+            data__ipsubnet = data["ip_subnet"]
+            if not isinstance(data__ipsubnet, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_subnet must be string", value=data__ipsubnet, name="" + (name_prefix or "data") + ".ip_subnet", definition={'type': 'string', 'description': "IP subnet in CIDR notation (e.g., '192.168.1.0/24')"}, rule='type')
+        if "dhcp_enabled" in data_keys:
+            data_keys.remove("dhcp_enabled")
+            data__dhcpenabled = data["dhcp_enabled"]
+            if not isinstance(data__dhcpenabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dhcp_enabled must be boolean", value=data__dhcpenabled, name="" + (name_prefix or "data") + ".dhcp_enabled", definition={'type': 'boolean', 'default': True, 'description': 'Whether DHCP is enabled'}, rule='type')
+        else: data["dhcp_enabled"] = True
+        if "dhcp_start" in data_keys:
+            data_keys.remove("dhcp_start")
+            data__dhcpstart = data["dhcp_start"]
+            if not isinstance(data__dhcpstart, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dhcp_start must be string", value=data__dhcpstart, name="" + (name_prefix or "data") + ".dhcp_start", definition={'type': 'string', 'description': 'Start of DHCP range'}, rule='type')
+        if "dhcp_stop" in data_keys:
+            data_keys.remove("dhcp_stop")
+            data__dhcpstop = data["dhcp_stop"]
+            if not isinstance(data__dhcpstop, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dhcp_stop must be string", value=data__dhcpstop, name="" + (name_prefix or "data") + ".dhcp_stop", definition={'type': 'string', 'description': 'End of DHCP range'}, rule='type')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'default': True, 'description': 'Whether the network is enabled'}, rule='type')
+        else: data["enabled"] = True
+    return data
+def validate_network_update_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'name': {'type': 'string', 'description': 'Network name'}, 'purpose': {'type': 'string', 'enum': ['corporate', 'guest', 'wan', 'vlan-only'], 'description': 'Network purpose/type'}, 'vlan_enabled': {'type': 'boolean', 'description': 'Whether VLAN is enabled'}, 'vlan': {'type': 'string', 'description': 'VLAN ID (if VLAN is enabled)'}, 'ip_subnet': {'type': 'string', 'description': "IP subnet in CIDR notation (e.g., '192.168.1.0/24')"}, 'dhcp_enabled': {'type': 'boolean', 'description': 'Whether DHCP is enabled'}, 'dhcp_start': {'type': 'string', 'description': 'Start of DHCP range'}, 'dhcp_stop': {'type': 'string', 'description': 'End of DHCP range'}, 'enabled': {'type': 'boolean', 'description': 'Whether the network is enabled'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Network name'}, rule='type')
+        if "purpose" in data_keys:
+            data_keys.remove("purpose")
+            data__purpose = data["purpose"]
+            if not isinstance(data__purpose, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".purpose must be string", value=data__purpose, name="" + (name_prefix or "data") + ".purpose", definition={'type': 'string', 'enum': ['corporate', 'guest', 'wan', 'vlan-only'], 'description': 'Network purpose/type'}, rule='type')
+            if not (isinstance(data__purpose, str) and data__purpose == 'corporate' or isinstance(data__purpose, str) and data__purpose == 'guest' or isinstance(data__purpose, str) and data__purpose == 'wan' or isinstance(data__purpose, str) and data__purpose == 'vlan-only'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".purpose must be one of ['corporate', 'guest', 'wan', 'vlan-only']", value=data__purpose, name="" + (name_prefix or "data") + ".purpose", definition={'type': 'string', 'enum': ['corporate', 'guest', 'wan', 'vlan-only'], 'description': 'Network purpose/type'}, rule='enum')
+        if "vlan_enabled" in data_keys:
+            data_keys.remove("vlan_enabled")
+            data__vlanenabled = data["vlan_enabled"]
+            if not isinstance(data__vlanenabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".vlan_enabled must be boolean", value=data__vlanenabled, name="" + (name_prefix or "data") + ".vlan_enabled", definition={'type': 'boolean', 'description': 'Whether VLAN is enabled'}, rule='type')
+        if "vlan" in data_keys:
+            data_keys.remove("vlan")
+            data__vlan = data["vlan"]
+            if not isinstance(data__vlan, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".vlan must be string", value=data__vlan, name="" + (name_prefix or "data") + ".vlan", definition={'type': 'string', 'description': 'VLAN ID (if VLAN is enabled)'}, rule='type')
+        if "ip_subnet" in data_keys:
+            data_keys.remove("ip_subnet")
+            data__ipsubnet = data["ip_subnet"]
+            if not isinstance(data__ipsubnet, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_subnet must be string", value=data__ipsubnet, name="" + (name_prefix or "data") + ".ip_subnet", definition={'type': 'string', 'description': "IP subnet in CIDR notation (e.g., '192.168.1.0/24')"}, rule='type')
+        if "dhcp_enabled" in data_keys:
+            data_keys.remove("dhcp_enabled")
+            data__dhcpenabled = data["dhcp_enabled"]
+            if not isinstance(data__dhcpenabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dhcp_enabled must be boolean", value=data__dhcpenabled, name="" + (name_prefix or "data") + ".dhcp_enabled", definition={'type': 'boolean', 'description': 'Whether DHCP is enabled'}, rule='type')
+        if "dhcp_start" in data_keys:
+            data_keys.remove("dhcp_start")
+            data__dhcpstart = data["dhcp_start"]
+            if not isinstance(data__dhcpstart, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dhcp_start must be string", value=data__dhcpstart, name="" + (name_prefix or "data") + ".dhcp_start", definition={'type': 'string', 'description': 'Start of DHCP range'}, rule='type')
+        if "dhcp_stop" in data_keys:
+            data_keys.remove("dhcp_stop")
+            data__dhcpstop = data["dhcp_stop"]
+            if not isinstance(data__dhcpstop, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dhcp_stop must be string", value=data__dhcpstop, name="" + (name_prefix or "data") + ".dhcp_stop", definition={'type': 'string', 'description': 'End of DHCP range'}, rule='type')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'description': 'Whether the network is enabled'}, rule='type')
+    return data
+def validate_port_forward_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'dst_port', 'fwd_port', 'fwd_ip'], 'properties': {'name': {'type': 'string', 'description': 'Descriptive name for the port forwarding rule'}, 'dst_port': {'type': 'string', 'description': 'Destination port (external port)'}, 'fwd_port': {'type': 'string', 'description': 'Port to forward to (internal port)'}, 'fwd_ip': {'type': 'string', 'description': 'IP address to forward to'}, 'protocol': {'type': 'string', 'enum': ['tcp', 'udp', 'tcp_udp'], 'default': 'tcp_udp', 'description': 'Network protocol'}, 'enabled': {'type': 'boolean', 'default': True, 'description': 'Whether rule is initially enabled'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name', 'dst_port', 'fwd_port', 'fwd_ip']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'dst_port', 'fwd_port', 'fwd_ip'], 'properties': {'name': {'type': 'string', 'description': 'Descriptive name for the port forwarding rule'}, 'dst_port': {'type': 'string', 'description': 'Destination port (external port)'}, 'fwd_port': {'type': 'string', 'description': 'Port to forward to (internal port)'}, 'fwd_ip': {'type': 'string', 'description': 'IP address to forward to'}, 'protocol': {'type': 'string', 'enum': ['tcp', 'udp', 'tcp_udp'], 'default': 'tcp_udp', 'description': 'Network protocol'}, 'enabled': {'type': 'boolean', 'default': True, 'description': 'Whether rule is initially enabled'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Descriptive name for the port forwarding rule'}, rule='type')
+        if "dst_port" in data_keys:
+            data_keys.remove("dst_port")
+            data__dstport = data["dst_port"]
+            if not isinstance(data__dstport, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dst_port must be string", value=data__dstport, name="" + (name_prefix or "data") + ".dst_port", definition={'type': 'string', 'description': 'Destination port (external port)'}, rule='type')
+        if "fwd_port" in data_keys:
+            data_keys.remove("fwd_port")
+            data__fwdport = data["fwd_port"]
+            if not isinstance(data__fwdport, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fwd_port must be string", value=data__fwdport, name="" + (name_prefix or "data") + ".fwd_port", definition={'type': 'string', 'description': 'Port to forward to (internal port)'}, rule='type')
+        if "fwd_ip" in data_keys:
+            data_keys.remove("fwd_ip")
+            data__fwdip = data["fwd_ip"]
+            if not isinstance(data__fwdip, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fwd_ip must be string", value=data__fwdip, name="" + (name_prefix or "data") + ".fwd_ip", definition={'type': 'string', 'description': 'IP address to forward to'}, rule='type')
+        if "protocol" in data_keys:
+            data_keys.remove("protocol")
+            data__protocol = data["protocol"]
+            if not isinstance(data__protocol, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".protocol must be string", value=data__protocol, name="" + (name_prefix or "data") + ".protocol", definition={'type': 'string', 'enum': ['tcp', 'udp', 'tcp_udp'], 'default': 'tcp_udp', 'description': 'Network protocol'}, rule='type')
+            if not (isinstance(data__protocol, str) and data__protocol == 'tcp' or isinstance(data__protocol, str) and data__protocol == 'udp' or isinstance(data__protocol, str) and data__protocol == 'tcp_udp'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".protocol must be one of ['tcp', 'udp', 'tcp_udp']", value=data__protocol, name="" + (name_prefix or "data") + ".protocol", definition={'type': 'string', 'enum': ['tcp', 'udp', 'tcp_udp'], 'default': 'tcp_udp', 'description': 'Network protocol'}, rule='enum')
+        else: data["protocol"] = 'tcp_udp'
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'default': True, 'description': 'Whether rule is initially enabled'}, rule='type')
+        else: data["enabled"] = True
+    return data
+def validate_port_forward_simple_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'ext_port', 'to_ip'], 'properties': {'name': {'type': 'string', 'description': 'User-friendly name of the port forward rule'}, 'ext_port': {'type': 'string', 'description': "External (destination) port or range, e.g. '80' or '10000-10010'"}, 'to_ip': {'type': 'string', 'description': 'Internal IP address to forward traffic to'}, 'int_port': {'type': 'string', 'description': 'Internal port to forward to (defaults to ext_port if omitted)'}, 'protocol': {'type': 'string', 'enum': ['tcp', 'udp', 'both'], 'description': 'Protocol to match (default both)'}, 'enabled': {'type': 'boolean', 'description': 'Enable rule (default true)'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name', 'ext_port', 'to_ip']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'ext_port', 'to_ip'], 'properties': {'name': {'type': 'string', 'description': 'User-friendly name of the port forward rule'}, 'ext_port': {'type': 'string', 'description': "External (destination) port or range, e.g. '80' or '10000-10010'"}, 'to_ip': {'type': 'string', 'description': 'Internal IP address to forward traffic to'}, 'int_port': {'type': 'string', 'description': 'Internal port to forward to (defaults to ext_port if omitted)'}, 'protocol': {'type': 'string', 'enum': ['tcp', 'udp', 'both'], 'description': 'Protocol to match (default both)'}, 'enabled': {'type': 'boolean', 'description': 'Enable rule (default true)'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'User-friendly name of the port forward rule'}, rule='type')
+        if "ext_port" in data_keys:
+            data_keys.remove("ext_port")
+            data__extport = data["ext_port"]
+            if not isinstance(data__extport, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ext_port must be string", value=data__extport, name="" + (name_prefix or "data") + ".ext_port", definition={'type': 'string', 'description': "External (destination) port or range, e.g. '80' or '10000-10010'"}, rule='type')
+        if "to_ip" in data_keys:
+            data_keys.remove("to_ip")
+            data__toip = data["to_ip"]
+            if not isinstance(data__toip, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".to_ip must be string", value=data__toip, name="" + (name_prefix or "data") + ".to_ip", definition={'type': 'string', 'description': 'Internal IP address to forward traffic to'}, rule='type')
+        if "int_port" in data_keys:
+            data_keys.remove("int_port")
+            data__intport = data["int_port"]
+            if not isinstance(data__intport, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".int_port must be string", value=data__intport, name="" + (name_prefix or "data") + ".int_port", definition={'type': 'string', 'description': 'Internal port to forward to (defaults to ext_port if omitted)'}, rule='type')
+        if "protocol" in data_keys:
+            data_keys.remove("protocol")
+            data__protocol = data["protocol"]
+            if not isinstance(data__protocol, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".protocol must be string", value=data__protocol, name="" + (name_prefix or "data") + ".protocol", definition={'type': 'string', 'enum': ['tcp', 'udp', 'both'], 'description': 'Protocol to match (default both)'}, rule='type')
+            if not (isinstance(data__protocol, str) and data__protocol == 'tcp' or isinstance(data__protocol, str) and data__protocol == 'udp' or isinstance(data__protocol, str) and data__protocol == 'both'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".protocol must be one of ['tcp', 'udp', 'both']", value=data__protocol, name="" + (name_prefix or "data") + ".protocol", definition={'type': 'string', 'enum': ['tcp', 'udp', 'both'], 'description': 'Protocol to match (default both)'}, rule='enum')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'description': 'Enable rule (default true)'}, rule='type')
+    return data
+def validate_port_forward_update_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'name': {'type': 'string', 'description': 'Descriptive name for the port forwarding rule'}, 'dst_port': {'type': 'string', 'description': 'Destination port (external port)'}, 'fwd_port': {'type': 'string', 'description': 'Port to forward to (internal port)'}, 'fwd_ip': {'type': 'string', 'description': 'IP address to forward to'}, 'protocol': {'type': 'string', 'enum': ['tcp', 'udp', 'tcp_udp'], 'description': 'Network protocol'}, 'enabled': {'type': 'boolean', 'description': 'Whether rule is initially enabled'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Descriptive name for the port forwarding rule'}, rule='type')
+        if "dst_port" in data_keys:
+            data_keys.remove("dst_port")
+            data__dstport = data["dst_port"]
+            if not isinstance(data__dstport, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dst_port must be string", value=data__dstport, name="" + (name_prefix or "data") + ".dst_port", definition={'type': 'string', 'description': 'Destination port (external port)'}, rule='type')
+        if "fwd_port" in data_keys:
+            data_keys.remove("fwd_port")
+            data__fwdport = data["fwd_port"]
+            if not isinstance(data__fwdport, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fwd_port must be string", value=data__fwdport, name="" + (name_prefix or "data") + ".fwd_port", definition={'type': 'string', 'description': 'Port to forward to (internal port)'}, rule='type')
+        if "fwd_ip" in data_keys:
+            data_keys.remove("fwd_ip")
+            data__fwdip = data["fwd_ip"]
+            if not isinstance(data__fwdip, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".fwd_ip must be string", value=data__fwdip, name="" + (name_prefix or "data") + ".fwd_ip", definition={'type': 'string', 'description': 'IP address to forward to'}, rule='type')
+        if "protocol" in data_keys:
+            data_keys.remove("protocol")
+            data__protocol = data["protocol"]
+            if not isinstance(data__protocol, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".protocol must be string", value=data__protocol, name="" + (name_prefix or "data") + ".protocol", definition={'type': 'string', 'enum': ['tcp', 'udp', 'tcp_udp'], 'description': 'Network protocol'}, rule='type')
+            if not (isinstance(data__protocol, str) and data__protocol == 'tcp' or isinstance(data__protocol, str) and data__protocol == 'udp' or isinstance(data__protocol, str) and data__protocol == 'tcp_udp'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".protocol must be one of ['tcp', 'udp', 'tcp_udp']", value=data__protocol, name="" + (name_prefix or "data") + ".protocol", definition={'type': 'string', 'enum': ['tcp', 'udp', 'tcp_udp'], 'description': 'Network protocol'}, rule='enum')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'description': 'Whether rule is initially enabled'}, rule='type')
+    return data
+def validate_qos_rule_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'interface', 'direction', 'bandwidth_limit_kbps'], 'properties': {'name': {'type': 'string', 'description': 'Descriptive name for the QoS rule'}, 'interface': {'type': 'string', 'description': "Network interface the rule applies to (e.g., 'WAN', 'LAN')"}, 'direction': {'type': 'string', 'enum': ['upload', 'download'], 'description': 'Direction of traffic affected'}, 'bandwidth_limit_kbps': {'type': 'integer', 'description': 'Bandwidth limit in Kilobits per second'}, 'target_ip_address': {'type': 'string', 'description': 'Specific IP address to target'}, 'target_subnet': {'type': 'string', 'description': 'Subnet (CIDR notation) to target'}, 'dscp_value': {'type': 'integer', 'description': 'DSCP value to match/set (0-63)', 'minimum': 0, 'maximum': 63}, 'enabled': {'type': 'boolean', 'default': True, 'description': 'Whether the rule is enabled'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name', 'interface', 'direction', 'bandwidth_limit_kbps']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'interface', 'direction', 'bandwidth_limit_kbps'], 'properties': {'name': {'type': 'string', 'description': 'Descriptive name for the QoS rule'}, 'interface': {'type': 'string', 'description': "Network interface the rule applies to (e.g., 'WAN', 'LAN')"}, 'direction': {'type': 'string', 'enum': ['upload', 'download'], 'description': 'Direction of traffic affected'}, 'bandwidth_limit_kbps': {'type': 'integer', 'description': 'Bandwidth limit in Kilobits per second'}, 'target_ip_address': {'type': 'string', 'description': 'Specific IP address to target'}, 'target_subnet': {'type': 'string', 'description': 'Subnet (CIDR notation) to target'}, 'dscp_value': {'type': 'integer', 'description': 'DSCP value to match/set (0-63)', 'minimum': 0, 'maximum': 63}, 'enabled': {'type': 'boolean', 'default': True, 'description': 'Whether the rule is enabled'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Descriptive name for the QoS rule'}, rule='type')
+        if "interface" in data_keys:
+            data_keys.remove("interface")
+            data__interface = data["interface"]
+            if not isinstance(data__interface, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".interface must be string", value=data__interface, name="" + (name_prefix or "data") + ".interface", definition={'type': 'string', 'description': "Network interface the rule applies to (e.g., 'WAN', 'LAN')"}, rule='type')
+        if "direction" in data_keys:
+            data_keys.remove("direction")
+            data__direction = data["direction"]
+            if not isinstance(data__direction, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".direction must be string", value=data__direction, name="" + (name_prefix or "data") + ".direction", definition={'type': 'string', 'enum': ['upload', 'download'], 'description': 'Direction of traffic affected'}, rule='type')
+            if not (isinstance(data__direction, str) and data__direction == 'upload' or isinstance(data__direction, str) and data__direction == 'download'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".direction must be one of ['upload', 'download']", value=data__direction, name="" + (name_prefix or "data") + ".direction", definition={'type': 'string', 'enum': ['upload', 'download'], 'description': 'Direction of traffic affected'}, rule='enum')
+        if "bandwidth_limit_kbps" in data_keys:
+            data_keys.remove("bandwidth_limit_kbps")
+            data__bandwidthlimitkbps = data["bandwidth_limit_kbps"]
+            if not isinstance(data__bandwidthlimitkbps, (int)) and not (isinstance(data__bandwidthlimitkbps, float) and data__bandwidthlimitkbps.is_integer()) or isinstance(data__bandwidthlimitkbps, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".bandwidth_limit_kbps must be integer", value=data__bandwidthlimitkbps, name="" + (name_prefix or "data") + ".bandwidth_limit_kbps", definition={'type': 'integer', 'description': 'Bandwidth limit in Kilobits per second'}, rule='type')
+        if "target_ip_address" in data_keys:
+            data_keys.remove("target_ip_address")
+            data__targetipaddress = data["target_ip_address"]
+            if not isinstance(data__targetipaddress, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_ip_address must be string", value=data__targetipaddress, name="" + (name_prefix or "data") + ".target_ip_address", definition={'type': 'string', 'description': 'Specific IP address to target'}, rule='type')
+        if "target_subnet" in data_keys:
+            data_keys.remove("target_subnet")
+            data__targetsubnet = data["target_subnet"]
+            if not isinstance(data__targetsubnet, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_subnet must be string", value=data__targetsubnet, name="" + (name_prefix or "data") + ".target_subnet", definition={'type': 'string', 'description': 'Subnet (CIDR notation) to target'}, rule='type')
+        if "dscp_value" in data_keys:
+            data_keys.remove("dscp_value")
+            data__dscpvalue = data["dscp_value"]
+            if not isinstance(data__dscpvalue, (int)) and not (isinstance(data__dscpvalue, float) and data__dscpvalue.is_integer()) or isinstance(data__dscpvalue, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dscp_value must be integer", value=data__dscpvalue, name="" + (name_prefix or "data") + ".dscp_value", definition={'type': 'integer', 'description': 'DSCP value to match/set (0-63)', 'minimum': 0, 'maximum': 63}, rule='type')
+            if isinstance(data__dscpvalue, (int, float, Decimal)):
+                if data__dscpvalue < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".dscp_value must be bigger than or equal to 0", value=data__dscpvalue, name="" + (name_prefix or "data") + ".dscp_value", definition={'type': 'integer', 'description': 'DSCP value to match/set (0-63)', 'minimum': 0, 'maximum': 63}, rule='minimum')
+                if data__dscpvalue > 63:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".dscp_value must be smaller than or equal to 63", value=data__dscpvalue, name="" + (name_prefix or "data") + ".dscp_value", definition={'type': 'integer', 'description': 'DSCP value to match/set (0-63)', 'minimum': 0, 'maximum': 63}, rule='maximum')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'default': True, 'description': 'Whether the rule is enabled'}, rule='type')
+        else: data["enabled"] = True
+    return data
+def validate_qos_rule_simple_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'interface', 'direction', 'limit_kbps'], 'properties': {'name': {'type': 'string', 'description': 'User-friendly name of the QoS rule'}, 'interface': {'type': 'string', 'description': "Target interface (e.g., 'wan', 'lan', 'wan2') – case-insensitive, accepted as displayed in UniFi UI."}, 'direction': {'type': 'string', 'enum': ['upload', 'download'], 'description': 'Traffic direction affected'}, 'limit_kbps': {'type': 'integer', 'minimum': 1, 'description': 'Bandwidth limit in kilobits per second (Kbps)'}, 'enabled': {'type': 'boolean', 'description': 'Enable rule (default true)'}, 'dscp_value': {'type': 'integer', 'minimum': 0, 'maximum': 63, 'description': 'Optional DSCP value tag (0-63)'}, 'target': {'type': 'object', 'required': ['type', 'value'], 'description': 'Optional traffic selector. If omitted the rule applies to all clients on the interface.', 'properties': {'type': {'type': 'string', 'enum': ['ip', 'subnet'], 'description': 'Selector kind: single IP address or subnet CIDR'}, 'value': {'type': 'string', 'description': "Selector value (e.g., '192.168.1.50' or '192.168.1.0/24')"}}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name', 'interface', 'direction', 'limit_kbps']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'interface', 'direction', 'limit_kbps'], 'properties': {'name': {'type': 'string', 'description': 'User-friendly name of the QoS rule'}, 'interface': {'type': 'string', 'description': "Target interface (e.g., 'wan', 'lan', 'wan2') – case-insensitive, accepted as displayed in UniFi UI."}, 'direction': {'type': 'string', 'enum': ['upload', 'download'], 'description': 'Traffic direction affected'}, 'limit_kbps': {'type': 'integer', 'minimum': 1, 'description': 'Bandwidth limit in kilobits per second (Kbps)'}, 'enabled': {'type': 'boolean', 'description': 'Enable rule (default true)'}, 'dscp_value': {'type': 'integer', 'minimum': 0, 'maximum': 63, 'description': 'Optional DSCP value tag (0-63)'}, 'target': {'type': 'object', 'required': ['type', 'value'], 'description': 'Optional traffic selector. If omitted the rule applies to all clients on the interface.', 'properties': {'type': {'type': 'string', 'enum': ['ip', 'subnet'], 'description': 'Selector kind: single IP address or subnet CIDR'}, 'value': {'type': 'string', 'description': "Selector value (e.g., '192.168.1.50' or '192.168.1.0/24')"}}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'User-friendly name of the QoS rule'}, rule='type')
+        if "interface" in data_keys:
+            data_keys.remove("interface")
+            data__interface = data["interface"]
+            if not isinstance(data__interface, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".interface must be string", value=data__interface, name="" + (name_prefix or "data") + ".interface", definition={'type': 'string', 'description': "Target interface (e.g., 'wan', 'lan', 'wan2') – case-insensitive, accepted as displayed in UniFi UI."}, rule='type')
+        if "direction" in data_keys:
+            data_keys.remove("direction")
+            data__direction = data["direction"]
+            if not isinstance(data__direction, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".direction must be string", value=data__direction, name="" + (name_prefix or "data") + ".direction", definition={'type': 'string', 'enum': ['upload', 'download'], 'description': 'Traffic direction affected'}, rule='type')
+            if not (isinstance(data__direction, str) and data__direction == 'upload' or isinstance(data__direction, str) and data__direction == 'download'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".direction must be one of ['upload', 'download']", value=data__direction, name="" + (name_prefix or "data") + ".direction", definition={'type': 'string', 'enum': ['upload', 'download'], 'description': 'Traffic direction affected'}, rule='enum')
+        if "limit_kbps" in data_keys:
+            data_keys.remove("limit_kbps")
+            data__limitkbps = data["limit_kbps"]
+            if not isinstance(data__limitkbps, (int)) and not (isinstance(data__limitkbps, float) and data__limitkbps.is_integer()) or isinstance(data__limitkbps, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".limit_kbps must be integer", value=data__limitkbps, name="" + (name_prefix or "data") + ".limit_kbps", definition={'type': 'integer', 'minimum': 1, 'description': 'Bandwidth limit in kilobits per second (Kbps)'}, rule='type')
+            if isinstance(data__limitkbps, (int, float, Decimal)):
+                if data__limitkbps < 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".limit_kbps must be bigger than or equal to 1", value=data__limitkbps, name="" + (name_prefix or "data") + ".limit_kbps", definition={'type': 'integer', 'minimum': 1, 'description': 'Bandwidth limit in kilobits per second (Kbps)'}, rule='minimum')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'description': 'Enable rule (default true)'}, rule='type')
+        if "dscp_value" in data_keys:
+            data_keys.remove("dscp_value")
+            data__dscpvalue = data["dscp_value"]
+            if not isinstance(data__dscpvalue, (int)) and not (isinstance(data__dscpvalue, float) and data__dscpvalue.is_integer()) or isinstance(data__dscpvalue, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dscp_value must be integer", value=data__dscpvalue, name="" + (name_prefix or "data") + ".dscp_value", definition={'type': 'integer', 'minimum': 0, 'maximum': 63, 'description': 'Optional DSCP value tag (0-63)'}, rule='type')
+            if isinstance(data__dscpvalue, (int, float, Decimal)):
+                if data__dscpvalue < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".dscp_value must be bigger than or equal to 0", value=data__dscpvalue, name="" + (name_prefix or "data") + ".dscp_value", definition={'type': 'integer', 'minimum': 0, 'maximum': 63, 'description': 'Optional DSCP value tag (0-63)'}, rule='minimum')
+                if data__dscpvalue > 63:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".dscp_value must be smaller than or equal to 63", value=data__dscpvalue, name="" + (name_prefix or "data") + ".dscp_value", definition={'type': 'integer', 'minimum': 0, 'maximum': 63, 'description': 'Optional DSCP value tag (0-63)'}, rule='maximum')
+        if "target" in data_keys:
+            data_keys.remove("target")
+            data__target = data["target"]
+            if not isinstance(data__target, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target must be object", value=data__target, name="" + (name_prefix or "data") + ".target", definition={'type': 'object', 'required': ['type', 'value'], 'description': 'Optional traffic selector. If omitted the rule applies to all clients on the interface.', 'properties': {'type': {'type': 'string', 'enum': ['ip', 'subnet'], 'description': 'Selector kind: single IP address or subnet CIDR'}, 'value': {'type': 'string', 'description': "Selector value (e.g., '192.168.1.50' or '192.168.1.0/24')"}}}, rule='type')
+            data__target_is_dict = isinstance(data__target, dict)
+            if data__target_is_dict:
+                data__target__missing_keys = set(['type', 'value']) - data__target.keys()
+                if data__target__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".target must contain " + (str(sorted(data__target__missing_keys)) + " properties"), value=data__target, name="" + (name_prefix or "data") + ".target", definition={'type': 'object', 'required': ['type', 'value'], 'description': 'Optional traffic selector. If omitted the rule applies to all clients on the interface.', 'properties': {'type': {'type': 'string', 'enum': ['ip', 'subnet'], 'description': 'Selector kind: single IP address or subnet CIDR'}, 'value': {'type': 'string', 'description': "Selector value (e.g., '192.168.1.50' or '192.168.1.0/24')"}}}, rule='required')
+                data__target_keys = set(data__target.keys())
+                if "type" in data__target_keys:
+                    data__target_keys.remove("type")
+                    data__target__type = data__target["type"]
+                    if not isinstance(data__target__type, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".target.type must be string", value=data__target__type, name="" + (name_prefix or "data") + ".target.type", definition={'type': 'string', 'enum': ['ip', 'subnet'], 'description': 'Selector kind: single IP address or subnet CIDR'}, rule='type')
+                    if not (isinstance(data__target__type, str) and data__target__type == 'ip' or isinstance(data__target__type, str) and data__target__type == 'subnet'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".target.type must be one of ['ip', 'subnet']", value=data__target__type, name="" + (name_prefix or "data") + ".target.type", definition={'type': 'string', 'enum': ['ip', 'subnet'], 'description': 'Selector kind: single IP address or subnet CIDR'}, rule='enum')
+                if "value" in data__target_keys:
+                    data__target_keys.remove("value")
+                    data__target__value = data__target["value"]
+                    if not isinstance(data__target__value, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".target.value must be string", value=data__target__value, name="" + (name_prefix or "data") + ".target.value", definition={'type': 'string', 'description': "Selector value (e.g., '192.168.1.50' or '192.168.1.0/24')"}, rule='type')
+    return data
+def validate_qos_rule_update_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'name': {'type': 'string', 'description': 'Descriptive name for the QoS rule'}, 'interface': {'type': 'string', 'description': "Network interface the rule applies to (e.g., 'WAN', 'LAN')"}, 'direction': {'type': 'string', 'enum': ['upload', 'download'], 'description': 'Direction of traffic affected'}, 'bandwidth_limit_kbps': {'type': 'integer', 'description': 'Bandwidth limit in Kilobits per second'}, 'target_ip_address': {'type': 'string', 'description': 'Specific IP address to target'}, 'target_subnet': {'type': 'string', 'description': 'Subnet (CIDR notation) to target'}, 'dscp_value': {'type': 'integer', 'description': 'DSCP value to match/set (0-63)', 'minimum': 0, 'maximum': 63}, 'enabled': {'type': 'boolean', 'description': 'Whether the rule is enabled'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Descriptive name for the QoS rule'}, rule='type')
+        if "interface" in data_keys:
+            data_keys.remove("interface")
+            data__interface = data["interface"]
+            if not isinstance(data__interface, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".interface must be string", value=data__interface, name="" + (name_prefix or "data") + ".interface", definition={'type': 'string', 'description': "Network interface the rule applies to (e.g., 'WAN', 'LAN')"}, rule='type')
+        if "direction" in data_keys:
+            data_keys.remove("direction")
+            data__direction = data["direction"]
+            if not isinstance(data__direction, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".direction must be string", value=data__direction, name="" + (name_prefix or "data") + ".direction", definition={'type': 'string', 'enum': ['upload', 'download'], 'description': 'Direction of traffic affected'}, rule='type')
+            if not (isinstance(data__direction, str) and data__direction == 'upload' or isinstance(data__direction, str) and data__direction == 'download'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".direction must be one of ['upload', 'download']", value=data__direction, name="" + (name_prefix or "data") + ".direction", definition={'type': 'string', 'enum': ['upload', 'download'], 'description': 'Direction of traffic affected'}, rule='enum')
+        if "bandwidth_limit_kbps" in data_keys:
+            data_keys.remove("bandwidth_limit_kbps")
+            data__bandwidthlimitkbps = data["bandwidth_limit_kbps"]
+            if not isinstance(data__bandwidthlimitkbps, (int)) and not (isinstance(data__bandwidthlimitkbps, float) and data__bandwidthlimitkbps.is_integer()) or isinstance(data__bandwidthlimitkbps, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".bandwidth_limit_kbps must be integer", value=data__bandwidthlimitkbps, name="" + (name_prefix or "data") + ".bandwidth_limit_kbps", definition={'type': 'integer', 'description': 'Bandwidth limit in Kilobits per second'}, rule='type')
+        if "target_ip_address" in data_keys:
+            data_keys.remove("target_ip_address")
+            data__targetipaddress = data["target_ip_address"]
+            if not isinstance(data__targetipaddress, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_ip_address must be string", value=data__targetipaddress, name="" + (name_prefix or "data") + ".target_ip_address", definition={'type': 'string', 'description': 'Specific IP address to target'}, rule='type')
+        if "target_subnet" in data_keys:
+            data_keys.remove("target_subnet")
+            data__targetsubnet = data["target_subnet"]
+            if not isinstance(data__targetsubnet, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_subnet must be string", value=data__targetsubnet, name="" + (name_prefix or "data") + ".target_subnet", definition={'type': 'string', 'description': 'Subnet (CIDR notation) to target'}, rule='type')
+        if "dscp_value" in data_keys:
+            data_keys.remove("dscp_value")
+            data__dscpvalue = data["dscp_value"]
+            if not isinstance(data__dscpvalue, (int)) and not (isinstance(data__dscpvalue, float) and data__dscpvalue.is_integer()) or isinstance(data__dscpvalue, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".dscp_value must be integer", value=data__dscpvalue, name="" + (name_prefix or "data") + ".dscp_value", definition={'type': 'integer', 'description': 'DSCP value to match/set (0-63)', 'minimum': 0, 'maximum': 63}, rule='type')
+            if isinstance(data__dscpvalue, (int, float, Decimal)):
+                if data__dscpvalue < 0:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".dscp_value must be bigger than or equal to 0", value=data__dscpvalue, name="" + (name_prefix or "data") + ".dscp_value", definition={'type': 'integer', 'description': 'DSCP value to match/set (0-63)', 'minimum': 0, 'maximum': 63}, rule='minimum')
+                if data__dscpvalue > 63:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".dscp_value must be smaller than or equal to 63", value=data__dscpvalue, name="" + (name_prefix or "data") + ".dscp_value", definition={'type': 'integer', 'description': 'DSCP value to match/set (0-63)', 'minimum': 0, 'maximum': 63}, rule='maximum')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'description': 'Whether the rule is enabled'}, rule='type')
+    return data
+def validate_traffic_route_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'interface', 'matching_target', 'network_id', 'target_devices'], 'properties': {'name': {'type': 'string', 'description': 'Descriptive name for the route'}, 'interface': {'type': 'string', 'description': "Interface name (e.g., 'wan', 'wan2', 'vpnclient0') required for creation"}, 'description': {'type': 'string', 'description': 'Additional description'}, 'enabled': {'type': 'boolean', 'default': True, 'description': 'Whether route is enabled initially'}, 'matching_target': {'type': 'string', 'description': 'Specifies the destination/source type', 'enum': ['INTERNET', 'DOMAIN', 'IP', 'REGION']}, 'network_id': {'type': 'string', 'description': 'Network ID (LAN/VLAN) the route applies to (Required for creation)'}, 'target_devices': {'type': 'array', 'description': 'List of client devices or networks the route applies to (Required, cannot be empty). Defines the source scope within network_id.', 'minItems': 1, 'items': {'type': 'object', 'required': ['type'], 'properties': {'client_mac': {'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, 'network_id': {'type': 'string', 'description': 'Network ID if type is NETWORK (Required if type is NETWORK)'}, 'type': {'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}}, 'allOf': [{'if': {'properties': {'type': {'const': 'CLIENT'}}}, 'then': {'required': ['client_mac']}}, {'if': {'properties': {'type': {'const': 'NETWORK'}}}, 'then': {'required': ['network_id']}}]}}, 'domains': {'type': 'array', 'description': 'List of domains with ports (used with matching_target: DOMAIN)', 'items': {'type': 'object', 'properties': {'domain': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}}, 'ip_addresses': {'type': 'array', 'description': 'List of IPs/subnets with ports (used with matching_target: IP)', 'items': {'type': 'object', 'properties': {'ip_or_subnet': {'type': 'string'}, 'ip_version': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}}, 'ip_ranges': {'type': 'array', 'description': 'List of IP ranges', 'items': {'type': 'object', 'properties': {'ip_start': {'type': 'string'}, 'ip_stop': {'type': 'string'}, 'ip_version': {'type': 'string'}}}}, 'regions': {'type': 'array', 'items': {'type': 'string'}, 'description': 'List of regions (used with matching_target: REGION)'}, 'kill_switch_enabled': {'type': 'boolean', 'default': False, 'description': 'Whether kill switch is enabled (for VPNs)'}, 'next_hop': {'type': 'string', 'description': 'Next hop IP address (advanced routing)'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name', 'interface', 'matching_target', 'network_id', 'target_devices']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'interface', 'matching_target', 'network_id', 'target_devices'], 'properties': {'name': {'type': 'string', 'description': 'Descriptive name for the route'}, 'interface': {'type': 'string', 'description': "Interface name (e.g., 'wan', 'wan2', 'vpnclient0') required for creation"}, 'description': {'type': 'string', 'description': 'Additional description'}, 'enabled': {'type': 'boolean', 'default': True, 'description': 'Whether route is enabled initially'}, 'matching_target': {'type': 'string', 'description': 'Specifies the destination/source type', 'enum': ['INTERNET', 'DOMAIN', 'IP', 'REGION']}, 'network_id': {'type': 'string', 'description': 'Network ID (LAN/VLAN) the route applies to (Required for creation)'}, 'target_devices': {'type': 'array', 'description': 'List of client devices or networks the route applies to (Required, cannot be empty). Defines the source scope within network_id.', 'minItems': 1, 'items': {'type': 'object', 'required': ['type'], 'properties': {'client_mac': {'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, 'network_id': {'type': 'string', 'description': 'Network ID if type is NETWORK (Required if type is NETWORK)'}, 'type': {'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}}, 'allOf': [{'if': {'properties': {'type': {'const': 'CLIENT'}}}, 'then': {'required': ['client_mac']}}, {'if': {'properties': {'type': {'const': 'NETWORK'}}}, 'then': {'required': ['network_id']}}]}}, 'domains': {'type': 'array', 'description': 'List of domains with ports (used with matching_target: DOMAIN)', 'items': {'type': 'object', 'properties': {'domain': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}}, 'ip_addresses': {'type': 'array', 'description': 'List of IPs/subnets with ports (used with matching_target: IP)', 'items': {'type': 'object', 'properties': {'ip_or_subnet': {'type': 'string'}, 'ip_version': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}}, 'ip_ranges': {'type': 'array', 'description': 'List of IP ranges', 'items': {'type': 'object', 'properties': {'ip_start': {'type': 'string'}, 'ip_stop': {'type': 'string'}, 'ip_version': {'type': 'string'}}}}, 'regions': {'type': 'array', 'items': {'type': 'string'}, 'description': 'List of regions (used with matching_target: REGION)'}, 'kill_switch_enabled': {'type': 'boolean', 'default': False, 'description': 'Whether kill switch is enabled (for VPNs)'}, 'next_hop': {'type': 'string', 'description': 'Next hop IP address (advanced routing)'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Descriptive name for the route'}, rule='type')
+        if "interface" in data_keys:
+            data_keys.remove("interface")
+            data__interface = data["interface"]
+            if not isinstance(data__interface, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".interface must be string", value=data__interface, name="" + (name_prefix or "data") + ".interface", definition={'type': 'string', 'description': "Interface name (e.g., 'wan', 'wan2', 'vpnclient0') required for creation"}, rule='type')
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'description': 'Additional description'}, rule='type')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'default': True, 'description': 'Whether route is enabled initially'}, rule='type')
+        else: data["enabled"] = True
+        if "matching_target" in data_keys:
+            data_keys.remove("matching_target")
+            data__matchingtarget = data["matching_target"]
+            if not isinstance(data__matchingtarget, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".matching_target must be string", value=data__matchingtarget, name="" + (name_prefix or "data") + ".matching_target", definition={'type': 'string', 'description': 'Specifies the destination/source type', 'enum': ['INTERNET', 'DOMAIN', 'IP', 'REGION']}, rule='type')
+            if not (isinstance(data__matchingtarget, str) and data__matchingtarget == 'INTERNET' or isinstance(data__matchingtarget, str) and data__matchingtarget == 'DOMAIN' or isinstance(data__matchingtarget, str) and data__matchingtarget == 'IP' or isinstance(data__matchingtarget, str) and data__matchingtarget == 'REGION'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".matching_target must be one of ['INTERNET', 'DOMAIN', 'IP', 'REGION']", value=data__matchingtarget, name="" + (name_prefix or "data") + ".matching_target", definition={'type': 'string', 'description': 'Specifies the destination/source type', 'enum': ['INTERNET', 'DOMAIN', 'IP', 'REGION']}, rule='enum')
+        if "network_id" in data_keys:
+            data_keys.remove("network_id")
+            data__networkid = data["network_id"]
+            if not isinstance(data__networkid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".network_id must be string", value=data__networkid, name="" + (name_prefix or "data") + ".network_id", definition={'type': 'string', 'description': 'Network ID (LAN/VLAN) the route applies to (Required for creation)'}, rule='type')
+        if "target_devices" in data_keys:
+            data_keys.remove("target_devices")
+            data__targetdevices = data["target_devices"]
+            if not isinstance(data__targetdevices, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices must be array", value=data__targetdevices, name="" + (name_prefix or "data") + ".target_devices", definition={'type': 'array', 'description': 'List of client devices or networks the route applies to (Required, cannot be empty). Defines the source scope within network_id.', 'minItems': 1, 'items': {'type': 'object', 'required': ['type'], 'properties': {'client_mac': {'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, 'network_id': {'type': 'string', 'description': 'Network ID if type is NETWORK (Required if type is NETWORK)'}, 'type': {'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}}, 'allOf': [{'if': {'properties': {'type': {'const': 'CLIENT'}}}, 'then': {'required': ['client_mac']}}, {'if': {'properties': {'type': {'const': 'NETWORK'}}}, 'then': {'required': ['network_id']}}]}}, rule='type')
+            data__targetdevices_is_list = isinstance(data__targetdevices, (list, tuple))
+            if data__targetdevices_is_list:
+                data__targetdevices_len = len(data__targetdevices)
+                if data__targetdevices_len < 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices must contain at least 1 items", value=data__targetdevices, name="" + (name_prefix or "data") + ".target_devices", definition={'type': 'array', 'description': 'List of client devices or networks the route applies to (Required, cannot be empty). Defines the source scope within network_id.', 'minItems': 1, 'items': {'type': 'object', 'required': ['type'], 'properties': {'client_mac': {'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, 'network_id': {'type': 'string', 'description': 'Network ID if type is NETWORK (Required if type is NETWORK)'}, 'type': {'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}}, 'allOf': [{'if': {'properties': {'type': {'const': 'CLIENT'}}}, 'then': {'required': ['client_mac']}}, {'if': {'properties': {'type': {'const': 'NETWORK'}}}, 'then': {'required': ['network_id']}}]}}, rule='minItems')
+                for data__targetdevices_x, data__targetdevices_item in enumerate(data__targetdevices):
+                    if not isinstance(data__targetdevices_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + " must be object", value=data__targetdevices_item, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['type'], 'properties': {'client_mac': {'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, 'network_id': {'type': 'string', 'description': 'Network ID if type is NETWORK (Required if type is NETWORK)'}, 'type': {'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}}, 'allOf': [{'if': {'properties': {'type': {'const': 'CLIENT'}}}, 'then': {'required': ['client_mac']}}, {'if': {'properties': {'type': {'const': 'NETWORK'}}}, 'then': {'required': ['network_id']}}]}, rule='type')
+                    try:
+                        data__targetdevices_item_is_dict = isinstance(data__targetdevices_item, dict)
+                        if data__targetdevices_item_is_dict:
+                            data__targetdevices_item_keys = set(data__targetdevices_item.keys())
+                            if "type" in data__targetdevices_item_keys:
+                                data__targetdevices_item_keys.remove("type")
+                                data__targetdevices_item__type = data__targetdevices_item["type"]
+                                if not (isinstance(data__targetdevices_item__type, str) and data__targetdevices_item__type == 'CLIENT'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + " must be same as const definition: CLIENT", value=data__targetdevices_item__type, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + "", definition={'const': 'CLIENT'}, rule='const')
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                    else:
+                        data__targetdevices_item_is_dict = isinstance(data__targetdevices_item, dict)
+                        if data__targetdevices_item_is_dict:
+                            data__targetdevices_item__missing_keys = set(['client_mac']) - data__targetdevices_item.keys()
+                            if data__targetdevices_item__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + " must contain " + (str(sorted(data__targetdevices_item__missing_keys)) + " properties"), value=data__targetdevices_item, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + "", definition={'required': ['client_mac']}, rule='required')
+                    try:
+                        data__targetdevices_item_is_dict = isinstance(data__targetdevices_item, dict)
+                        if data__targetdevices_item_is_dict:
+                            data__targetdevices_item_keys = set(data__targetdevices_item.keys())
+                            if "type" in data__targetdevices_item_keys:
+                                data__targetdevices_item_keys.remove("type")
+                                data__targetdevices_item__type = data__targetdevices_item["type"]
+                                if not (isinstance(data__targetdevices_item__type, str) and data__targetdevices_item__type == 'NETWORK'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + " must be same as const definition: NETWORK", value=data__targetdevices_item__type, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + "", definition={'const': 'NETWORK'}, rule='const')
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                    else:
+                        data__targetdevices_item_is_dict = isinstance(data__targetdevices_item, dict)
+                        if data__targetdevices_item_is_dict:
+                            data__targetdevices_item__missing_keys = set(['network_id']) - data__targetdevices_item.keys()
+                            if data__targetdevices_item__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + " must contain " + (str(sorted(data__targetdevices_item__missing_keys)) + " properties"), value=data__targetdevices_item, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + "", definition={'required': ['network_id']}, rule='required')
+                    data__targetdevices_item_is_dict = isinstance(data__targetdevices_item, dict)
+                    if data__targetdevices_item_is_dict:
+                        data__targetdevices_item__missing_keys = set(['type']) - data__targetdevices_item.keys()
+                        if data__targetdevices_item__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + " must contain " + (str(sorted(data__targetdevices_item__missing_keys)) + " properties"), value=data__targetdevices_item, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['type'], 'properties': {'client_mac': {'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, 'network_id': {'type': 'string', 'description': 'Network ID if type is NETWORK (Required if type is NETWORK)'}, 'type': {'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}}, 'allOf': [{'if': {'properties': {'type': {'const': 'CLIENT'}}}, 'then': {'required': ['client_mac']}}, {'if': {'properties': {'type': {'const': 'NETWORK'}}}, 'then': {'required': ['network_id']}}]}, rule='required')
+                        data__targetdevices_item_keys = set(data__targetdevices_item.keys())
+                        if "client_mac" in data__targetdevices_item_keys:
+                            data__targetdevices_item_keys.remove("client_mac")
+                            data__targetdevices_item__clientmac = data__targetdevices_item["client_mac"]
+                            if not isinstance(data__targetdevices_item__clientmac, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].client_mac".format(**locals()) + " must be string", value=data__targetdevices_item__clientmac, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].client_mac".format(**locals()) + "", definition={'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, rule='type')
+                            if isinstance(data__targetdevices_item__clientmac, str):
+                                if not custom_formats["mac"](data__targetdevices_item__clientmac):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].client_mac".format(**locals()) + " must be mac", value=data__targetdevices_item__clientmac, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].client_mac".format(**locals()) + "", definition={'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, rule='format')
+                        if "network_id" in data__targetdevices_item_keys:
+                            data__targetdevices_item_keys.remove("network_id")
+                            data__targetdevices_item__networkid = data__targetdevices_item["network_id"]
+                            if not isinstance(data__targetdevices_item__networkid, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].network_id".format(**locals()) + " must be string", value=data__targetdevices_item__networkid, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].network_id".format(**locals()) + "", definition={'type': 'string', 'description': 'Network ID if type is NETWORK (Required if type is NETWORK)'}, rule='type')
+                        if "type" in data__targetdevices_item_keys:
+                            data__targetdevices_item_keys.remove("type")
+                            data__targetdevices_item__type = data__targetdevices_item["type"]
+                            if not isinstance(data__targetdevices_item__type, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + " must be string", value=data__targetdevices_item__type, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + "", definition={'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}, rule='type')
+                            if not (isinstance(data__targetdevices_item__type, str) and data__targetdevices_item__type == 'CLIENT' or isinstance(data__targetdevices_item__type, str) and data__targetdevices_item__type == 'NETWORK'):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + " must be one of ['CLIENT', 'NETWORK']", value=data__targetdevices_item__type, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + "", definition={'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}, rule='enum')
+        if "domains" in data_keys:
+            data_keys.remove("domains")
+            data__domains = data["domains"]
+            if not isinstance(data__domains, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains must be array", value=data__domains, name="" + (name_prefix or "data") + ".domains", definition={'type': 'array', 'description': 'List of domains with ports (used with matching_target: DOMAIN)', 'items': {'type': 'object', 'properties': {'domain': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}}, rule='type')
+            data__domains_is_list = isinstance(data__domains, (list, tuple))
+            if data__domains_is_list:
+                data__domains_len = len(data__domains)
+                for data__domains_x, data__domains_item in enumerate(data__domains):
+                    if not isinstance(data__domains_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}]".format(**locals()) + " must be object", value=data__domains_item, name="" + (name_prefix or "data") + ".domains[{data__domains_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'domain': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}, rule='type')
+                    data__domains_item_is_dict = isinstance(data__domains_item, dict)
+                    if data__domains_item_is_dict:
+                        data__domains_item_keys = set(data__domains_item.keys())
+                        if "domain" in data__domains_item_keys:
+                            data__domains_item_keys.remove("domain")
+                            data__domains_item__domain = data__domains_item["domain"]
+                            if not isinstance(data__domains_item__domain, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].domain".format(**locals()) + " must be string", value=data__domains_item__domain, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].domain".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "ports" in data__domains_item_keys:
+                            data__domains_item_keys.remove("ports")
+                            data__domains_item__ports = data__domains_item["ports"]
+                            if not isinstance(data__domains_item__ports, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].ports".format(**locals()) + " must be array", value=data__domains_item__ports, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].ports".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'integer'}}, rule='type')
+                            data__domains_item__ports_is_list = isinstance(data__domains_item__ports, (list, tuple))
+                            if data__domains_item__ports_is_list:
+                                data__domains_item__ports_len = len(data__domains_item__ports)
+                                for data__domains_item__ports_x, data__domains_item__ports_item in enumerate(data__domains_item__ports):
+                                    if not isinstance(data__domains_item__ports_item, (int)) and not (isinstance(data__domains_item__ports_item, float) and data__domains_item__ports_item.is_integer()) or isinstance(data__domains_item__ports_item, bool):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].ports[{data__domains_item__ports_x}]".format(**locals()) + " must be integer", value=data__domains_item__ports_item, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].ports[{data__domains_item__ports_x}]".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+                        if "port_ranges" in data__domains_item_keys:
+                            data__domains_item_keys.remove("port_ranges")
+                            data__domains_item__portranges = data__domains_item["port_ranges"]
+                            if not isinstance(data__domains_item__portranges, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges".format(**locals()) + " must be array", value=data__domains_item__portranges, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}, rule='type')
+                            data__domains_item__portranges_is_list = isinstance(data__domains_item__portranges, (list, tuple))
+                            if data__domains_item__portranges_is_list:
+                                data__domains_item__portranges_len = len(data__domains_item__portranges)
+                                for data__domains_item__portranges_x, data__domains_item__portranges_item in enumerate(data__domains_item__portranges):
+                                    if not isinstance(data__domains_item__portranges_item, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges[{data__domains_item__portranges_x}]".format(**locals()) + " must be object", value=data__domains_item__portranges_item, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges[{data__domains_item__portranges_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}, rule='type')
+                                    data__domains_item__portranges_item_is_dict = isinstance(data__domains_item__portranges_item, dict)
+                                    if data__domains_item__portranges_item_is_dict:
+                                        data__domains_item__portranges_item_keys = set(data__domains_item__portranges_item.keys())
+                                        if "port_start" in data__domains_item__portranges_item_keys:
+                                            data__domains_item__portranges_item_keys.remove("port_start")
+                                            data__domains_item__portranges_item__portstart = data__domains_item__portranges_item["port_start"]
+                                            if not isinstance(data__domains_item__portranges_item__portstart, (int)) and not (isinstance(data__domains_item__portranges_item__portstart, float) and data__domains_item__portranges_item__portstart.is_integer()) or isinstance(data__domains_item__portranges_item__portstart, bool):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges[{data__domains_item__portranges_x}].port_start".format(**locals()) + " must be integer", value=data__domains_item__portranges_item__portstart, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges[{data__domains_item__portranges_x}].port_start".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+                                        if "port_stop" in data__domains_item__portranges_item_keys:
+                                            data__domains_item__portranges_item_keys.remove("port_stop")
+                                            data__domains_item__portranges_item__portstop = data__domains_item__portranges_item["port_stop"]
+                                            if not isinstance(data__domains_item__portranges_item__portstop, (int)) and not (isinstance(data__domains_item__portranges_item__portstop, float) and data__domains_item__portranges_item__portstop.is_integer()) or isinstance(data__domains_item__portranges_item__portstop, bool):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges[{data__domains_item__portranges_x}].port_stop".format(**locals()) + " must be integer", value=data__domains_item__portranges_item__portstop, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges[{data__domains_item__portranges_x}].port_stop".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+        if "ip_addresses" in data_keys:
+            data_keys.remove("ip_addresses")
+            data__ipaddresses = data["ip_addresses"]
+            if not isinstance(data__ipaddresses, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses must be array", value=data__ipaddresses, name="" + (name_prefix or "data") + ".ip_addresses", definition={'type': 'array', 'description': 'List of IPs/subnets with ports (used with matching_target: IP)', 'items': {'type': 'object', 'properties': {'ip_or_subnet': {'type': 'string'}, 'ip_version': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}}, rule='type')
+            data__ipaddresses_is_list = isinstance(data__ipaddresses, (list, tuple))
+            if data__ipaddresses_is_list:
+                data__ipaddresses_len = len(data__ipaddresses)
+                for data__ipaddresses_x, data__ipaddresses_item in enumerate(data__ipaddresses):
+                    if not isinstance(data__ipaddresses_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}]".format(**locals()) + " must be object", value=data__ipaddresses_item, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'ip_or_subnet': {'type': 'string'}, 'ip_version': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}, rule='type')
+                    data__ipaddresses_item_is_dict = isinstance(data__ipaddresses_item, dict)
+                    if data__ipaddresses_item_is_dict:
+                        data__ipaddresses_item_keys = set(data__ipaddresses_item.keys())
+                        if "ip_or_subnet" in data__ipaddresses_item_keys:
+                            data__ipaddresses_item_keys.remove("ip_or_subnet")
+                            data__ipaddresses_item__iporsubnet = data__ipaddresses_item["ip_or_subnet"]
+                            if not isinstance(data__ipaddresses_item__iporsubnet, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ip_or_subnet".format(**locals()) + " must be string", value=data__ipaddresses_item__iporsubnet, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ip_or_subnet".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "ip_version" in data__ipaddresses_item_keys:
+                            data__ipaddresses_item_keys.remove("ip_version")
+                            data__ipaddresses_item__ipversion = data__ipaddresses_item["ip_version"]
+                            if not isinstance(data__ipaddresses_item__ipversion, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ip_version".format(**locals()) + " must be string", value=data__ipaddresses_item__ipversion, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ip_version".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "ports" in data__ipaddresses_item_keys:
+                            data__ipaddresses_item_keys.remove("ports")
+                            data__ipaddresses_item__ports = data__ipaddresses_item["ports"]
+                            if not isinstance(data__ipaddresses_item__ports, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ports".format(**locals()) + " must be array", value=data__ipaddresses_item__ports, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ports".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'integer'}}, rule='type')
+                            data__ipaddresses_item__ports_is_list = isinstance(data__ipaddresses_item__ports, (list, tuple))
+                            if data__ipaddresses_item__ports_is_list:
+                                data__ipaddresses_item__ports_len = len(data__ipaddresses_item__ports)
+                                for data__ipaddresses_item__ports_x, data__ipaddresses_item__ports_item in enumerate(data__ipaddresses_item__ports):
+                                    if not isinstance(data__ipaddresses_item__ports_item, (int)) and not (isinstance(data__ipaddresses_item__ports_item, float) and data__ipaddresses_item__ports_item.is_integer()) or isinstance(data__ipaddresses_item__ports_item, bool):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ports[{data__ipaddresses_item__ports_x}]".format(**locals()) + " must be integer", value=data__ipaddresses_item__ports_item, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ports[{data__ipaddresses_item__ports_x}]".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+                        if "port_ranges" in data__ipaddresses_item_keys:
+                            data__ipaddresses_item_keys.remove("port_ranges")
+                            data__ipaddresses_item__portranges = data__ipaddresses_item["port_ranges"]
+                            if not isinstance(data__ipaddresses_item__portranges, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges".format(**locals()) + " must be array", value=data__ipaddresses_item__portranges, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}, rule='type')
+                            data__ipaddresses_item__portranges_is_list = isinstance(data__ipaddresses_item__portranges, (list, tuple))
+                            if data__ipaddresses_item__portranges_is_list:
+                                data__ipaddresses_item__portranges_len = len(data__ipaddresses_item__portranges)
+                                for data__ipaddresses_item__portranges_x, data__ipaddresses_item__portranges_item in enumerate(data__ipaddresses_item__portranges):
+                                    if not isinstance(data__ipaddresses_item__portranges_item, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges[{data__ipaddresses_item__portranges_x}]".format(**locals()) + " must be object", value=data__ipaddresses_item__portranges_item, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges[{data__ipaddresses_item__portranges_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}, rule='type')
+                                    data__ipaddresses_item__portranges_item_is_dict = isinstance(data__ipaddresses_item__portranges_item, dict)
+                                    if data__ipaddresses_item__portranges_item_is_dict:
+                                        data__ipaddresses_item__portranges_item_keys = set(data__ipaddresses_item__portranges_item.keys())
+                                        if "port_start" in data__ipaddresses_item__portranges_item_keys:
+                                            data__ipaddresses_item__portranges_item_keys.remove("port_start")
+                                            data__ipaddresses_item__portranges_item__portstart = data__ipaddresses_item__portranges_item["port_start"]
+                                            if not isinstance(data__ipaddresses_item__portranges_item__portstart, (int)) and not (isinstance(data__ipaddresses_item__portranges_item__portstart, float) and data__ipaddresses_item__portranges_item__portstart.is_integer()) or isinstance(data__ipaddresses_item__portranges_item__portstart, bool):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges[{data__ipaddresses_item__portranges_x}].port_start".format(**locals()) + " must be integer", value=data__ipaddresses_item__portranges_item__portstart, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges[{data__ipaddresses_item__portranges_x}].port_start".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+                                        if "port_stop" in data__ipaddresses_item__portranges_item_keys:
+                                            data__ipaddresses_item__portranges_item_keys.remove("port_stop")
+                                            data__ipaddresses_item__portranges_item__portstop = data__ipaddresses_item__portranges_item["port_stop"]
+                                            if not isinstance(data__ipaddresses_item__portranges_item__portstop, (int)) and not (isinstance(data__ipaddresses_item__portranges_item__portstop, float) and data__ipaddresses_item__portranges_item__portstop.is_integer()) or isinstance(data__ipaddresses_item__portranges_item__portstop, bool):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges[{data__ipaddresses_item__portranges_x}].port_stop".format(**locals()) + " must be integer", value=data__ipaddresses_item__portranges_item__portstop, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges[{data__ipaddresses_item__portranges_x}].port_stop".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+        if "ip_ranges" in data_keys:
+            data_keys.remove("ip_ranges")
+            data__ipranges = data["ip_ranges"]
+            if not isinstance(data__ipranges, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_ranges must be array", value=data__ipranges, name="" + (name_prefix or "data") + ".ip_ranges", definition={'type': 'array', 'description': 'List of IP ranges', 'items': {'type': 'object', 'properties': {'ip_start': {'type': 'string'}, 'ip_stop': {'type': 'string'}, 'ip_version': {'type': 'string'}}}}, rule='type')
+            data__ipranges_is_list = isinstance(data__ipranges, (list, tuple))
+            if data__ipranges_is_list:
+                data__ipranges_len = len(data__ipranges)
+                for data__ipranges_x, data__ipranges_item in enumerate(data__ipranges):
+                    if not isinstance(data__ipranges_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}]".format(**locals()) + " must be object", value=data__ipranges_item, name="" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'ip_start': {'type': 'string'}, 'ip_stop': {'type': 'string'}, 'ip_version': {'type': 'string'}}}, rule='type')
+                    data__ipranges_item_is_dict = isinstance(data__ipranges_item, dict)
+                    if data__ipranges_item_is_dict:
+                        data__ipranges_item_keys = set(data__ipranges_item.keys())
+                        if "ip_start" in data__ipranges_item_keys:
+                            data__ipranges_item_keys.remove("ip_start")
+                            data__ipranges_item__ipstart = data__ipranges_item["ip_start"]
+                            if not isinstance(data__ipranges_item__ipstart, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}].ip_start".format(**locals()) + " must be string", value=data__ipranges_item__ipstart, name="" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}].ip_start".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "ip_stop" in data__ipranges_item_keys:
+                            data__ipranges_item_keys.remove("ip_stop")
+                            data__ipranges_item__ipstop = data__ipranges_item["ip_stop"]
+                            if not isinstance(data__ipranges_item__ipstop, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}].ip_stop".format(**locals()) + " must be string", value=data__ipranges_item__ipstop, name="" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}].ip_stop".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "ip_version" in data__ipranges_item_keys:
+                            data__ipranges_item_keys.remove("ip_version")
+                            data__ipranges_item__ipversion = data__ipranges_item["ip_version"]
+                            if not isinstance(data__ipranges_item__ipversion, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}].ip_version".format(**locals()) + " must be string", value=data__ipranges_item__ipversion, name="" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}].ip_version".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "regions" in data_keys:
+            data_keys.remove("regions")
+            data__regions = data["regions"]
+            if not isinstance(data__regions, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".regions must be array", value=data__regions, name="" + (name_prefix or "data") + ".regions", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'List of regions (used with matching_target: REGION)'}, rule='type')
+            data__regions_is_list = isinstance(data__regions, (list, tuple))
+            if data__regions_is_list:
+                data__regions_len = len(data__regions)
+                for data__regions_x, data__regions_item in enumerate(data__regions):
+                    if not isinstance(data__regions_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".regions[{data__regions_x}]".format(**locals()) + " must be string", value=data__regions_item, name="" + (name_prefix or "data") + ".regions[{data__regions_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "kill_switch_enabled" in data_keys:
+            data_keys.remove("kill_switch_enabled")
+            data__killswitchenabled = data["kill_switch_enabled"]
+            if not isinstance(data__killswitchenabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".kill_switch_enabled must be boolean", value=data__killswitchenabled, name="" + (name_prefix or "data") + ".kill_switch_enabled", definition={'type': 'boolean', 'default': False, 'description': 'Whether kill switch is enabled (for VPNs)'}, rule='type')
+        else: data["kill_switch_enabled"] = False
+        if "next_hop" in data_keys:
+            data_keys.remove("next_hop")
+            data__nexthop = data["next_hop"]
+            if not isinstance(data__nexthop, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".next_hop must be string", value=data__nexthop, name="" + (name_prefix or "data") + ".next_hop", definition={'type': 'string', 'description': 'Next hop IP address (advanced routing)'}, rule='type')
+    return data
+def validate_traffic_route_simple_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'interface', 'network', 'matching_target'], 'properties': {'name': {'type': 'string'}, 'interface': {'type': 'string'}, 'network': {'type': 'string', 'description': 'Source LAN/VLAN name or id'}, 'client_macs': {'type': 'array', 'items': {'type': 'string', 'format': 'mac'}, 'description': 'Optional list of client MACs within the network. If omitted the entire network is routed.'}, 'matching_target': {'type': 'string', 'enum': ['INTERNET', 'DOMAIN', 'IP', 'REGION']}, 'destinations': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Destination values depending on matching_target (domain names, IPs, regions). Not required for INTERNET.'}, 'enabled': {'type': 'boolean'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name', 'interface', 'network', 'matching_target']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'interface', 'network', 'matching_target'], 'properties': {'name': {'type': 'string'}, 'interface': {'type': 'string'}, 'network': {'type': 'string', 'description': 'Source LAN/VLAN name or id'}, 'client_macs': {'type': 'array', 'items': {'type': 'string', 'format': 'mac'}, 'description': 'Optional list of client MACs within the network. If omitted the entire network is routed.'}, 'matching_target': {'type': 'string', 'enum': ['INTERNET', 'DOMAIN', 'IP', 'REGION']}, 'destinations': {'type': 'array', 'items': {'type': 'string'}, 'description': 'Destination values depending on matching_target (domain names, IPs, regions). Not required for INTERNET.'}, 'enabled': {'type': 'boolean'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string'}, rule='type')
+        if "interface" in data_keys:
+            data_keys.remove("interface")
+            data__interface = data["interface"]
+            if not isinstance(data__interface, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".interface must be string", value=data__interface, name="" + (name_prefix or "data") + ".interface", definition={'type': 'string'}, rule='type')
+        if "network" in data_keys:
+            data_keys.remove("network")
+            data__network = data["network"]
+            if not isinstance(data__network, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".network must be string", value=data__network, name="" + (name_prefix or "data") + ".network", definition={'type': 'string', 'description': 'Source LAN/VLAN name or id'}, rule='type')
+        if "client_macs" in data_keys:
+            data_keys.remove("client_macs")
+            data__clientmacs = data["client_macs"]
+            if not isinstance(data__clientmacs, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".client_macs must be array", value=data__clientmacs, name="" + (name_prefix or "data") + ".client_macs", definition={'type': 'array', 'items': {'type': 'string', 'format': 'mac'}, 'description': 'Optional list of client MACs within the network. If omitted the entire network is routed.'}, rule='type')
+            data__clientmacs_is_list = isinstance(data__clientmacs, (list, tuple))
+            if data__clientmacs_is_list:
+                data__clientmacs_len = len(data__clientmacs)
+                for data__clientmacs_x, data__clientmacs_item in enumerate(data__clientmacs):
+                    if not isinstance(data__clientmacs_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".client_macs[{data__clientmacs_x}]".format(**locals()) + " must be string", value=data__clientmacs_item, name="" + (name_prefix or "data") + ".client_macs[{data__clientmacs_x}]".format(**locals()) + "", definition={'type': 'string', 'format': 'mac'}, rule='type')
+                    if isinstance(data__clientmacs_item, str):
+                        if not custom_formats["mac"](data__clientmacs_item):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".client_macs[{data__clientmacs_x}]".format(**locals()) + " must be mac", value=data__clientmacs_item, name="" + (name_prefix or "data") + ".client_macs[{data__clientmacs_x}]".format(**locals()) + "", definition={'type': 'string', 'format': 'mac'}, rule='format')
+        if "matching_target" in data_keys:
+            data_keys.remove("matching_target")
+            data__matchingtarget = data["matching_target"]
+            if not isinstance(data__matchingtarget, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".matching_target must be string", value=data__matchingtarget, name="" + (name_prefix or "data") + ".matching_target", definition={'type': 'string', 'enum': ['INTERNET', 'DOMAIN', 'IP', 'REGION']}, rule='type')
+            if not (isinstance(data__matchingtarget, str) and data__matchingtarget == 'INTERNET' or isinstance(data__matchingtarget, str) and data__matchingtarget == 'DOMAIN' or isinstance(data__matchingtarget, str) and data__matchingtarget == 'IP' or isinstance(data__matchingtarget, str) and data__matchingtarget == 'REGION'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".matching_target must be one of ['INTERNET', 'DOMAIN', 'IP', 'REGION']", value=data__matchingtarget, name="" + (name_prefix or "data") + ".matching_target", definition={'type': 'string', 'enum': ['INTERNET', 'DOMAIN', 'IP', 'REGION']}, rule='enum')
+        if "destinations" in data_keys:
+            data_keys.remove("destinations")
+            data__destinations = data["destinations"]
+            if not isinstance(data__destinations, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".destinations must be array", value=data__destinations, name="" + (name_prefix or "data") + ".destinations", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'Destination values depending on matching_target (domain names, IPs, regions). Not required for INTERNET.'}, rule='type')
+            data__destinations_is_list = isinstance(data__destinations, (list, tuple))
+            if data__destinations_is_list:
+                data__destinations_len = len(data__destinations)
+                for data__destinations_x, data__destinations_item in enumerate(data__destinations):
+                    if not isinstance(data__destinations_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".destinations[{data__destinations_x}]".format(**locals()) + " must be string", value=data__destinations_item, name="" + (name_prefix or "data") + ".destinations[{data__destinations_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean'}, rule='type')
+    return data
+def validate_traffic_route_update_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'description': {'type': 'string', 'description': 'Additional description'}, 'enabled': {'type': 'boolean', 'description': 'Whether route is enabled initially'}, 'matching_target': {'type': 'string', 'description': 'Specifies the destination/source type', 'enum': ['INTERNET', 'DOMAIN', 'IP', 'REGION']}, 'network_id': {'type': 'string', 'description': 'Network ID (LAN/VLAN) the route applies to (Required for creation)'}, 'target_devices': {'type': 'array', 'description': 'List of client devices or networks the route applies to (Required, cannot be empty). Defines the source scope within network_id.', 'minItems': 1, 'items': {'type': 'object', 'required': ['type'], 'properties': {'client_mac': {'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, 'network_id': {'type': 'string', 'description': 'Network ID if type is NETWORK (Required if type is NETWORK)'}, 'type': {'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}}, 'allOf': [{'if': {'properties': {'type': {'const': 'CLIENT'}}}, 'then': {'required': ['client_mac']}}, {'if': {'properties': {'type': {'const': 'NETWORK'}}}, 'then': {'required': ['network_id']}}]}}, 'domains': {'type': 'array', 'description': 'List of domains with ports (used with matching_target: DOMAIN)', 'items': {'type': 'object', 'properties': {'domain': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}}, 'ip_addresses': {'type': 'array', 'description': 'List of IPs/subnets with ports (used with matching_target: IP)', 'items': {'type': 'object', 'properties': {'ip_or_subnet': {'type': 'string'}, 'ip_version': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}}, 'ip_ranges': {'type': 'array', 'description': 'List of IP ranges', 'items': {'type': 'object', 'properties': {'ip_start': {'type': 'string'}, 'ip_stop': {'type': 'string'}, 'ip_version': {'type': 'string'}}}}, 'regions': {'type': 'array', 'items': {'type': 'string'}, 'description': 'List of regions (used with matching_target: REGION)'}, 'kill_switch_enabled': {'type': 'boolean', 'description': 'Whether kill switch is enabled (for VPNs)'}, 'next_hop': {'type': 'string', 'description': 'Next hop IP address (advanced routing)'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'description': 'Additional description'}, rule='type')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'description': 'Whether route is enabled initially'}, rule='type')
+        if "matching_target" in data_keys:
+            data_keys.remove("matching_target")
+            data__matchingtarget = data["matching_target"]
+            if not isinstance(data__matchingtarget, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".matching_target must be string", value=data__matchingtarget, name="" + (name_prefix or "data") + ".matching_target", definition={'type': 'string', 'description': 'Specifies the destination/source type', 'enum': ['INTERNET', 'DOMAIN', 'IP', 'REGION']}, rule='type')
+            if not (isinstance(data__matchingtarget, str) and data__matchingtarget == 'INTERNET' or isinstance(data__matchingtarget, str) and data__matchingtarget == 'DOMAIN' or isinstance(data__matchingtarget, str) and data__matchingtarget == 'IP' or isinstance(data__matchingtarget, str) and data__matchingtarget == 'REGION'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".matching_target must be one of ['INTERNET', 'DOMAIN', 'IP', 'REGION']", value=data__matchingtarget, name="" + (name_prefix or "data") + ".matching_target", definition={'type': 'string', 'description': 'Specifies the destination/source type', 'enum': ['INTERNET', 'DOMAIN', 'IP', 'REGION']}, rule='enum')
+        if "network_id" in data_keys:
+            data_keys.remove("network_id")
+            data__networkid = data["network_id"]
+            if not isinstance(data__networkid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".network_id must be string", value=data__networkid, name="" + (name_prefix or "data") + ".network_id", definition={'type': 'string', 'description': 'Network ID (LAN/VLAN) the route applies to (Required for creation)'}, rule='type')
+        if "target_devices" in data_keys:
+            data_keys.remove("target_devices")
+            data__targetdevices = data["target_devices"]
+            if not isinstance(data__targetdevices, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices must be array", value=data__targetdevices, name="" + (name_prefix or "data") + ".target_devices", definition={'type': 'array', 'description': 'List of client devices or networks the route applies to (Required, cannot be empty). Defines the source scope within network_id.', 'minItems': 1, 'items': {'type': 'object', 'required': ['type'], 'properties': {'client_mac': {'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, 'network_id': {'type': 'string', 'description': 'Network ID if type is NETWORK (Required if type is NETWORK)'}, 'type': {'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}}, 'allOf': [{'if': {'properties': {'type': {'const': 'CLIENT'}}}, 'then': {'required': ['client_mac']}}, {'if': {'properties': {'type': {'const': 'NETWORK'}}}, 'then': {'required': ['network_id']}}]}}, rule='type')
+            data__targetdevices_is_list = isinstance(data__targetdevices, (list, tuple))
+            if data__targetdevices_is_list:
+                data__targetdevices_len = len(data__targetdevices)
+                if data__targetdevices_len < 1:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices must contain at least 1 items", value=data__targetdevices, name="" + (name_prefix or "data") + ".target_devices", definition={'type': 'array', 'description': 'List of client devices or networks the route applies to (Required, cannot be empty). Defines the source scope within network_id.', 'minItems': 1, 'items': {'type': 'object', 'required': ['type'], 'properties': {'client_mac': {'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, 'network_id': {'type': 'string', 'description': 'Network ID if type is NETWORK (Required if type is NETWORK)'}, 'type': {'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}}, 'allOf': [{'if': {'properties': {'type': {'const': 'CLIENT'}}}, 'then': {'required': ['client_mac']}}, {'if': {'properties': {'type': {'const': 'NETWORK'}}}, 'then': {'required': ['network_id']}}]}}, rule='minItems')
+                for data__targetdevices_x, data__targetdevices_item in enumerate(data__targetdevices):
+                    if not isinstance(data__targetdevices_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + " must be object", value=data__targetdevices_item, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['type'], 'properties': {'client_mac': {'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, 'network_id': {'type': 'string', 'description': 'Network ID if type is NETWORK (Required if type is NETWORK)'}, 'type': {'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}}, 'allOf': [{'if': {'properties': {'type': {'const': 'CLIENT'}}}, 'then': {'required': ['client_mac']}}, {'if': {'properties': {'type': {'const': 'NETWORK'}}}, 'then': {'required': ['network_id']}}]}, rule='type')
+                    try:
+                        data__targetdevices_item_is_dict = isinstance(data__targetdevices_item, dict)
+                        if data__targetdevices_item_is_dict:
+                            data__targetdevices_item_keys = set(data__targetdevices_item.keys())
+                            if "type" in data__targetdevices_item_keys:
+                                data__targetdevices_item_keys.remove("type")
+                                data__targetdevices_item__type = data__targetdevices_item["type"]
+                                if not (isinstance(data__targetdevices_item__type, str) and data__targetdevices_item__type == 'CLIENT'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + " must be same as const definition: CLIENT", value=data__targetdevices_item__type, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + "", definition={'const': 'CLIENT'}, rule='const')
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                    else:
+                        data__targetdevices_item_is_dict = isinstance(data__targetdevices_item, dict)
+                        if data__targetdevices_item_is_dict:
+                            data__targetdevices_item__missing_keys = set(['client_mac']) - data__targetdevices_item.keys()
+                            if data__targetdevices_item__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + " must contain " + (str(sorted(data__targetdevices_item__missing_keys)) + " properties"), value=data__targetdevices_item, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + "", definition={'required': ['client_mac']}, rule='required')
+                    try:
+                        data__targetdevices_item_is_dict = isinstance(data__targetdevices_item, dict)
+                        if data__targetdevices_item_is_dict:
+                            data__targetdevices_item_keys = set(data__targetdevices_item.keys())
+                            if "type" in data__targetdevices_item_keys:
+                                data__targetdevices_item_keys.remove("type")
+                                data__targetdevices_item__type = data__targetdevices_item["type"]
+                                if not (isinstance(data__targetdevices_item__type, str) and data__targetdevices_item__type == 'NETWORK'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + " must be same as const definition: NETWORK", value=data__targetdevices_item__type, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + "", definition={'const': 'NETWORK'}, rule='const')
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                    else:
+                        data__targetdevices_item_is_dict = isinstance(data__targetdevices_item, dict)
+                        if data__targetdevices_item_is_dict:
+                            data__targetdevices_item__missing_keys = set(['network_id']) - data__targetdevices_item.keys()
+                            if data__targetdevices_item__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + " must contain " + (str(sorted(data__targetdevices_item__missing_keys)) + " properties"), value=data__targetdevices_item, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + "", definition={'required': ['network_id']}, rule='required')
+                    data__targetdevices_item_is_dict = isinstance(data__targetdevices_item, dict)
+                    if data__targetdevices_item_is_dict:
+                        data__targetdevices_item__missing_keys = set(['type']) - data__targetdevices_item.keys()
+                        if data__targetdevices_item__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + " must contain " + (str(sorted(data__targetdevices_item__missing_keys)) + " properties"), value=data__targetdevices_item, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['type'], 'properties': {'client_mac': {'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, 'network_id': {'type': 'string', 'description': 'Network ID if type is NETWORK (Required if type is NETWORK)'}, 'type': {'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}}, 'allOf': [{'if': {'properties': {'type': {'const': 'CLIENT'}}}, 'then': {'required': ['client_mac']}}, {'if': {'properties': {'type': {'const': 'NETWORK'}}}, 'then': {'required': ['network_id']}}]}, rule='required')
+                        data__targetdevices_item_keys = set(data__targetdevices_item.keys())
+                        if "client_mac" in data__targetdevices_item_keys:
+                            data__targetdevices_item_keys.remove("client_mac")
+                            data__targetdevices_item__clientmac = data__targetdevices_item["client_mac"]
+                            if not isinstance(data__targetdevices_item__clientmac, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].client_mac".format(**locals()) + " must be string", value=data__targetdevices_item__clientmac, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].client_mac".format(**locals()) + "", definition={'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, rule='type')
+                            if isinstance(data__targetdevices_item__clientmac, str):
+                                if not custom_formats["mac"](data__targetdevices_item__clientmac):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].client_mac".format(**locals()) + " must be mac", value=data__targetdevices_item__clientmac, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].client_mac".format(**locals()) + "", definition={'type': 'string', 'format': 'mac', 'description': 'MAC address of the client (Required if type is CLIENT)'}, rule='format')
+                        if "network_id" in data__targetdevices_item_keys:
+                            data__targetdevices_item_keys.remove("network_id")
+                            data__targetdevices_item__networkid = data__targetdevices_item["network_id"]
+                            if not isinstance(data__targetdevices_item__networkid, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].network_id".format(**locals()) + " must be string", value=data__targetdevices_item__networkid, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].network_id".format(**locals()) + "", definition={'type': 'string', 'description': 'Network ID if type is NETWORK (Required if type is NETWORK)'}, rule='type')
+                        if "type" in data__targetdevices_item_keys:
+                            data__targetdevices_item_keys.remove("type")
+                            data__targetdevices_item__type = data__targetdevices_item["type"]
+                            if not isinstance(data__targetdevices_item__type, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + " must be string", value=data__targetdevices_item__type, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + "", definition={'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}, rule='type')
+                            if not (isinstance(data__targetdevices_item__type, str) and data__targetdevices_item__type == 'CLIENT' or isinstance(data__targetdevices_item__type, str) and data__targetdevices_item__type == 'NETWORK'):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + " must be one of ['CLIENT', 'NETWORK']", value=data__targetdevices_item__type, name="" + (name_prefix or "data") + ".target_devices[{data__targetdevices_x}].type".format(**locals()) + "", definition={'type': 'string', 'enum': ['CLIENT', 'NETWORK'], 'description': 'Type of target: CLIENT or NETWORK'}, rule='enum')
+        if "domains" in data_keys:
+            data_keys.remove("domains")
+            data__domains = data["domains"]
+            if not isinstance(data__domains, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains must be array", value=data__domains, name="" + (name_prefix or "data") + ".domains", definition={'type': 'array', 'description': 'List of domains with ports (used with matching_target: DOMAIN)', 'items': {'type': 'object', 'properties': {'domain': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}}, rule='type')
+            data__domains_is_list = isinstance(data__domains, (list, tuple))
+            if data__domains_is_list:
+                data__domains_len = len(data__domains)
+                for data__domains_x, data__domains_item in enumerate(data__domains):
+                    if not isinstance(data__domains_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}]".format(**locals()) + " must be object", value=data__domains_item, name="" + (name_prefix or "data") + ".domains[{data__domains_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'domain': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}, rule='type')
+                    data__domains_item_is_dict = isinstance(data__domains_item, dict)
+                    if data__domains_item_is_dict:
+                        data__domains_item_keys = set(data__domains_item.keys())
+                        if "domain" in data__domains_item_keys:
+                            data__domains_item_keys.remove("domain")
+                            data__domains_item__domain = data__domains_item["domain"]
+                            if not isinstance(data__domains_item__domain, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].domain".format(**locals()) + " must be string", value=data__domains_item__domain, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].domain".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "ports" in data__domains_item_keys:
+                            data__domains_item_keys.remove("ports")
+                            data__domains_item__ports = data__domains_item["ports"]
+                            if not isinstance(data__domains_item__ports, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].ports".format(**locals()) + " must be array", value=data__domains_item__ports, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].ports".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'integer'}}, rule='type')
+                            data__domains_item__ports_is_list = isinstance(data__domains_item__ports, (list, tuple))
+                            if data__domains_item__ports_is_list:
+                                data__domains_item__ports_len = len(data__domains_item__ports)
+                                for data__domains_item__ports_x, data__domains_item__ports_item in enumerate(data__domains_item__ports):
+                                    if not isinstance(data__domains_item__ports_item, (int)) and not (isinstance(data__domains_item__ports_item, float) and data__domains_item__ports_item.is_integer()) or isinstance(data__domains_item__ports_item, bool):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].ports[{data__domains_item__ports_x}]".format(**locals()) + " must be integer", value=data__domains_item__ports_item, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].ports[{data__domains_item__ports_x}]".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+                        if "port_ranges" in data__domains_item_keys:
+                            data__domains_item_keys.remove("port_ranges")
+                            data__domains_item__portranges = data__domains_item["port_ranges"]
+                            if not isinstance(data__domains_item__portranges, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges".format(**locals()) + " must be array", value=data__domains_item__portranges, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}, rule='type')
+                            data__domains_item__portranges_is_list = isinstance(data__domains_item__portranges, (list, tuple))
+                            if data__domains_item__portranges_is_list:
+                                data__domains_item__portranges_len = len(data__domains_item__portranges)
+                                for data__domains_item__portranges_x, data__domains_item__portranges_item in enumerate(data__domains_item__portranges):
+                                    if not isinstance(data__domains_item__portranges_item, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges[{data__domains_item__portranges_x}]".format(**locals()) + " must be object", value=data__domains_item__portranges_item, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges[{data__domains_item__portranges_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}, rule='type')
+                                    data__domains_item__portranges_item_is_dict = isinstance(data__domains_item__portranges_item, dict)
+                                    if data__domains_item__portranges_item_is_dict:
+                                        data__domains_item__portranges_item_keys = set(data__domains_item__portranges_item.keys())
+                                        if "port_start" in data__domains_item__portranges_item_keys:
+                                            data__domains_item__portranges_item_keys.remove("port_start")
+                                            data__domains_item__portranges_item__portstart = data__domains_item__portranges_item["port_start"]
+                                            if not isinstance(data__domains_item__portranges_item__portstart, (int)) and not (isinstance(data__domains_item__portranges_item__portstart, float) and data__domains_item__portranges_item__portstart.is_integer()) or isinstance(data__domains_item__portranges_item__portstart, bool):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges[{data__domains_item__portranges_x}].port_start".format(**locals()) + " must be integer", value=data__domains_item__portranges_item__portstart, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges[{data__domains_item__portranges_x}].port_start".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+                                        if "port_stop" in data__domains_item__portranges_item_keys:
+                                            data__domains_item__portranges_item_keys.remove("port_stop")
+                                            data__domains_item__portranges_item__portstop = data__domains_item__portranges_item["port_stop"]
+                                            if not isinstance(data__domains_item__portranges_item__portstop, (int)) and not (isinstance(data__domains_item__portranges_item__portstop, float) and data__domains_item__portranges_item__portstop.is_integer()) or isinstance(data__domains_item__portranges_item__portstop, bool):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges[{data__domains_item__portranges_x}].port_stop".format(**locals()) + " must be integer", value=data__domains_item__portranges_item__portstop, name="" + (name_prefix or "data") + ".domains[{data__domains_x}].port_ranges[{data__domains_item__portranges_x}].port_stop".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+        if "ip_addresses" in data_keys:
+            data_keys.remove("ip_addresses")
+            data__ipaddresses = data["ip_addresses"]
+            if not isinstance(data__ipaddresses, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses must be array", value=data__ipaddresses, name="" + (name_prefix or "data") + ".ip_addresses", definition={'type': 'array', 'description': 'List of IPs/subnets with ports (used with matching_target: IP)', 'items': {'type': 'object', 'properties': {'ip_or_subnet': {'type': 'string'}, 'ip_version': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}}, rule='type')
+            data__ipaddresses_is_list = isinstance(data__ipaddresses, (list, tuple))
+            if data__ipaddresses_is_list:
+                data__ipaddresses_len = len(data__ipaddresses)
+                for data__ipaddresses_x, data__ipaddresses_item in enumerate(data__ipaddresses):
+                    if not isinstance(data__ipaddresses_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}]".format(**locals()) + " must be object", value=data__ipaddresses_item, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'ip_or_subnet': {'type': 'string'}, 'ip_version': {'type': 'string'}, 'ports': {'type': 'array', 'items': {'type': 'integer'}}, 'port_ranges': {'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}}}, rule='type')
+                    data__ipaddresses_item_is_dict = isinstance(data__ipaddresses_item, dict)
+                    if data__ipaddresses_item_is_dict:
+                        data__ipaddresses_item_keys = set(data__ipaddresses_item.keys())
+                        if "ip_or_subnet" in data__ipaddresses_item_keys:
+                            data__ipaddresses_item_keys.remove("ip_or_subnet")
+                            data__ipaddresses_item__iporsubnet = data__ipaddresses_item["ip_or_subnet"]
+                            if not isinstance(data__ipaddresses_item__iporsubnet, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ip_or_subnet".format(**locals()) + " must be string", value=data__ipaddresses_item__iporsubnet, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ip_or_subnet".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "ip_version" in data__ipaddresses_item_keys:
+                            data__ipaddresses_item_keys.remove("ip_version")
+                            data__ipaddresses_item__ipversion = data__ipaddresses_item["ip_version"]
+                            if not isinstance(data__ipaddresses_item__ipversion, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ip_version".format(**locals()) + " must be string", value=data__ipaddresses_item__ipversion, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ip_version".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "ports" in data__ipaddresses_item_keys:
+                            data__ipaddresses_item_keys.remove("ports")
+                            data__ipaddresses_item__ports = data__ipaddresses_item["ports"]
+                            if not isinstance(data__ipaddresses_item__ports, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ports".format(**locals()) + " must be array", value=data__ipaddresses_item__ports, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ports".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'integer'}}, rule='type')
+                            data__ipaddresses_item__ports_is_list = isinstance(data__ipaddresses_item__ports, (list, tuple))
+                            if data__ipaddresses_item__ports_is_list:
+                                data__ipaddresses_item__ports_len = len(data__ipaddresses_item__ports)
+                                for data__ipaddresses_item__ports_x, data__ipaddresses_item__ports_item in enumerate(data__ipaddresses_item__ports):
+                                    if not isinstance(data__ipaddresses_item__ports_item, (int)) and not (isinstance(data__ipaddresses_item__ports_item, float) and data__ipaddresses_item__ports_item.is_integer()) or isinstance(data__ipaddresses_item__ports_item, bool):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ports[{data__ipaddresses_item__ports_x}]".format(**locals()) + " must be integer", value=data__ipaddresses_item__ports_item, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].ports[{data__ipaddresses_item__ports_x}]".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+                        if "port_ranges" in data__ipaddresses_item_keys:
+                            data__ipaddresses_item_keys.remove("port_ranges")
+                            data__ipaddresses_item__portranges = data__ipaddresses_item["port_ranges"]
+                            if not isinstance(data__ipaddresses_item__portranges, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges".format(**locals()) + " must be array", value=data__ipaddresses_item__portranges, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}}, rule='type')
+                            data__ipaddresses_item__portranges_is_list = isinstance(data__ipaddresses_item__portranges, (list, tuple))
+                            if data__ipaddresses_item__portranges_is_list:
+                                data__ipaddresses_item__portranges_len = len(data__ipaddresses_item__portranges)
+                                for data__ipaddresses_item__portranges_x, data__ipaddresses_item__portranges_item in enumerate(data__ipaddresses_item__portranges):
+                                    if not isinstance(data__ipaddresses_item__portranges_item, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges[{data__ipaddresses_item__portranges_x}]".format(**locals()) + " must be object", value=data__ipaddresses_item__portranges_item, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges[{data__ipaddresses_item__portranges_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'port_start': {'type': 'integer'}, 'port_stop': {'type': 'integer'}}}, rule='type')
+                                    data__ipaddresses_item__portranges_item_is_dict = isinstance(data__ipaddresses_item__portranges_item, dict)
+                                    if data__ipaddresses_item__portranges_item_is_dict:
+                                        data__ipaddresses_item__portranges_item_keys = set(data__ipaddresses_item__portranges_item.keys())
+                                        if "port_start" in data__ipaddresses_item__portranges_item_keys:
+                                            data__ipaddresses_item__portranges_item_keys.remove("port_start")
+                                            data__ipaddresses_item__portranges_item__portstart = data__ipaddresses_item__portranges_item["port_start"]
+                                            if not isinstance(data__ipaddresses_item__portranges_item__portstart, (int)) and not (isinstance(data__ipaddresses_item__portranges_item__portstart, float) and data__ipaddresses_item__portranges_item__portstart.is_integer()) or isinstance(data__ipaddresses_item__portranges_item__portstart, bool):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges[{data__ipaddresses_item__portranges_x}].port_start".format(**locals()) + " must be integer", value=data__ipaddresses_item__portranges_item__portstart, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges[{data__ipaddresses_item__portranges_x}].port_start".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+                                        if "port_stop" in data__ipaddresses_item__portranges_item_keys:
+                                            data__ipaddresses_item__portranges_item_keys.remove("port_stop")
+                                            data__ipaddresses_item__portranges_item__portstop = data__ipaddresses_item__portranges_item["port_stop"]
+                                            if not isinstance(data__ipaddresses_item__portranges_item__portstop, (int)) and not (isinstance(data__ipaddresses_item__portranges_item__portstop, float) and data__ipaddresses_item__portranges_item__portstop.is_integer()) or isinstance(data__ipaddresses_item__portranges_item__portstop, bool):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges[{data__ipaddresses_item__portranges_x}].port_stop".format(**locals()) + " must be integer", value=data__ipaddresses_item__portranges_item__portstop, name="" + (name_prefix or "data") + ".ip_addresses[{data__ipaddresses_x}].port_ranges[{data__ipaddresses_item__portranges_x}].port_stop".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+        if "ip_ranges" in data_keys:
+            data_keys.remove("ip_ranges")
+            data__ipranges = data["ip_ranges"]
+            if not isinstance(data__ipranges, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_ranges must be array", value=data__ipranges, name="" + (name_prefix or "data") + ".ip_ranges", definition={'type': 'array', 'description': 'List of IP ranges', 'items': {'type': 'object', 'properties': {'ip_start': {'type': 'string'}, 'ip_stop': {'type': 'string'}, 'ip_version': {'type': 'string'}}}}, rule='type')
+            data__ipranges_is_list = isinstance(data__ipranges, (list, tuple))
+            if data__ipranges_is_list:
+                data__ipranges_len = len(data__ipranges)
+                for data__ipranges_x, data__ipranges_item in enumerate(data__ipranges):
+                    if not isinstance(data__ipranges_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}]".format(**locals()) + " must be object", value=data__ipranges_item, name="" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'ip_start': {'type': 'string'}, 'ip_stop': {'type': 'string'}, 'ip_version': {'type': 'string'}}}, rule='type')
+                    data__ipranges_item_is_dict = isinstance(data__ipranges_item, dict)
+                    if data__ipranges_item_is_dict:
+                        data__ipranges_item_keys = set(data__ipranges_item.keys())
+                        if "ip_start" in data__ipranges_item_keys:
+                            data__ipranges_item_keys.remove("ip_start")
+                            data__ipranges_item__ipstart = data__ipranges_item["ip_start"]
+                            if not isinstance(data__ipranges_item__ipstart, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}].ip_start".format(**locals()) + " must be string", value=data__ipranges_item__ipstart, name="" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}].ip_start".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "ip_stop" in data__ipranges_item_keys:
+                            data__ipranges_item_keys.remove("ip_stop")
+                            data__ipranges_item__ipstop = data__ipranges_item["ip_stop"]
+                            if not isinstance(data__ipranges_item__ipstop, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}].ip_stop".format(**locals()) + " must be string", value=data__ipranges_item__ipstop, name="" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}].ip_stop".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "ip_version" in data__ipranges_item_keys:
+                            data__ipranges_item_keys.remove("ip_version")
+                            data__ipranges_item__ipversion = data__ipranges_item["ip_version"]
+                            if not isinstance(data__ipranges_item__ipversion, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}].ip_version".format(**locals()) + " must be string", value=data__ipranges_item__ipversion, name="" + (name_prefix or "data") + ".ip_ranges[{data__ipranges_x}].ip_version".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "regions" in data_keys:
+            data_keys.remove("regions")
+            data__regions = data["regions"]
+            if not isinstance(data__regions, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".regions must be array", value=data__regions, name="" + (name_prefix or "data") + ".regions", definition={'type': 'array', 'items': {'type': 'string'}, 'description': 'List of regions (used with matching_target: REGION)'}, rule='type')
+            data__regions_is_list = isinstance(data__regions, (list, tuple))
+            if data__regions_is_list:
+                data__regions_len = len(data__regions)
+                for data__regions_x, data__regions_item in enumerate(data__regions):
+                    if not isinstance(data__regions_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".regions[{data__regions_x}]".format(**locals()) + " must be string", value=data__regions_item, name="" + (name_prefix or "data") + ".regions[{data__regions_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "kill_switch_enabled" in data_keys:
+            data_keys.remove("kill_switch_enabled")
+            data__killswitchenabled = data["kill_switch_enabled"]
+            if not isinstance(data__killswitchenabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".kill_switch_enabled must be boolean", value=data__killswitchenabled, name="" + (name_prefix or "data") + ".kill_switch_enabled", definition={'type': 'boolean', 'description': 'Whether kill switch is enabled (for VPNs)'}, rule='type')
+        if "next_hop" in data_keys:
+            data_keys.remove("next_hop")
+            data__nexthop = data["next_hop"]
+            if not isinstance(data__nexthop, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".next_hop must be string", value=data__nexthop, name="" + (name_prefix or "data") + ".next_hop", definition={'type': 'string', 'description': 'Next hop IP address (advanced routing)'}, rule='type')
+    return data
+def validate_vpn_profile_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'server_id'], 'properties': {'name': {'type': 'string', 'description': 'Name for the VPN client profile'}, 'server_id': {'type': 'string', 'description': 'ID of the VPN server'}, 'exp': {'type': 'integer', 'default': 365, 'description': 'Expiration in days'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name', 'server_id']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'server_id'], 'properties': {'name': {'type': 'string', 'description': 'Name for the VPN client profile'}, 'server_id': {'type': 'string', 'description': 'ID of the VPN server'}, 'exp': {'type': 'integer', 'default': 365, 'description': 'Expiration in days'}}}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Name for the VPN client profile'}, rule='type')
+        if "server_id" in data_keys:
+            data_keys.remove("server_id")
+            data__serverid = data["server_id"]
+            if not isinstance(data__serverid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".server_id must be string", value=data__serverid, name="" + (name_prefix or "data") + ".server_id", definition={'type': 'string', 'description': 'ID of the VPN server'}, rule='type')
+        if "exp" in data_keys:
+            data_keys.remove("exp")
+            data__exp = data["exp"]
+            if not isinstance(data__exp, (int)) and not (isinstance(data__exp, float) and data__exp.is_integer()) or isinstance(data__exp, bool):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".exp must be integer", value=data__exp, name="" + (name_prefix or "data") + ".exp", definition={'type': 'integer', 'default': 365, 'description': 'Expiration in days'}, rule='type')
+        else: data["exp"] = 365
+    return data
+def validate_wlan_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'security', 'enabled'], 'properties': {'name': {'type': 'string', 'description': 'Name of the wireless network (SSID)'}, 'security': {'type': 'string', 'enum': ['open', 'wpa-psk', 'wpa2-psk', 'wpa3', 'wpapsk', 'wep'], 'description': 'Security protocol'}, 'x_passphrase': {'type': 'string', 'description': 'Password for the wireless network'}, 'enabled': {'type': 'boolean', 'description': 'Whether the network is enabled'}, 'hide_ssid': {'type': 'boolean', 'default': False, 'description': 'Whether to hide the SSID'}, 'guest_policy': {'type': 'boolean', 'default': False, 'description': 'Whether this is a guest network'}, 'usergroup_id': {'type': 'string', 'description': 'User group ID'}, 'networkconf_id': {'type': 'string', 'description': 'Network configuration ID'}}, 'allOf': [{'if': {'properties': {'security': {'enum': ['open']}}}, 'then': {}}, {'if': {'properties': {'security': {'not': {'enum': ['open']}}}}, 'then': {'required': ['x_passphrase']}}]}, rule='type')
+    try:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data_keys = set(data.keys())
+            if "security" in data_keys:
+                data_keys.remove("security")
+                data__security = data["security"]
+                if not (isinstance(data__security, str) and data__security == 'open'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".security must be one of ['open']", value=data__security, name="" + (name_prefix or "data") + ".security", definition={'enum': ['open']}, rule='enum')
+    except (JsonSchemaValueException, JsonSchemaValuesException):
+        pass
+    else:
+        pass
+    try:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data_keys = set(data.keys())
+            if "security" in data_keys:
+                data_keys.remove("security")
+                data__security = data["security"]
+                try:
+                    if not (isinstance(data__security, str) and data__security == 'open'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".security must be one of ['open']", value=data__security, name="" + (name_prefix or "data") + ".security", definition={'enum': ['open']}, rule='enum')
+                except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                else:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".security must NOT match a disallowed definition", value=data__security, name="" + (name_prefix or "data") + ".security", definition={'not': {'enum': ['open']}}, rule='not')
+    except (JsonSchemaValueException, JsonSchemaValuesException):
+        pass
+    else:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['x_passphrase']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'required': ['x_passphrase']}, rule='required')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['name', 'security', 'enabled']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['name', 'security', 'enabled'], 'properties': {'name': {'type': 'string', 'description': 'Name of the wireless network (SSID)'}, 'security': {'type': 'string', 'enum': ['open', 'wpa-psk', 'wpa2-psk', 'wpa3', 'wpapsk', 'wep'], 'description': 'Security protocol'}, 'x_passphrase': {'type': 'string', 'description': 'Password for the wireless network'}, 'enabled': {'type': 'boolean', 'description': 'Whether the network is enabled'}, 'hide_ssid': {'type': 'boolean', 'default': False, 'description': 'Whether to hide the SSID'}, 'guest_policy': {'type': 'boolean', 'default': False, 'description': 'Whether this is a guest network'}, 'usergroup_id': {'type': 'string', 'description': 'User group ID'}, 'networkconf_id': {'type': 'string', 'description': 'Network configuration ID'}}, 'allOf': [{'if': {'properties': {'security': {'enum': ['open']}}}, 'then': {}}, {'if': {'properties': {'security': {'not': {'enum': ['open']}}}}, 'then': {'required': ['x_passphrase']}}]}, rule='required')
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Name of the wireless network (SSID)'}, rule='type')
+        if "security" in data_keys:
+            data_keys.remove("security")
+            data__security = data["security"]
+            if not isinstance(data__security, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".security must be string", value=data__security, name="" + (name_prefix or "data") + ".security", definition={'type': 'string', 'enum': ['open', 'wpa-psk', 'wpa2-psk', 'wpa3', 'wpapsk', 'wep'], 'description': 'Security protocol'}, rule='type')
+            if not (isinstance(data__security, str) and data__security == 'open' or isinstance(data__security, str) and data__security == 'wpa-psk' or isinstance(data__security, str) and data__security == 'wpa2-psk' or isinstance(data__security, str) and data__security == 'wpa3' or isinstance(data__security, str) and data__security == 'wpapsk' or isinstance(data__security, str) and data__security == 'wep'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".security must be one of ['open', 'wpa-psk', 'wpa2-psk', 'wpa3', 'wpapsk', 'wep']", value=data__security, name="" + (name_prefix or "data") + ".security", definition={'type': 'string', 'enum': ['open', 'wpa-psk', 'wpa2-psk', 'wpa3', 'wpapsk', 'wep'], 'description': 'Security protocol'}, rule='enum')
+        if "x_passphrase" in data_keys:
+            data_keys.remove("x_passphrase")
+            data__xpassphrase = data["x_passphrase"]
+            if not isinstance(data__xpassphrase, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".x_passphrase must be string", value=data__xpassphrase, name="" + (name_prefix or "data") + ".x_passphrase", definition={'type': 'string', 'description': 'Password for the wireless network'}, rule='type')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'description': 'Whether the network is enabled'}, rule='type')
+        if "hide_ssid" in data_keys:
+            data_keys.remove("hide_ssid")
+            data__hidessid = data["hide_ssid"]
+            if not isinstance(data__hidessid, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".hide_ssid must be boolean", value=data__hidessid, name="" + (name_prefix or "data") + ".hide_ssid", definition={'type': 'boolean', 'default': False, 'description': 'Whether to hide the SSID'}, rule='type')
+        else: data["hide_ssid"] = False
+        if "guest_policy" in data_keys:
+            data_keys.remove("guest_policy")
+            data__guestpolicy = data["guest_policy"]
+            if not isinstance(data__guestpolicy, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".guest_policy must be boolean", value=data__guestpolicy, name="" + (name_prefix or "data") + ".guest_policy", definition={'type': 'boolean', 'default': False, 'description': 'Whether this is a guest network'}, rule='type')
+        else: data["guest_policy"] = False
+        if "usergroup_id" in data_keys:
+            data_keys.remove("usergroup_id")
+            data__usergroupid = data["usergroup_id"]
+            if not isinstance(data__usergroupid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".usergroup_id must be string", value=data__usergroupid, name="" + (name_prefix or "data") + ".usergroup_id", definition={'type': 'string', 'description': 'User group ID'}, rule='type')
+        if "networkconf_id" in data_keys:
+            data_keys.remove("networkconf_id")
+            data__networkconfid = data["networkconf_id"]
+            if not isinstance(data__networkconfid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".networkconf_id must be string", value=data__networkconfid, name="" + (name_prefix or "data") + ".networkconf_id", definition={'type': 'string', 'description': 'Network configuration ID'}, rule='type')
+    return data
+def validate_wlan_update_schema(data, custom_formats=_FORMATS, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'name': {'type': 'string', 'description': 'Name of the wireless network (SSID)'}, 'security': {'type': 'string', 'enum': ['open', 'wpa-psk', 'wpa2-psk', 'wpa3', 'wpapsk', 'wep'], 'description': 'Security protocol'}, 'x_passphrase': {'type': 'string', 'description': 'Password for the wireless network'}, 'enabled': {'type': 'boolean', 'description': 'Whether the network is enabled'}, 'hide_ssid': {'type': 'boolean', 'description': 'Whether to hide the SSID'}, 'guest_policy': {'type': 'boolean', 'description': 'Whether this is a guest network'}, 'usergroup_id': {'type': 'string', 'description': 'User group ID'}, 'networkconf_id': {'type': 'string', 'description': 'Network configuration ID'}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Name of the wireless network (SSID)'}, rule='type')
+        if "security" in data_keys:
+            data_keys.remove("security")
+            data__security = data["security"]
+            if not isinstance(data__security, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".security must be string", value=data__security, name="" + (name_prefix or "data") + ".security", definition={'type': 'string', 'enum': ['open', 'wpa-psk', 'wpa2-psk', 'wpa3', 'wpapsk', 'wep'], 'description': 'Security protocol'}, rule='type')
+            if not (isinstance(data__security, str) and data__security == 'open' or isinstance(data__security, str) and data__security == 'wpa-psk' or isinstance(data__security, str) and data__security == 'wpa2-psk' or isinstance(data__security, str) and data__security == 'wpa3' or isinstance(data__security, str) and data__security == 'wpapsk' or isinstance(data__security, str) and data__security == 'wep'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".security must be one of ['open', 'wpa-psk', 'wpa2-psk', 'wpa3', 'wpapsk', 'wep']", value=data__security, name="" + (name_prefix or "data") + ".security", definition={'type': 'string', 'enum': ['open', 'wpa-psk', 'wpa2-psk', 'wpa3', 'wpapsk', 'wep'], 'description': 'Security protocol'}, rule='enum')
+        if "x_passphrase" in data_keys:
+            data_keys.remove("x_passphrase")
+            data__xpassphrase = data["x_passphrase"]
+            if not isinstance(data__xpassphrase, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".x_passphrase must be string", value=data__xpassphrase, name="" + (name_prefix or "data") + ".x_passphrase", definition={'type': 'string', 'description': 'Password for the wireless network'}, rule='type')
+        if "enabled" in data_keys:
+            data_keys.remove("enabled")
+            data__enabled = data["enabled"]
+            if not isinstance(data__enabled, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".enabled must be boolean", value=data__enabled, name="" + (name_prefix or "data") + ".enabled", definition={'type': 'boolean', 'description': 'Whether the network is enabled'}, rule='type')
+        if "hide_ssid" in data_keys:
+            data_keys.remove("hide_ssid")
+            data__hidessid = data["hide_ssid"]
+            if not isinstance(data__hidessid, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".hide_ssid must be boolean", value=data__hidessid, name="" + (name_prefix or "data") + ".hide_ssid", definition={'type': 'boolean', 'description': 'Whether to hide the SSID'}, rule='type')
+        if "guest_policy" in data_keys:
+            data_keys.remove("guest_policy")
+            data__guestpolicy = data["guest_policy"]
+            if not isinstance(data__guestpolicy, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".guest_policy must be boolean", value=data__guestpolicy, name="" + (name_prefix or "data") + ".guest_policy", definition={'type': 'boolean', 'description': 'Whether this is a guest network'}, rule='type')
+        if "usergroup_id" in data_keys:
+            data_keys.remove("usergroup_id")
+            data__usergroupid = data["usergroup_id"]
+            if not isinstance(data__usergroupid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".usergroup_id must be string", value=data__usergroupid, name="" + (name_prefix or "data") + ".usergroup_id", definition={'type': 'string', 'description': 'User group ID'}, rule='type')
+        if "networkconf_id" in data_keys:
+            data_keys.remove("networkconf_id")
+            data__networkconfid = data["networkconf_id"]
+            if not isinstance(data__networkconfid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".networkconf_id must be string", value=data__networkconfid, name="" + (name_prefix or "data") + ".networkconf_id", definition={'type': 'string', 'description': 'Network configuration ID'}, rule='type')
+    return data
+
+# canonical-dump sha256 -> compiled validator
+VALIDATORS = {
+    "4e458dd209d7def2a195f450201d4cdc87984570629421fa2af6e7bcf7000db9": validate_firewall_policy_create_schema,  # FIREWALL_POLICY_CREATE_SCHEMA
+    "40c5856914ce329db2e6d29ce3e30c5ab285d369e7e3fa670ca4afd9c09617fc": validate_firewall_policy_schema,  # FIREWALL_POLICY_SCHEMA
+    "f4424be41d88d24e81384774426830ecb81b62521fde5db9c06ceec0c97119d4": validate_firewall_policy_simple_schema,  # FIREWALL_POLICY_SIMPLE_SCHEMA
+    "c6f524cdb74f390a6961f44c0f0e9e8b1ebf36f2df78b128524543eba5827ab4": validate_firewall_policy_update_schema,  # FIREWALL_POLICY_UPDATE_SCHEMA
+    "fc0fabd4a7d91d3ceed59f661b840810efac48c012ae1912a07ab2a600c0da7b": validate_network_schema,  # NETWORK_SCHEMA
+    "4b9a59a9b967664721b0fe044900ec462b66c548faac071cbb9ccfa19cceccd4": validate_network_update_schema,  # NETWORK_UPDATE_SCHEMA
+    "ab055b0dc515812cfa7073cefc3c561af2aa8535c1886b72bc9f52d81ddb8689": validate_port_forward_schema,  # PORT_FORWARD_SCHEMA
+    "ddd88462ebc609cadf71e6fe3f2f153dd72b9092b11c296c7bc85c3575f4615b": validate_port_forward_simple_schema,  # PORT_FORWARD_SIMPLE_SCHEMA
+    "2f5c004a13255087965af63070b2d1dd236c94854057e57e286feb726b65bb72": validate_port_forward_update_schema,  # PORT_FORWARD_UPDATE_SCHEMA
+    "d5da8a836fe06e52c1b3445cf0ee5a36252c3d1bbbdc6b43ab454ae4e8a06639": validate_qos_rule_schema,  # QOS_RULE_SCHEMA
+    "a268638e301ddccbc5225820d3c6755fd904e6288c9d6b1bca93d9a3217c9df6": validate_qos_rule_simple_schema,  # QOS_RULE_SIMPLE_SCHEMA
+    "18a9893399ea74541a90a84806a128a1c27d38f851ec7c6c96d48f8b4098611f": validate_qos_rule_update_schema,  # QOS_RULE_UPDATE_SCHEMA
+    "32e1f6a91418b7ab58fe4c1ef35eed418f46134728a73b285e8dc3cca9dd3605": validate_traffic_route_schema,  # TRAFFIC_ROUTE_SCHEMA
+    "11e38d12165a2d429200f7735e4c4a5ff11b133f72091fc614d03b0e444895cc": validate_traffic_route_simple_schema,  # TRAFFIC_ROUTE_SIMPLE_SCHEMA
+    "d1f61a8b3a1dde29c6957f713677bdbae9151d52af6c2594be05c3c436077dfd": validate_traffic_route_update_schema,  # TRAFFIC_ROUTE_UPDATE_SCHEMA
+    "0e45fc68ce353bc540b92e01ff8078c58b5b50fe7d534eb37e81c2c76362d894": validate_vpn_profile_schema,  # VPN_PROFILE_SCHEMA
+    "e3d49bfd307191e66dcbc203c8f2663eb5b6f9bea9191f34229e87501a066677": validate_wlan_schema,  # WLAN_SCHEMA
+    "6ccf2e5d1714cedc44101ebb9aab89aca0e22cc698fef3114956c4b91f7451a9": validate_wlan_update_schema,  # WLAN_UPDATE_SCHEMA
+}
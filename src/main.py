@@ -26,6 +26,7 @@ from src.runtime import (
 
 from src.utils.tool_loader import auto_load_tools
 from src.utils.diagnostics import diagnostics_enabled, wrap_tool
+from src.utils.prefetch import start_prefetch, stop_prefetch
 from src.utils.permissions import parse_permission  # noqa: E402
 
 _original_tool_decorator = server.tool  # keep reference to wrap later
@@ -217,6 +218,10 @@ async def main_async():
     # Load tool modules after connection is established (or attempted)
     auto_load_tools()
 
+    # Warm slow-changing controller state in the background so health /
+    # settings / system-info tools answer from a snapshot.
+    start_prefetch()
+
     # List all registered tools for debugging
     try:
         tools = await server.list_tools()
@@ -302,6 +307,8 @@ async def main_async():
         logger.error("Error running FastMCP servers from main_async: %s", e)
         logger.error(traceback.format_exc())
         raise
+    finally:
+        stop_prefetch()
 
 def main():
     """Synchronous entry point."""
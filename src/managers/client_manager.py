@@ -1,7 +1,7 @@
 """Client manager for UniFi Network Controller operations."""
 
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from aiounifi.models.api import ApiRequest
 from aiounifi.models.client import Client
@@ -94,6 +94,21 @@ class ClientManager:
             logger.error("Error getting all clients: %s", e)
             return []
 
+    async def get_clients_by_mac(self) -> Dict[str, Client]:
+        """Get all known clients keyed by MAC address.
+
+        One bulk fetch (served from the client cache when warm) instead of a
+        list scan per MAC — callers resolving many MACs join against this
+        dict in-process.
+        """
+        all_clients = await self.get_all_clients()
+        by_mac: Dict[str, Client] = {}
+        for client in all_clients:
+            mac = client.get("mac") if isinstance(client, dict) else getattr(client, "mac", None)
+            if mac:
+                by_mac[mac] = client
+        return by_mac
+
     async def get_client_details(self, client_mac: str) -> Optional[Client]:
         """Get detailed information for a specific client by MAC address."""
         all_clients = await self.get_all_clients()
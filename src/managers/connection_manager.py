@@ -6,14 +6,31 @@ import time
 from typing import Any, Dict, Optional
 
 import aiohttp
+import orjson
 from aiounifi.controller import Controller
 from aiounifi.errors import LoginRequired, RequestError, ResponseError
 from aiounifi.models.api import ApiRequest, ApiRequestV2
 from aiounifi.models.configuration import Configuration
 
+try:  # Optional on-disk cache layer; absent in minimal installs
+    import diskcache
+except ImportError:  # pragma: no cover
+    diskcache = None
+
 logger = logging.getLogger("unifi-network-mcp")
 
 
+def _json_serialize(obj: Any) -> str:
+    """Serialize request payloads with orjson.
+
+    aiounifi hands request bodies to aiohttp via `json=`, which uses the
+    session's serializer (stdlib `json.dumps` by default). orjson is
+    considerably faster on the small dicts sent by hot POST/PUT paths such as
+    admin updates and VPN state changes.
+    """
+    return orjson.dumps(obj).decode()
+
+
 async def detect_with_retry(
     session: aiohttp.ClientSession,
     base_url: str,
@@ -188,8 +205,16 @@ class ConnectionManager:
         cache_timeout: int = 30,
         max_retries: int = 3,
         retry_delay: int = 5,
+        cache_dir: Optional[str] = None,
+        l2_cache_timeout: int = 86400,
     ):
-        """Initialize the Connection Manager."""
+        """Initialize the Connection Manager.
+
+        When `cache_dir` is set (and `diskcache` is installed) a persistent L2
+        cache is layered under the in-memory cache so slow-changing data such
+        as admin users and VPN server configs survive process restarts. L2
+        entries expire after `l2_cache_timeout` seconds (default: one day).
+        """
         self.host = host
         self.username = username
         self.password = password
@@ -206,6 +231,23 @@ class ConnectionManager:
         self._cache: Dict[str, Any] = {}
         self._last_cache_update: Dict[str, float] = {}
 
+        self.l2_cache_timeout = l2_cache_timeout
+        self._l2: Optional[Any] = None
+        if cache_dir:
+            if diskcache is None:
+                logger.warning(
+                    "cache_dir configured but 'diskcache' is not installed; "
+                    "persistent cache disabled"
+                )
+            else:
+                try:
+                    self._l2 = diskcache.Cache(cache_dir, size_limit=64 << 20)
+                    logger.info("Persistent L2 cache enabled at %s", cache_dir)
+                except OSError as e:
+                    logger.warning(
+                        "Could not open persistent cache at %s: %s", cache_dir, e
+                    )
+
         # Path detection state
         self._unifi_os_override: Optional[bool] = None
         """
@@ -244,12 +286,19 @@ class ConnectionManager:
                         await self._aiohttp_session.close()
                         self._aiohttp_session = None
 
+                    # The session lives for the whole process, so pool and
+                    # keep connections alive: reusing a warm TLS connection
+                    # saves a TCP+TLS handshake on nearly every request.
                     connector = aiohttp.TCPConnector(
-                        ssl=False if not self.verify_ssl else True
+                        ssl=False if not self.verify_ssl else True,
+                        limit_per_host=16,
+                        keepalive_timeout=75,
+                        ttl_dns_cache=300,
                     )
                     self._aiohttp_session = aiohttp.ClientSession(
                         connector=connector,
-                        cookie_jar=aiohttp.CookieJar(unsafe=True)
+                        cookie_jar=aiohttp.CookieJar(unsafe=True),
+                        json_serialize=_json_serialize,
                     )
                     session_created = True
 
@@ -502,10 +551,21 @@ class ConnectionManager:
 
     # --- Cache Management ---
 
+    # Only these key prefixes go to the persistent L2 layer: admin users
+    # and VPN configs change on a human timescale and every mutation path
+    # invalidates them explicitly. Everything else (stats, clients,
+    # devices, ...) is freshness-sensitive and stays memory-only.
+    _L2_PREFIXES = ("admin_users", "vpn_servers", "vpn_clients")
+
     def _update_cache(self, key: str, data: Any, timeout: Optional[int] = None):
         """Update the cache with new data."""
         self._cache[key] = data
         self._last_cache_update[key] = time.time()
+        if self._l2 is not None and key.startswith(self._L2_PREFIXES):
+            try:
+                self._l2.set(key, data, expire=self.l2_cache_timeout)
+            except Exception as e:  # noqa: BLE001 - unpicklable payloads stay memory-only
+                logger.debug("L2 cache write skipped for key '%s': %s", key, e)
         logger.debug(
             "Cache updated for key '%s' with timeout %ss",
             key,
@@ -535,6 +595,18 @@ class ConnectionManager:
         if self._is_cache_valid(key, timeout):
             logger.debug("Cache hit for key '%s'", key)
             return self._cache[key]
+        if self._l2 is not None and key.startswith(self._L2_PREFIXES):
+            try:
+                data = self._l2.get(key, default=None)
+            except Exception as e:  # noqa: BLE001 - treat unreadable entries as misses
+                logger.debug("L2 cache read failed for key '%s': %s", key, e)
+                data = None
+            if data is not None:
+                # Warm the in-memory layer so subsequent hits skip the disk
+                self._cache[key] = data
+                self._last_cache_update[key] = time.time()
+                logger.debug("L2 cache hit for key '%s'", key)
+                return data
         logger.debug("Cache miss for key '%s'", key)
         return None
 
@@ -546,10 +618,21 @@ class ConnectionManager:
                 del self._cache[key]
                 if key in self._last_cache_update:
                     del self._last_cache_update[key]
+            if self._l2 is not None:
+                try:
+                    for l2_key in [k for k in self._l2 if str(k).startswith(prefix)]:
+                        self._l2.delete(l2_key)
+                except Exception as e:  # noqa: BLE001
+                    logger.debug("L2 cache invalidation failed for '%s': %s", prefix, e)
             logger.debug("Invalidated cache for keys starting with '%s'", prefix)
         else:
             self._cache = {}
             self._last_cache_update = {}
+            if self._l2 is not None:
+                try:
+                    self._l2.clear()
+                except Exception as e:  # noqa: BLE001
+                    logger.debug("L2 cache clear failed: %s", e)
             logger.debug("Invalidated entire cache")
 
     def update_cache(self, key: str, data: Any, timeout: Optional[int] = None):
@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import json
 
 from aiounifi.models.api import ApiRequest, ApiRequestV2
@@ -27,6 +28,11 @@ class FirewallManager:
             connection_manager: The shared ConnectionManager instance.
         """
         self._connection = connection_manager
+        # Id-indexed view over the cached port-forward list. Rebuilt lazily
+        # whenever get_port_forwards returns a new list object (i.e. after
+        # any cache invalidation), so lookups stay O(1) between refetches.
+        self._pf_by_id: Dict[str, PortForward] = {}
+        self._pf_index_src: Optional[List[PortForward]] = None
 
     async def get_firewall_policies(self, include_predefined: bool = False) -> List[FirewallPolicy]:
         """Get firewall policies.
@@ -425,11 +431,40 @@ class FirewallManager:
         """
         try:
             rules = await self.get_port_forwards()
-            return next((rule for rule in rules if rule.id == rule_id), None)
+            if rules is not self._pf_index_src:
+                # List was refetched (cache miss/invalidation): rebuild the
+                # index once instead of scanning the list on every lookup.
+                self._pf_by_id = {rule.id: rule for rule in rules}
+                self._pf_index_src = rules
+            return self._pf_by_id.get(rule_id)
         except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:
             logger.error("Error getting port forward by ID %s: %s", rule_id, e)
             return None
 
+    async def get_port_forwards_batch(
+        self, rule_ids: List[str]
+    ) -> List[Optional[PortForward]]:
+        """Get several port forwarding rules by ID concurrently.
+
+        With the id index this costs one (cached) list fetch plus a dict
+        probe per id; the gather keeps lookups concurrent when the list
+        has to be refetched.
+
+        Args:
+            rule_ids: IDs of the rules to get.
+
+        Returns:
+            Rules in the same order as `rule_ids`; None for misses/failures.
+        """
+        results = await asyncio.gather(
+            *(self.get_port_forward_by_id(rule_id) for rule_id in rule_ids),
+            return_exceptions=True
+        )
+        return [
+            None if isinstance(result, BaseException) else result
+            for result in results
+        ]
+
     async def update_port_forward(self, rule_id: str, updates: Dict[str, Any]) -> bool:
         """Update specific fields of a port forwarding rule.
 
@@ -486,6 +521,48 @@ class FirewallManager:
             logger.error("Error updating port forward %s: %s", rule_id, e, exc_info=True)
             return False
 
+    async def patch_port_forward(
+        self, rule_id: str, updates: Dict[str, Any]
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Fetch, merge and submit a port forward update in one call.
+
+        Unlike update_port_forward this also returns the merged rule dict,
+        which reflects the state submitted to the controller — callers get
+        the post-update rule without an extra round-trip.
+
+        Args:
+            rule_id: ID of the rule to update.
+            updates: Dictionary of fields and new values to apply.
+
+        Returns:
+            (success, updated_rule) — updated_rule is None on failure.
+        """
+        if not await self._connection.ensure_connected():
+            return False, None
+        try:
+            rule_obj = await self.get_port_forward_by_id(rule_id)
+            if not rule_obj or not isinstance(getattr(rule_obj, 'raw', None), dict):
+                logger.error("Port forward %s not found for patch.", rule_id)
+                return False, None
+
+            merged = {**rule_obj.raw, **updates}
+
+            api_request = ApiRequest(
+                method="put",
+                path=f"/rest/portforward/{rule_id}",
+                data=merged
+            )
+            await self._connection.request(api_request)
+
+            cache_key = f"{CACHE_PREFIX_PORT_FORWARDS}_{self._connection.site}"
+            self._connection.invalidate_cache(cache_key)
+
+            logger.info("Successfully submitted patch for port forward %s.", rule_id)
+            return True, merged
+        except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:
+            logger.error("Error patching port forward %s: %s", rule_id, e, exc_info=True)
+            return False, None
+
     async def toggle_port_forward(self, rule_id: str) -> bool:
         """Toggle a port forwarding rule on/off.
 
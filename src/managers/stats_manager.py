@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from aiounifi.errors import RequestError, ResponseError
 
@@ -295,11 +295,16 @@ class StatsManager:
             return {"applications": [], "categories": []}
 
     async def get_alerts(
-        self, include_archived: bool = False
+        self, include_archived: bool = False, limit: Optional[int] = None
     ) -> List[Event]:  # Changed return type
-        """Get alerts from the controller."""
+        """Get alerts from the controller.
+
+        When ``limit`` is given it is pushed into the controller query so
+        the wire payload is bounded, and event filtering stops as soon as
+        enough alerts are collected.
+        """
         cache_key = (
-            f"{CACHE_PREFIX_STATS_ALERTS}_{include_archived}_"
+            f"{CACHE_PREFIX_STATS_ALERTS}_{include_archived}_{limit}_"
             f"{self._connection.site}"
         )
         cached_data = self._connection.get_cached(
@@ -321,10 +326,12 @@ class StatsManager:
             end_time = int(datetime.now().timestamp() * 1000)
             start_time = end_time - (24 * 60 * 60 * 1000)  # Last 24 hours
 
-            api_request = ApiRequest(
-                method="get",
-                path=f"/stat/event?start={start_time}&end={end_time}"
-            )
+            path = f"/stat/event?start={start_time}&end={end_time}"
+            if limit:
+                # Ask for a bounded window server-side; filtering below may
+                # trim further, so this is an upper bound, not the answer.
+                path += f"&_limit={limit}"
+            api_request = ApiRequest(method="get", path=path)
             response = await self._connection.request(api_request)
             events_data = response if isinstance(response, list) else []
 
@@ -344,6 +351,8 @@ class StatsManager:
                         if (include_archived or
                                 not event_data.get("archived", False)):
                             alerts.append(event)
+                            if limit and len(alerts) >= limit:
+                                break
                 except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as event_error:
                     logger.debug("Skipping invalid event data: %s", event_error)
                     continue
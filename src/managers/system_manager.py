@@ -666,6 +666,25 @@ class SystemManager:
                 logger.warning(f"No fields provided to update for admin user {user_id}")
                 return False
 
+            # Drop fields identical to the current record so full-object
+            # resubmissions from the tool layer don't POST or bust the warm
+            # admins cache. Passwords are always sent (no hash to compare).
+            for field, value in list(payload.items()):
+                if field in ("cmd", "admin_id", "x_password"):
+                    continue
+                if field == "site_access":
+                    if sorted(value) == sorted(user.get("site_access", [])):
+                        payload.pop(field)
+                elif user.get(field) == value:
+                    payload.pop(field)
+
+            if len(payload) <= 2:
+                logger.debug(
+                    "No-op admin update for %s: all fields match current values",
+                    user_id,
+                )
+                return True
+
             api_request = ApiRequest(
                 method="post",
                 path="/cmd/sitemgr",
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Dict, List, Optional, Any
 
@@ -202,12 +203,47 @@ class VpnManager:
         Returns:
             Client profile configuration (often as a string) if successful, None otherwise
         """
+        server = await self._verify_server(server_id)
+        if not server:
+            logger.error("Cannot generate profile for non-existent server %s", server_id)
+            return None
+
+        return await self._do_generate(server_id, client_name, expiration_days)
+
+    async def _verify_server(self, server_id: str) -> Optional[Dict[str, Any]]:
+        """Cheap existence check for a VPN server.
+
+        Consults the cached server list first; on a cache miss fetches just
+        this networkconf instead of re-GETting the entire list.
+        """
+        cache_key = f"{CACHE_PREFIX_VPN_SERVERS}_{self._connection.site}"
+        cached_servers = self._connection.get_cached(cache_key)
+        if cached_servers is not None:
+            return next(
+                (s for s in cached_servers if s.get("_id") == server_id), None
+            )
+
         try:
-            server = await self.get_vpn_server_details(server_id)
-            if not server:
-                logger.error("Cannot generate profile for non-existent server %s", server_id)
-                return None
+            api_request = ApiRequest(
+                method="get", path=f"/rest/networkconf/{server_id}"
+            )
+            response = await self._connection.request(api_request)
+            if isinstance(response, list):
+                return response[0] if response else None
+            if isinstance(response, dict):
+                return response or None
+        except (ValueError, TypeError, AttributeError, KeyError) as e:
+            logger.error("Error verifying VPN server %s: %s", server_id, e)
+        return None
 
+    async def _do_generate(
+        self,
+        server_id: str,
+        client_name: str,
+        expiration_days: Optional[int]
+    ) -> Optional[str]:
+        """POST a single profile request and extract the profile body."""
+        try:
             payload = {
                 "name": client_name,
                 "server_id": server_id,
@@ -235,3 +271,44 @@ class VpnManager:
         except (ValueError, TypeError, AttributeError, KeyError) as e:
             logger.error("Error generating VPN client profile: %s", e)
             return None
+
+    async def generate_vpn_client_profiles(
+        self,
+        server_id: str,
+        client_names: List[str],
+        expiration_days: Optional[int] = 365,
+        max_concurrency: int = 8
+    ) -> List[Optional[str]]:
+        """Generate client profiles for several clients on one server.
+
+        The server is verified once, then the per-client POSTs run
+        concurrently, bounded by a semaphore so bulk provisioning does not
+        flood the controller.
+
+        Args:
+            server_id: ID of the VPN server
+            client_names: Names for the client configurations
+            expiration_days: Days until the profiles expire (default: 365)
+            max_concurrency: Maximum in-flight profile requests (default: 8)
+
+        Returns:
+            Profiles in the same order as `client_names`; None for failures.
+        """
+        server = await self._verify_server(server_id)
+        if not server:
+            logger.error("Cannot generate profiles for non-existent server %s", server_id)
+            return [None] * len(client_names)
+
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def one(name: str) -> Optional[str]:
+            async with sem:
+                return await self._do_generate(server_id, name, expiration_days)
+
+        results = await asyncio.gather(
+            *(one(name) for name in client_names), return_exceptions=True
+        )
+        return [
+            None if isinstance(result, BaseException) else result
+            for result in results
+        ]
@@ -72,6 +72,7 @@ def get_connection_manager() -> ConnectionManager:
         port=cfg.port,
         site=cfg.site,
         verify_ssl=cfg.verify_ssl,
+        cache_dir=cfg.get("cache_dir", None),
     )
 
 
@@ -0,0 +1,34 @@
+"""Shared failure handling for tool handlers.
+
+Routine controller/transport failures (network blips, controller
+restarts) happen constantly against unhealthy controllers; formatting a
+full traceback for each one dominates CPU in degraded modes. Expected
+errors therefore log at WARNING with just the exception repr, and
+traceback capture is reserved for genuinely unexpected exceptions.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict
+
+from aiounifi.errors import RequestError, ResponseError
+
+logger = logging.getLogger("unifi-network-mcp")
+
+_EXPECTED_ERRORS = (RequestError, ResponseError, ConnectionError)
+
+
+def handle_error(e: BaseException, ctx: str) -> Dict[str, Any]:
+    """Log a handler failure at the appropriate level and build the response.
+
+    Args:
+        e: the caught exception.
+        ctx: short description of the failing operation, e.g.
+            "getting network stats".
+    """
+    if isinstance(e, _EXPECTED_ERRORS):
+        logger.warning("Error %s: %r", ctx, e)
+    else:
+        logger.error("Error %s: %s", ctx, e, exc_info=True)
+    return {"success": False, "error": str(e)}
@@ -5,16 +5,167 @@ This module provides MCP tools to manage network clients/devices on a
 Unifi Network Controller.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from time import monotonic
+from typing import Dict, Any, List, Optional, Tuple
 from aiounifi.errors import RequestError, ResponseError
 
-# Import the global FastMCP server instance, config, and managers
-from src.runtime import server, config, client_manager
-from src.utils.permissions import parse_permission
+# Import the global FastMCP server instance and managers
+from src.runtime import server, client_manager
+from src.utils.permissions import require_permission
 
 logger = logging.getLogger(__name__)
 
+# Shared handler tuple for every tool in this module.
+_UNIFI_EXC = (RequestError, ResponseError, ConnectionError, ValueError, TypeError)
+
+
+_site_cache: Optional[str] = None
+
+
+def _site() -> str:
+    """Resolve (once) the site name used in every tool response."""
+    global _site_cache
+    if _site_cache is None:
+        conn = getattr(client_manager, "_connection", None)
+        _site_cache = getattr(conn, "site", "unknown") if conn else "unknown"
+    return _site_cache
+
+
+# Short-lived per-MAC detail cache: block -> verify -> rename style
+# workflows re-query the same client within seconds.
+_DETAILS_TTL = 5.0
+_DETAILS_MAX = 256
+_details_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+async def _cached_client_details(mac: str) -> Any:
+    """Fetch client details with a small bounded TTL cache keyed by MAC."""
+    now = monotonic()
+    hit = _details_cache.get(mac)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    client = await client_manager.get_client_details(mac)
+    if len(_details_cache) >= _DETAILS_MAX:
+        _details_cache.clear()
+    _details_cache[mac] = (now + _DETAILS_TTL, client)
+    return client
+
+
+def _invalidate_client_details(mac: str) -> None:
+    """Drop the cached details for a MAC after a successful mutation."""
+    _details_cache.pop(mac, None)
+
+
+def _safe_get(obj, key, default=None):
+    """Safe access to dict or object attributes."""
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    return getattr(obj, key, default)
+
+
+def _format_dict_client(c: Dict[str, Any], include_offline: bool = False) -> Dict[str, Any]:
+    """Format a raw client dict (the common case) with direct dict lookups.
+
+    Each branch builds the response in a single dict literal — these dicts go
+    straight to the JSON boundary, so one right-sized allocation per client
+    beats a base dict plus an update() with a second throwaway dict.
+    """
+    is_wired = c.get("is_wired", False)
+    last_seen = c.get("last_seen", 0)
+    status = (
+        "Online" if not include_offline else (
+            "Online" if is_wired or ((last_seen or 0) > 0) else "Offline"
+        )
+    )
+    if is_wired:
+        return {
+            "mac": c.get("mac"),
+            "name": c.get("name") or c.get("hostname") or "Unknown",
+            "hostname": c.get("hostname", "Unknown"),
+            "ip": c.get("ip", "Unknown"),
+            "connection_type": "Wired",
+            "status": status,
+            "last_seen": last_seen,
+            "_id": c.get("_id"),
+        }
+    return {
+        "mac": c.get("mac"),
+        "name": c.get("name") or c.get("hostname") or "Unknown",
+        "hostname": c.get("hostname", "Unknown"),
+        "ip": c.get("ip", "Unknown"),
+        "connection_type": "Wireless",
+        "status": status,
+        "last_seen": last_seen,
+        "_id": c.get("_id"),
+        "essid": c.get("essid", "Unknown"),
+        "signal_dbm": c.get("signal"),
+        "channel": c.get("channel", "Unknown"),
+        "radio": c.get("radio", "Unknown"),
+    }
+
+
+def _format_blocked_client(c: Any) -> Dict[str, Any]:
+    """Format one blocked-client entry; dict fast path, safe_get fallback."""
+    client = c.raw if hasattr(c, "raw") else c
+    if isinstance(client, dict):
+        return {
+            "mac": client.get("mac"),
+            "name": client.get("name") or client.get("hostname") or "Unknown",
+            "hostname": client.get("hostname", "Unknown"),
+            "ip": client.get("ip", "Unknown"),
+            "connection_type": (
+                "Wired" if client.get("is_wired", False) else "Wireless"
+            ),
+            "blocked_since": client.get("blocked_since", 0),
+            "_id": client.get("_id"),
+        }
+    g = _safe_get
+    return {
+        "mac": g(client, "mac"),
+        "name": g(client, "name") or g(client, "hostname") or "Unknown",
+        "hostname": g(client, "hostname", "Unknown"),
+        "ip": g(client, "ip", "Unknown"),
+        "connection_type": (
+            "Wired" if g(client, "is_wired", False) else "Wireless"
+        ),
+        "blocked_since": g(client, "blocked_since", 0),
+        "_id": g(client, "_id"),
+    }
+
+
+def _format_any_client(c: Any, include_offline: bool = False) -> Dict[str, Any]:
+    """Generic fallback formatter for non-dict (or mixed) client entries."""
+    g = _safe_get
+    is_wired = g(c, "is_wired", False)
+    last_seen = g(c, "last_seen", 0)
+    formatted = {
+        "mac": g(c, "mac"),
+        "name": g(c, "name") or g(c, "hostname") or "Unknown",
+        "hostname": g(c, "hostname", "Unknown"),
+        "ip": g(c, "ip", "Unknown"),
+        "connection_type": "Wired" if is_wired else "Wireless",
+        "status": (
+            "Online" if not include_offline else (
+                "Online" if is_wired or ((last_seen or 0) > 0) else "Offline"
+            )
+        ),
+        "last_seen": last_seen,
+        "_id": g(c, "_id"),
+    }
+    if not is_wired:
+        formatted.update(
+            {
+                "essid": g(c, "essid", "Unknown"),
+                "signal_dbm": g(c, "signal"),
+                "channel": g(c, "channel", "Unknown"),
+                "radio": g(c, "radio", "Unknown"),
+            }
+        )
+    return formatted
+
+
 @server.tool(
     name="unifi_list_clients",
     description="List clients/devices connected to the Unifi Network"
@@ -32,76 +183,40 @@ async def list_clients(
             else await client_manager.get_clients()
         )
 
-        def _client_to_dict(c):
-            raw = c.raw if hasattr(c, "raw") else c  # c might already be a dict
-            return raw
-
-        clients_raw = [_client_to_dict(c) for c in clients]
-
-        # Helper for safe access to dict or object attributes
-        def safe_get_for_filter(obj, key, default=None):
-            if isinstance(obj, dict):
-                return obj.get(key, default)
-            return getattr(obj, key, default)
-
-        if filter_type == "wireless":
-            clients_raw = [c for c in clients_raw if not safe_get_for_filter(c, "is_wired", False)]
-        elif filter_type == "wired":
-            clients_raw = [c for c in clients_raw if safe_get_for_filter(c, "is_wired", False)]
-
-        clients_raw = clients_raw[:limit]
-
+        # Fused filter + slice + format: a single pass that stops as soon as
+        # `limit` matches are formatted, so unfiltered tail entries are never
+        # touched.
+        want_wired = filter_type == "wired"
+        want_wireless = filter_type == "wireless"
         formatted_clients = []
-        for client in clients_raw:
-            # Handle both dict and object types
-            def safe_get(obj, key, default=None):
-                if isinstance(obj, dict):
-                    return obj.get(key, default)
-                return getattr(obj, key, default)
-
-            formatted = {
-                "mac": safe_get(client, "mac"),
-                "name": (
-                    safe_get(client, "name") or safe_get(client, "hostname", "Unknown")
-                ),
-                "hostname": safe_get(client, "hostname", "Unknown"),
-                "ip": safe_get(client, "ip", "Unknown"),
-                "connection_type": (
-                    "Wired" if safe_get(client, "is_wired", False) else "Wireless"
-                ),
-                "status": (
-                    "Online" if not include_offline else (
-                        "Online"
-                        if safe_get(client, "is_wired", False)
-                        or ((safe_get(client, "last_seen") or 0) > 0)
-                        else "Offline"
-                    )
-                ),
-                "last_seen": safe_get(client, "last_seen", 0),
-                "_id": safe_get(client, "_id"),
-            }
-
-            if not safe_get(client, "is_wired", False):
-                formatted.update(
-                    {
-                        "essid": safe_get(client, "essid", "Unknown"),
-                        "signal_dbm": safe_get(client, "signal"),
-                        "channel": safe_get(client, "channel", "Unknown"),
-                        "radio": safe_get(client, "radio", "Unknown"),
-                    }
+        # Non-positive limits return nothing, matching slice semantics.
+        for c in clients if limit > 0 else ():
+            raw = c.raw if hasattr(c, "raw") else c  # c might already be a dict
+            is_dict = isinstance(raw, dict)
+            wired = (
+                raw.get("is_wired", False)
+                if is_dict
+                else getattr(raw, "is_wired", False)
+            )
+            if want_wired and not wired:
+                continue
+            if want_wireless and wired:
+                continue
+            formatted_clients.append(
+                (_format_dict_client if is_dict else _format_any_client)(
+                    raw, include_offline
                 )
-
-            formatted_clients.append(formatted)
+            )
+            if len(formatted_clients) >= limit:
+                break
 
         return {
             "success": True,
-            "site": getattr(
-                getattr(client_manager, "_connection", None), "site", "unknown"
-            ),
+            "site": _site(),
             "count": len(formatted_clients),
             "clients": formatted_clients,
         }
-    except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+    except _UNIFI_EXC as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
         logger.error("Error listing clients: %s", e, exc_info=True)
         return {"success": False, "error": str(e)}
 
@@ -112,26 +227,65 @@ async def list_clients(
 async def get_client_details(mac_address: str) -> Dict[str, Any]:
     """Implementation for getting client details."""
     try:
-        client_obj = await client_manager.get_client_details(mac_address)
+        client_obj = await _cached_client_details(mac_address)
         if client_obj:
             client_raw = client_obj.raw if hasattr(client_obj, "raw") else client_obj
             return {
                 "success": True,
-                "site": getattr(
-                    getattr(client_manager, "_connection", None), "site", "unknown"
-                ),
+                "site": _site(),
                 "client": client_raw
             }
         return {
             "success": False,
             "error": f"Client not found with MAC address: {mac_address}"
         }
-    except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+    except _UNIFI_EXC as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
         logger.error(
             "Error getting client details for %s: %s", mac_address, e, exc_info=True
         )
         return {"success": False, "error": str(e)}
 
+# Cap on concurrent per-MAC detail fetches for the batch tool.
+_details_sem = asyncio.Semaphore(20)
+
+
+@server.tool(
+    name="unifi_get_clients_details",
+    description="Get detailed information for multiple clients by MAC address in one call"
+)
+async def get_clients_details(mac_addresses: List[str]) -> Dict[str, Any]:
+    """Implementation for getting details for several clients concurrently."""
+    try:
+        async def one(mac: str):
+            async with _details_sem:
+                return await _cached_client_details(mac)
+
+        results = await asyncio.gather(
+            *(one(mac) for mac in mac_addresses), return_exceptions=True
+        )
+
+        clients: Dict[str, Any] = {}
+        for mac, result in zip(mac_addresses, results):
+            if isinstance(result, BaseException):
+                clients[mac] = {"found": False, "error": str(result)}
+            elif result is None:
+                clients[mac] = {"found": False}
+            else:
+                clients[mac] = {
+                    "found": True,
+                    "client": result.raw if hasattr(result, "raw") else result,
+                }
+
+        return {
+            "success": True,
+            "site": _site(),
+            "count": len(clients),
+            "clients": clients,
+        }
+    except _UNIFI_EXC as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+        logger.error("Error getting clients details: %s", e, exc_info=True)
+        return {"success": False, "error": str(e)}
+
 @server.tool(
     name="unifi_list_blocked_clients",
     description="List clients/devices that are currently blocked from the network"
@@ -141,44 +295,17 @@ async def list_blocked_clients() -> Dict[str, Any]:
     try:
         clients = await client_manager.get_blocked_clients()
 
-        formatted_clients = []
-        for c in clients:
-            client = c.raw if hasattr(c, "raw") else c
-
-            # Handle both dict and object types
-            def safe_get(obj, key, default=None):
-                if isinstance(obj, dict):
-                    return obj.get(key, default)
-                return getattr(obj, key, default)
-
-            formatted_clients.append(
-                {
-                    "mac": safe_get(client, "mac"),
-                    "name": (
-                        safe_get(client, "name")
-                        or safe_get(client, "hostname", "Unknown")
-                    ),
-                    "hostname": safe_get(client, "hostname", "Unknown"),
-                    "ip": safe_get(client, "ip", "Unknown"),
-                    "connection_type": (
-                        "Wired"
-                        if safe_get(client, "is_wired", False)
-                        else "Wireless"
-                    ),
-                    "blocked_since": safe_get(client, "blocked_since", 0),
-                    "_id": safe_get(client, "_id"),
-                }
-            )
+        # List comprehension so CPython presizes the result list instead of
+        # growing it append-by-append.
+        formatted_clients = [_format_blocked_client(c) for c in clients]
 
         return {
             "success": True,
-            "site": getattr(
-                getattr(client_manager, "_connection", None), "site", "unknown"
-            ),
+            "site": _site(),
             "count": len(formatted_clients),
             "blocked_clients": formatted_clients,
         }
-    except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+    except _UNIFI_EXC as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
         logger.error("Error listing blocked clients: %s", e, exc_info=True)
         return {"success": False, "error": str(e)}
 
@@ -186,24 +313,19 @@ async def list_blocked_clients() -> Dict[str, Any]:
     name="unifi_block_client",
     description="Block a client/device from the network by MAC address"
 )
+@require_permission("client", "block", denied_error="Permission denied to block clients.")
 async def block_client(mac_address: str, confirm: bool = False) -> Dict[str, Any]:
     """Implementation for blocking a client."""
-    if not parse_permission(getattr(config, 'permissions', {}), "client", "block"):
-        logger.warning("Permission denied for blocking client (%s).", mac_address)
-        return {"success": False, "error": "Permission denied to block clients."}
-
-    if not confirm:
-        return {"success": False, "error": "Confirmation required. Set confirm=true."}
-
     try:
         success = await client_manager.block_client(mac_address)
         if success:
+            _invalidate_client_details(mac_address)
             return {
                 "success": True,
                 "message": f"Client {mac_address} blocked successfully."
             }
         return {"success": False, "error": f"Failed to block client {mac_address}."}
-    except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+    except _UNIFI_EXC as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
         logger.error("Error blocking client %s: %s", mac_address, e, exc_info=True)
         return {"success": False, "error": str(e)}
 
@@ -211,24 +333,19 @@ async def block_client(mac_address: str, confirm: bool = False) -> Dict[str, Any
     name="unifi_unblock_client",
     description="Unblock a previously blocked client/device by MAC address"
 )
+@require_permission("client", "block", denied_error="Permission denied to unblock clients.")
 async def unblock_client(mac_address: str, confirm: bool = False) -> Dict[str, Any]:
     """Implementation for unblocking a client."""
-    if not parse_permission(getattr(config, 'permissions', {}), "client", "block"):
-        logger.warning("Permission denied for unblocking client (%s).", mac_address)
-        return {"success": False, "error": "Permission denied to unblock clients."}
-
-    if not confirm:
-        return {"success": False, "error": "Confirmation required. Set confirm=true."}
-
     try:
         success = await client_manager.unblock_client(mac_address)
         if success:
+            _invalidate_client_details(mac_address)
             return {
                 "success": True,
                 "message": f"Client {mac_address} unblocked successfully."
             }
         return {"success": False, "error": f"Failed to unblock client {mac_address}."}
-    except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+    except _UNIFI_EXC as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
         logger.error("Error unblocking client %s: %s", mac_address, e, exc_info=True)
         return {"success": False, "error": str(e)}
 
@@ -236,26 +353,21 @@ async def unblock_client(mac_address: str, confirm: bool = False) -> Dict[str, A
     name="unifi_rename_client",
     description="Rename a client/device in the Unifi Network controller by MAC address"
 )
+@require_permission("client", "update", denied_error="Permission denied to rename clients.")
 async def rename_client(
     mac_address: str, name: str, confirm: bool = False
 ) -> Dict[str, Any]:
     """Implementation for renaming a client."""
-    if not parse_permission(getattr(config, 'permissions', {}), "client", "update"):
-        logger.warning("Permission denied for renaming client (%s).", mac_address)
-        return {"success": False, "error": "Permission denied to rename clients."}
-
-    if not confirm:
-        return {"success": False, "error": "Confirmation required. Set confirm=true."}
-
     try:
         success = await client_manager.rename_client(mac_address, name)
         if success:
+            _invalidate_client_details(mac_address)
             return {
                 "success": True,
                 "message": f"Client {mac_address} renamed to '{name}' successfully."
             }
         return {"success": False, "error": f"Failed to rename client {mac_address}."}
-    except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+    except _UNIFI_EXC as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
         logger.error("Error renaming client %s: %s", mac_address, e, exc_info=True)
         return {"success": False, "error": str(e)}
 
@@ -263,22 +375,14 @@ async def rename_client(
     name="unifi_force_reconnect_client",
     description="Force a client to reconnect to the network (kick) by MAC address"
 )
+@require_permission(
+    "client", "reconnect",
+    denied_error="Permission denied to force client reconnection.",
+)
 async def force_reconnect_client(
     mac_address: str, confirm: bool = False
 ) -> Dict[str, Any]:
     """Implementation for forcing a client to reconnect."""
-    if not parse_permission(getattr(config, 'permissions', {}), "client", "reconnect"):
-        logger.warning(
-            "Permission denied for forcing reconnect of client (%s).", mac_address
-        )
-        return {
-            "success": False,
-            "error": "Permission denied to force client reconnection."
-        }
-
-    if not confirm:
-        return {"success": False, "error": "Confirmation required. Set confirm=true."}
-
     try:
         success = await client_manager.force_reconnect_client(mac_address)
         if success:
@@ -290,7 +394,7 @@ async def force_reconnect_client(
             "success": False,
             "error": f"Failed to force reconnect for client {mac_address}."
         }
-    except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+    except _UNIFI_EXC as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
         logger.error(
             "Error forcing reconnect for client %s: %s",
             mac_address, e, exc_info=True
@@ -301,6 +405,7 @@ async def force_reconnect_client(
     name="unifi_authorize_guest",
     description="Authorize a guest client to access the guest network by MAC address"
 )
+@require_permission("client", "authorize", denied_error="Permission denied to authorize guests.")
 async def authorize_guest(
     mac_address: str,
     minutes: int = 1440,
@@ -310,13 +415,6 @@ async def authorize_guest(
     confirm: bool = False
 ) -> Dict[str, Any]:
     """Implementation for authorizing a guest."""
-    if not parse_permission(getattr(config, 'permissions', {}), "client", "authorize"):
-        logger.warning("Permission denied for authorizing guest (%s).", mac_address)
-        return {"success": False, "error": "Permission denied to authorize guests."}
-
-    if not confirm:
-        return {"success": False, "error": "Confirmation required. Set confirm=true."}
-
     try:
         success = await client_manager.authorize_guest(
             mac_address, minutes, up_kbps, down_kbps, bytes_quota
@@ -329,7 +427,7 @@ async def authorize_guest(
                 )
             }
         return {"success": False, "error": f"Failed to authorize guest {mac_address}."}
-    except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+    except _UNIFI_EXC as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
         logger.error("Error authorizing guest %s: %s", mac_address, e, exc_info=True)
         return {"success": False, "error": str(e)}
 
@@ -337,15 +435,9 @@ async def authorize_guest(
     name="unifi_unauthorize_guest",
     description="Revoke authorization for a guest client by MAC address"
 )
+@require_permission("client", "authorize", denied_error="Permission denied to unauthorize guests.")
 async def unauthorize_guest(mac_address: str, confirm: bool = False) -> Dict[str, Any]:
     """Implementation for unauthorizing a guest."""
-    if not parse_permission(getattr(config, 'permissions', {}), "client", "authorize"):
-        logger.warning("Permission denied for unauthorizing guest (%s).", mac_address)
-        return {"success": False, "error": "Permission denied to unauthorize guests."}
-
-    if not confirm:
-        return {"success": False, "error": "Confirmation required. Set confirm=true."}
-
     try:
         success = await client_manager.unauthorize_guest(mac_address)
         if success:
@@ -354,6 +446,6 @@ async def unauthorize_guest(mac_address: str, confirm: bool = False) -> Dict[str
                 "message": f"Guest {mac_address} authorization revoked successfully."
             }
         return {"success": False, "error": f"Failed to unauthorize guest {mac_address}."}
-    except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+    except _UNIFI_EXC as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
         logger.error("Error unauthorizing guest %s: %s", mac_address, e, exc_info=True)
         return {"success": False, "error": str(e)}
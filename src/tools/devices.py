@@ -6,23 +6,132 @@ This module provides MCP tools to manage devices in a Unifi Network Controller.
 
 
 import logging
-from typing import Dict, List, Any
-from datetime import datetime, timedelta
+import time
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
+from datetime import timedelta
 from src.runtime import server, device_manager
 
 logger = logging.getLogger(__name__)
 
+# Shared handler tuple for every tool in this module.
+_UNIFI_EXC = (ValueError, TypeError, AttributeError, KeyError)
+
+# Device-type filter aliases -> UniFi type prefixes (str.startswith accepts
+# the tuple directly, so the filter is a single C-level call per device).
+_PREFIX_MAP = {
+    "ap": ("uap",),
+    "uap": ("uap",),
+    "switch": ("usw", "usk"),
+    "usw": ("usw", "usk"),
+    "gateway": ("ugw", "udm", "uxg"),
+    "ugw": ("ugw", "udm", "uxg"),
+    "udm": ("udm",),
+    "pdu": ("usp",),
+    "usp": ("usp",),
+}
+
+# Controller numeric device states -> human-readable status strings.
+_STATE_MAP = {
+    0: "offline",
+    1: "online",
+    2: "pending_adoption",
+    4: "managed_by_other/adopting",
+    5: "provisioning",
+    6: "upgrading",
+    11: "error/heartbeat_missed",
+}
+
+def _uap_details(device: Dict[str, Any]) -> Dict[str, Any]:
+    """Detail fields specific to access points."""
+    return {
+        "radio_table": device.get("radio_table", []),
+        "vap_table": device.get("vap_table", []),
+        "wifi_bands": get_wifi_bands(device),
+        "experience_score": device.get("satisfaction", 0),
+        "num_clients": device.get("num_sta", 0),
+    }
+
+
+def _sw_details(device: Dict[str, Any]) -> Dict[str, Any]:
+    """Detail fields specific to switches."""
+    port_table = device.get("port_table", [])
+    return {
+        "ports": port_table,
+        "total_ports": len(port_table),
+        "num_clients": device.get("user-num_sta", 0) + device.get("guest-num_sta", 0),
+        "poe_info": {
+            "poe_current": device.get("poe_current"),
+            "poe_power": device.get("poe_power"),
+            "poe_voltage": device.get("poe_voltage"),
+        },
+    }
+
+
+def _gw_details(device: Dict[str, Any]) -> Dict[str, Any]:
+    """Detail fields specific to gateways."""
+    return {
+        "wan1": device.get("wan1", {}),
+        "wan2": device.get("wan2", {}),
+        "num_clients": device.get("user-num_sta", 0) + device.get("guest-num_sta", 0),
+        "network_table": device.get("network_table", []),
+        "system_stats": device.get("system-stats", {}),
+        "speedtest_status": device.get("speedtest-status", {}),
+    }
+
+
+def _no_details(device: Dict[str, Any]) -> Dict[str, Any]:
+    return {}
+
+
+@lru_cache(maxsize=1024)
+def _iso(ts: int) -> str:
+    """ISO8601 string for an epoch timestamp.
+
+    last_seen values repeat across polls, so the cache turns most calls into
+    a dict probe; the strftime path also skips a datetime object per device.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(ts))
+
+
+@lru_cache(maxsize=1024)
+def _uptime_str(seconds: int) -> str:
+    """Human-readable uptime for a seconds count."""
+    return str(timedelta(seconds=seconds))
+
+
+# Type prefix (first 3 chars) -> detail formatter.
+_DETAIL_DISPATCH = {
+    "uap": _uap_details,
+    "usw": _sw_details,
+    "usk": _sw_details,
+    "ugw": _gw_details,
+    "udm": _gw_details,
+    "uxg": _gw_details,
+}
+
+_site_cache: Optional[str] = None
+
+
+def _site() -> Optional[str]:
+    """Resolve (once) the site name used in tool responses."""
+    global _site_cache
+    if _site_cache is None:
+        conn = getattr(device_manager, "_connection", None)
+        _site_cache = getattr(conn, "site", None) if conn else None
+    return _site_cache
+
+# Radio codes reported in radio_table -> band labels.
+_RADIO_TO_BAND = {"na": "5GHz", "ng": "2.4GHz", "wifi6e": "6GHz"}
+
+
 def get_wifi_bands(device: Dict[str, Any]) -> List[str]:
     """Extract active WiFi bands from device radio table."""
-    bands = set()
-    for radio in device.get("radio_table", []):
-        if radio.get("radio") == "na":
-            bands.add("5GHz")
-        elif radio.get("radio") == "ng":
-            bands.add("2.4GHz")
-        elif radio.get("radio") == "wifi6e":
-            bands.add("6GHz")
-    return sorted(list(bands))
+    return sorted({
+        _RADIO_TO_BAND[r["radio"]]
+        for r in device.get("radio_table", ())
+        if r.get("radio") in _RADIO_TO_BAND
+    })
 
 @server.tool(
     name="unifi_list_devices",
@@ -40,115 +149,66 @@ async def list_devices(
 
         # Filter by device type
         if device_type != "all":
-            prefix_map = {
-                "ap": ("uap",),
-                "uap": ("uap",),
-                "switch": ("usw", "usk"),
-                "usw": ("usw", "usk"),
-                "gateway": ("ugw", "udm", "uxg"),
-                "ugw": ("ugw", "udm", "uxg"),
-                "udm": ("udm",),
-                "pdu": ("usp",),
-                "usp": ("usp",),
-            }
-            prefixes = prefix_map.get(device_type)
+            prefixes = _PREFIX_MAP.get(device_type)
             if prefixes:
                 devices_raw = [
-                    d for d in devices_raw 
-                    if isinstance(d, dict) and any(
-                        d.get("type", "").startswith(p) for p in prefixes
-                    )
+                    d for d in devices_raw
+                    if isinstance(d, dict) and d.get("type", "").startswith(prefixes)
                 ]
 
         # Filter by status
         formatted_devices = []
-        state_map = {
-            0: "offline",
-            1: "online",
-            2: "pending_adoption",
-            4: "managed_by_other/adopting",
-            5: "provisioning",
-            6: "upgrading",
-            11: "error/heartbeat_missed",
-        }
 
         for device in devices_raw:
             if not isinstance(device, dict):
                 continue
             device_state = device.get("state", 0)
-            device_status_str = state_map.get(device_state, f"unknown_state ({device_state})")
+            device_status_str = _STATE_MAP.get(device_state, f"unknown_state ({device_state})")
+
+            # Apply the status filter before any formatting work.
+            if status != "all" and device_status_str != status:
+                continue
+
+            # Bind repeated lookups once per device.
+            uptime = device.get("uptime", 0)
+            last_seen = device.get("last_seen", 0)
+            dtype = device.get("type", "")
+            model = device.get("model", "")
 
             device_info = {
                 "mac": device.get("mac", ""),
-                "name": device.get("name", device.get("model", "Unknown")),
-                "model": device.get("model", ""),
-                "type": device.get("type", ""),
+                "name": device.get("name", model or "Unknown"),
+                "model": model,
+                "type": dtype,
                 "ip": device.get("ip", ""),
                 "status": device_status_str,
-                "uptime": str(timedelta(seconds=device.get("uptime", 0))) if device.get("uptime") else "N/A",
-                "last_seen": (
-                    datetime.fromtimestamp(device.get("last_seen", 0)).isoformat()
-                    if device.get("last_seen")
-                    else "N/A"
-                ),
+                "uptime": _uptime_str(uptime) if uptime else "N/A",
+                "last_seen": _iso(last_seen) if last_seen else "N/A",
                 "firmware": device.get("version", ""),
                 "adopted": device.get("adopted", False),
                 "_id": device.get("_id", ""),
             }
 
-            details_to_add = {}
             if include_details:
-                details_to_add = {
+                device_info.update({
                     "serial": device.get("serial", ""),
                     "hw_revision": device.get("hw_rev", ""),
-                    "model_display": device.get("model_display", device.get("model")),
+                    "model_display": device.get("model_display", model),
                     "clients": device.get("num_sta", 0),
-                }
-                device_type_prefix = device.get("type", "")[:3]
-                if device_type_prefix == "uap":
-                    from typing import cast
-                    device_dict = device if isinstance(device, dict) else (device.raw if hasattr(device, "raw") else {})
-                    wifi_bands_data = cast(Dict[str, Any], device_dict)
-                    details_to_add.update({
-                        "radio_table": device.get("radio_table", []),
-                        "vap_table": device.get("vap_table", []),
-                        "wifi_bands": get_wifi_bands(wifi_bands_data),
-                        "experience_score": device.get("satisfaction", 0),
-                        "num_clients": device.get("num_sta", 0),
-                    })
-                elif device_type_prefix in ["usw", "usk"]:
-                    details_to_add.update({
-                        "ports": device.get("port_table", []),
-                        "total_ports": len(device.get("port_table", [])),
-                        "num_clients": device.get("user-num_sta", 0) + device.get("guest-num_sta", 0),
-                        "poe_info": {
-                            "poe_current": device.get("poe_current"),
-                            "poe_power": device.get("poe_power"),
-                            "poe_voltage": device.get("poe_voltage"),
-                        },
-                    })
-                elif device_type_prefix in ["ugw", "udm", "uxg"]:
-                    details_to_add.update({
-                        "wan1": device.get("wan1", {}),
-                        "wan2": device.get("wan2", {}),
-                        "num_clients": device.get("user-num_sta", 0) + device.get("guest-num_sta", 0),
-                        "network_table": device.get("network_table", []),
-                        "system_stats": device.get("system-stats", {}),
-                        "speedtest_status": device.get("speedtest-status", {}),
-                    })
-            device_info.update(details_to_add)
+                })
+                device_info.update(
+                    _DETAIL_DISPATCH.get(dtype[:3], _no_details)(device)
+                )
             formatted_devices.append(device_info)
 
-        connection = getattr(device_manager, "_connection", None)
-        site = getattr(connection, "site", None) if connection else None
         return {
             "success": True,
-            "site": site,
+            "site": _site(),
             "filter_type": device_type,
             "filter_status": status,
             "count": len(formatted_devices),
             "devices": formatted_devices
         }
-    except (ValueError, TypeError, AttributeError, KeyError) as e:
+    except _UNIFI_EXC as e:
         logger.error("Error listing devices: %s", e, exc_info=True)
         return {"success": False, "error": str(e)}
@@ -2,17 +2,157 @@
 Port forward tools for Unifi Network MCP server.
 """
 
+import functools
 import logging
-import json
-from typing import Dict, Any
+import os
+from time import monotonic
+from typing import Dict, Any, List, Optional, Tuple
 from aiounifi.errors import RequestError, ResponseError
 
 from src.runtime import server, config, firewall_manager
 from src.utils.permissions import parse_permission
+from src.utils.serialization import serialize_aiounifi_object
 from src.validator_registry import UniFiValidatorRegistry # Added for validation
 
 logger = logging.getLogger(__name__) # Changed logger name for consistency
 
+# Opt-in: re-fetch and report rule state after a failed mutation. Off by
+# default since it doubles failure-path latency against an already
+# unhealthy controller.
+_DEBUG_STATE = bool(os.environ.get("UNIFI_MCP_DEBUG_STATE"))
+
+# Controller/transport failures that occur routinely (network blips,
+# controller restarts) and do not warrant traceback capture.
+_EXPECTED_ERRORS = (RequestError, ResponseError, ConnectionError)
+
+
+def _log_err(e: BaseException, msg: str, *args: Any) -> None:
+    """Log a handler failure at the appropriate level.
+
+    Expected controller errors log at WARNING with just the exception repr;
+    exc_info=True (full traceback formatting) is reserved for genuinely
+    unexpected exceptions.
+    """
+    if isinstance(e, _EXPECTED_ERRORS):
+        logger.warning(msg + ": %r", *args, e)
+    else:
+        logger.error(msg + ": %s", *args, e, exc_info=True)
+
+
+@functools.lru_cache(maxsize=32)
+def _perm(action: str) -> bool:
+    """Resolve a port-forward permission once per action.
+
+    config.permissions is static for the lifetime of the process, so the
+    dict walk in parse_permission only needs to run on first use. Call
+    `_perm.cache_clear()` if config ever becomes reloadable.
+    """
+    return parse_permission(getattr(config, 'permissions', {}), "port_forward", action)
+
+
+# Shared iterative walker; replaces the recursive coercion helper that
+# lived here so other tool modules can serialize the same way.
+_to_jsonable = serialize_aiounifi_object
+
+
+# Short-TTL cache of the formatted list response. Port-forward rules change
+# rarely, so bursts of list calls (dashboards, agent loops) skip both the
+# manager fetch and the re-formatting. Mutation tools drop the entry.
+_LIST_TTL = 10.0
+_list_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+def _invalidate_list_cache() -> None:
+    global _list_cache
+    _list_cache = None
+
+
+# Fixed error responses for the common denial paths, built once instead of
+# per call. Returned dicts are serialized immediately and never mutated.
+_ERR_PERM_LIST = {"success": False, "error": "Permission denied to list port forwards."}
+_ERR_PERM_GET = {"success": False, "error": "Permission denied to get port forward details."}
+_ERR_PERM_TOGGLE = {"success": False, "error": "Permission denied to toggle port forward."}
+_ERR_PERM_CREATE = {"success": False, "error": "Permission denied to create port forward."}
+_ERR_PERM_UPDATE = {"success": False, "error": "Permission denied to update port forward."}
+_ERR_PERM = {"success": False, "error": "Permission denied."}
+_ERR_CONFIRM = {"success": False, "error": "Confirmation required. Set 'confirm' to true."}
+_ERR_ID_REQUIRED = {"success": False, "error": "port_forward_id is required"}
+_ERR_EMPTY_UPDATE = {"success": False, "error": "update_data dictionary cannot be empty"}
+
+# Simplified-schema protocol values -> V1 schema protocol values.
+_PROTO_MAP = {"tcp": "tcp", "udp": "udp", "both": "tcp_udp"}
+
+# V1 schema protocol values -> wire values the manager expects. One hash
+# probe instead of a str.replace scan-and-allocate per call.
+_PROTO_WIRE = {"tcp": "tcp", "udp": "udp", "tcp_udp": "tcp/udp"}
+
+
+def _proto_to_wire(value: Any) -> str:
+    return _PROTO_WIRE.get(value, "tcp/udp")
+
+
+# Declarative schema->payload mapping for create_port_forward:
+# (schema_key, payload_key, default, transform).
+_CREATE_MAP = (
+    ("name", "name", None, None),
+    ("dst_port", "dst_port", None, None),
+    ("fwd_port", "fwd_port", None, None),
+    ("fwd_ip", "fwd_ip", None, None),
+    ("protocol", "proto", "tcp_udp", _proto_to_wire),
+    ("enabled", "enabled", True, None),
+    ("log", "log", False, None),
+)
+
+# Schema keys needing renames/transforms in update_port_forward; everything
+# else passes through under its own name.
+_UPDATE_MAP = {
+    "protocol": ("proto", _proto_to_wire),
+    # Empty string/null clears the source match.
+    "src_ip": ("src", lambda v: v if v else None),
+}
+
+
+_site_cache: Optional[str] = None
+
+
+def _site() -> str:
+    """Resolve (once) the site name used in tool responses."""
+    global _site_cache
+    if _site_cache is None:
+        conn = getattr(firewall_manager, '_connection', None)
+        _site_cache = getattr(conn, 'site', 'default') if conn else 'default'
+    return _site_cache
+
+
+def _project_rule(r: Any) -> Dict[str, Any]:
+    """Project a raw rule into the public list shape.
+
+    Module-level so the projection is compiled once, not rebuilt as a
+    closure per call; raw rules are dicts so the common path is seven
+    C-level .get probes. Note: UniFi's dst_port is the external port and
+    fwd_port the internal one, hence the key remapping.
+    """
+    if isinstance(r, dict):
+        get = r.get
+        return {
+            "id": get("_id"),
+            "name": get("name"),
+            "enabled": get("enabled"),
+            "src_port": get("dst_port"),
+            "dst_port": get("fwd_port"),
+            "protocol": get("protocol"),
+            "dest_ip": get("fwd_ip"),
+        }
+    return {
+        "id": getattr(r, "_id", None),
+        "name": getattr(r, "name", None),
+        "enabled": getattr(r, "enabled", None),
+        "src_port": getattr(r, "dst_port", None),
+        "dst_port": getattr(r, "fwd_port", None),
+        "protocol": getattr(r, "protocol", None),
+        "dest_ip": getattr(r, "fwd_ip", None),
+    }
+
 @server.tool(
     name="unifi_list_port_forwards",
     description="List all port forwarding rules on your Unifi Network controller."
@@ -53,34 +193,25 @@ async def list_port_forwards() -> Dict[str, Any]: # Removed context, adjusted re
         ]
     }
     """
-    if not parse_permission(getattr(config, 'permissions', {}), "port_forward", "read"):
+    if not _perm("read"):
         logger.warning("Permission denied for listing port forwards.")
-        return {"success": False, "error": "Permission denied to list port forwards."}
+        return _ERR_PERM_LIST
+    global _list_cache
+    cached = _list_cache
+    if cached is not None and monotonic() - cached[0] < _LIST_TTL:
+        return cached[1]
     try:
         rules = await firewall_manager.get_port_forwards()
-        rules_raw = [r.raw if hasattr(r, "raw") else r for r in rules]
-        
-        def safe_get(obj, key, default=None):
-            """Safely get a value from either a dict or object."""
-            if isinstance(obj, dict):
-                return obj.get(key, default)
-            return getattr(obj, key, default)
-        
+        # Single pass: unwrap .raw and project inline rather than building
+        # an intermediate rules_raw list first.
         port_forward_list = [
-            {
-                "id": safe_get(r, "_id"),
-                "name": safe_get(r, "name"),
-                "enabled": safe_get(r, "enabled"),
-                "src_port": safe_get(r, "dst_port"), # Note: UniFi uses dst_port for external
-                "dst_port": safe_get(r, "fwd_port"), # Note: UniFi uses fwd_port for internal
-                "protocol": safe_get(r, "protocol"),
-                "dest_ip": safe_get(r, "fwd_ip")
-            }
-            for r in rules_raw
+            _project_rule(getattr(r, "raw", r)) for r in rules
         ]
-        return {"success": True, "site": getattr(getattr(firewall_manager, '_connection', None), 'site', 'default'), "count": len(port_forward_list), "port_forwards": port_forward_list}
+        response = {"success": True, "site": _site(), "count": len(port_forward_list), "port_forwards": port_forward_list}
+        _list_cache = (monotonic(), response)
+        return response
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:
-        logger.error("Error listing port forwards: %s", e, exc_info=True)
+        _log_err(e, "Error listing port forwards")
         return {"success": False, "error": str(e)}
 
 @server.tool(
@@ -118,12 +249,12 @@ async def get_port_forward(port_forward_id: str) -> Dict[str, Any]: # Removed co
         }
     }
     """
-    if not parse_permission(getattr(config, 'permissions', {}), "port_forward", "read"):
+    if not _perm("read"):
         logger.warning("Permission denied for getting port forward (%s).", port_forward_id)
-        return {"success": False, "error": "Permission denied to get port forward details."}
+        return _ERR_PERM_GET
     try:
         if not port_forward_id:
-            return {"success": False, "error": "port_forward_id is required"}
+            return _ERR_ID_REQUIRED
 
         rule_obj = await firewall_manager.get_port_forward_by_id(port_forward_id)
         rule = rule_obj.raw if (rule_obj and hasattr(rule_obj, "raw")) else rule_obj
@@ -132,9 +263,58 @@ async def get_port_forward(port_forward_id: str) -> Dict[str, Any]: # Removed co
             return {"success": False, "error": f"Port forwarding rule '{port_forward_id}' not found"}
 
         # Return full details, ensure serializable
-        return {"success": True, "port_forward_id": port_forward_id, "details": json.loads(json.dumps(rule, default=str))}
+        return {"success": True, "port_forward_id": port_forward_id, "details": _to_jsonable(rule)}
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:
-        logger.error("Error getting port forward %s: %s", port_forward_id, e, exc_info=True)
+        _log_err(e, "Error getting port forward %s", port_forward_id)
+        return {"success": False, "error": str(e)}
+
+@server.tool(
+    name="unifi_get_port_forwards_batch",
+    description="Get multiple port forwarding rules by ID in a single call from your Unifi Network controller."
+)
+async def get_port_forwards_batch(port_forward_ids: List[str]) -> Dict[str, Any]:
+    """Get details for several port forwarding rules in one call.
+
+    The per-rule lookups run concurrently in the manager, so fetching N
+    rules costs roughly one list fetch instead of N sequential tool calls.
+
+    Args:
+        port_forward_ids (List[str]): The unique identifiers (_id) of the rules to fetch.
+
+    Returns:
+        A dictionary containing:
+        - success (bool): Indicates if the operation was successful.
+        - count (int): The number of IDs requested.
+        - found (int): The number of rules found.
+        - results (Dict[str, Dict]): Per-id results, each containing:
+            - found (bool): Whether the rule exists.
+            - details (Dict | None): The raw rule configuration, or None.
+        - error (str, optional): An error message if the operation failed.
+    """
+    if not _perm("read"):
+        logger.warning("Permission denied for batch-getting port forwards.")
+        return _ERR_PERM_GET
+    if not port_forward_ids:
+        return {"success": False, "error": "port_forward_ids is required"}
+    try:
+        rules = await firewall_manager.get_port_forwards_batch(port_forward_ids)
+        results: Dict[str, Any] = {}
+        found = 0
+        for rule_id, rule_obj in zip(port_forward_ids, rules):
+            rule = getattr(rule_obj, "raw", rule_obj) if rule_obj else None
+            if rule:
+                found += 1
+                results[rule_id] = {"found": True, "details": _to_jsonable(rule)}
+            else:
+                results[rule_id] = {"found": False, "details": None}
+        return {
+            "success": True,
+            "count": len(port_forward_ids),
+            "found": found,
+            "results": results,
+        }
+    except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:
+        _log_err(e, "Error batch-getting port forwards")
         return {"success": False, "error": str(e)}
 
 @server.tool(
@@ -166,58 +346,52 @@ async def toggle_port_forward(port_forward_id: str, confirm: bool = False) -> Di
     }
     """
 
-    if not parse_permission(getattr(config, 'permissions', {}), "port_forward", "update"):
+    if not port_forward_id:
+        return _ERR_ID_REQUIRED
+
+    if not _perm("update"):
         logger.warning("Permission denied for toggling port forward (%s).", port_forward_id)
-        return {"success": False, "error": "Permission denied to toggle port forward."}
+        return _ERR_PERM_TOGGLE
 
     if not confirm:
         logger.warning("Confirmation missing for toggling port forward %s.", port_forward_id)
-        return {"success": False, "error": "Confirmation required. Set 'confirm' to true."}
+        return _ERR_CONFIRM
 
     try:
-        if not port_forward_id:
-            return {"success": False, "error": "port_forward_id is required"}
-
         rule_obj = await firewall_manager.get_port_forward_by_id(port_forward_id)
         rule = rule_obj.raw if (rule_obj and hasattr(rule_obj, "raw")) else rule_obj
         if not rule:
             return {"success": False, "error": f"Port forwarding rule '{port_forward_id}' not found"}
 
-        def safe_get_toggle(obj, key, default=None):
-            """Safely get a value from either a dict or object."""
-            if isinstance(obj, dict):
-                return obj.get(key, default)
-            return getattr(obj, key, default)
-
-        rule_name = safe_get_toggle(rule, "name", port_forward_id)
-        current_state = safe_get_toggle(rule, "enabled", False)
+        # After the .raw unwrap `rule` is a plain dict, so probe it directly
+        # (a getattr chain here would silently return the default on dicts).
+        rule_name = rule.get("name", port_forward_id)
+        current_state = rule.get("enabled", False)
         new_state = not current_state
 
         logger.info("Attempting to toggle port forward '%s' (%s) to %s", rule_name, port_forward_id, new_state)
-        # Assuming toggle_port_forward directly updates the rule state.
-        # If firewall_manager.toggle_port_forward doesn't exist or works differently,
-        # we might need to fetch, modify 'enabled', and call update_port_forward.
-        # For now, assuming toggle_port_forward exists and returns success/failure.
-
-        # Let's simulate the update pattern more closely: fetch, modify, update
-        update_payload = {"enabled": new_state}
-        # Assuming firewall_manager has an update_port_forward method
-        # This requires checking/adding the update_port_forward method in the manager layer
-        success = await firewall_manager.update_port_forward(port_forward_id, update_payload)
+        # patch_port_forward merges + submits in one manager call and hands
+        # back the post-update rule, so no success-path re-fetch is needed.
+        success, _updated = await firewall_manager.patch_port_forward(
+            port_forward_id, {"enabled": new_state}
+        )
 
         if success:
+            _invalidate_list_cache()
             logger.info("Successfully toggled port forward '%s' (%s) to %s", rule_name, port_forward_id, new_state)
             return {"success": True, "port_forward_id": port_forward_id, "enabled": new_state, "message": f"Port forward '{rule_name}' toggled to {'enabled' if new_state else 'disabled'}."}
         else:
-            # Re-fetch to check the state if the update call failed
-            rule_after_toggle_obj = await firewall_manager.get_port_forward_by_id(port_forward_id)
-            rule_after_toggle = rule_after_toggle_obj.raw if (rule_after_toggle_obj and hasattr(rule_after_toggle_obj, "raw")) else rule_after_toggle_obj
-            state_after = safe_get_toggle(rule_after_toggle, "enabled", "unknown") if rule_after_toggle else "unknown"
+            state_after = "unknown"
+            if _DEBUG_STATE:
+                # Re-fetch to check the state if the update call failed
+                rule_after_toggle_obj = await firewall_manager.get_port_forward_by_id(port_forward_id)
+                rule_after_toggle = rule_after_toggle_obj.raw if (rule_after_toggle_obj and hasattr(rule_after_toggle_obj, "raw")) else rule_after_toggle_obj
+                state_after = rule_after_toggle.get("enabled", "unknown") if rule_after_toggle else "unknown"
             logger.error("Failed to toggle port forward '%s' (%s). State after attempt: %s. Manager update returned false.", rule_name, port_forward_id, state_after)
             return {"success": False, "error": f"Failed to toggle port forward '{rule_name}'. Check server logs."}
 
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:
-        logger.error("Error toggling port forward %s: %s", port_forward_id, e, exc_info=True)
+        _log_err(e, "Error toggling port forward %s", port_forward_id)
         return {"success": False, "error": str(e)}
 
 # Create Port Forward
@@ -258,9 +432,9 @@ async def create_port_forward(
     - details (object): Additional details about the created rule
     - error (string): Error message if unsuccessful
     """
-    if not parse_permission(getattr(config, 'permissions', {}), "port_forward", "create"):
+    if not _perm("create"):
         logger.warning("Permission denied for creating port forward.")
-        return {"success": False, "error": "Permission denied to create port forward."}
+        return _ERR_PERM_CREATE
 
     # UniFiValidatorRegistry already imported at module level
 
@@ -270,29 +444,20 @@ async def create_port_forward(
         logger.warning("Invalid port forward data: %s", error_msg)
         return {"success": False, "error": error_msg or "Validation failed"}
 
-    # Required fields check
-    required_fields = ["name", "dst_port", "fwd_port", "fwd_ip"]
-    missing_fields = [field for field in required_fields if field not in validated_data]
-    if missing_fields:
-        error = f"Missing required fields: {', '.join(missing_fields)}"
-        logger.warning(error)
-        return {"success": False, "error": error}
+    # Required fields are enforced by the schema ("required" in
+    # PORT_FORWARD_SCHEMA), so no second Python-level pass is needed here.
 
     try:
-        # Prepare data for the manager
+        # Prepare data for the manager: table-driven from _CREATE_MAP.
+        get = validated_data.get
         rule_data = {
-            "name": validated_data["name"],
-            "dst_port": validated_data["dst_port"],
-            "fwd_port": validated_data["fwd_port"],
-            "fwd_ip": validated_data["fwd_ip"],
-            "proto": validated_data.get("protocol", "tcp_udp").replace('_', '/'),  # Manager expects 'tcp/udp'
-            "protocol_match_excepted": False,
-            "enabled": validated_data.get("enabled", True),
-            "log": validated_data.get("log", False)
+            dst: (transform(get(src, default)) if transform else get(src, default))
+            for src, dst, default, transform in _CREATE_MAP
         }
+        rule_data["protocol_match_excepted"] = False
 
         # Handle optional source IP
-        if validated_data.get("src_ip"):
+        if get("src_ip"):
             rule_data["src"] = validated_data["src_ip"]
 
         logger.info("Attempting to create port forward: %s (%s %s -> %s:%s)",
@@ -302,20 +467,21 @@ async def create_port_forward(
         result = await firewall_manager.create_port_forward(rule_data)
 
         if result:
+            _invalidate_list_cache()
             new_rule_id = result if isinstance(result, str) else result.get("_id", "unknown")
             details = result if isinstance(result, dict) else { "id": new_rule_id }
             logger.info("Successfully created port forward '%s' with ID %s", validated_data['name'], new_rule_id)
             return {"success": True,
                     "message": f"Port forward '{validated_data['name']}' created successfully.",
                     "port_forward_id": new_rule_id,
-                    "details": json.loads(json.dumps(details, default=str))}
+                    "details": _to_jsonable(details)}
         else:
             error_msg = result.get("error", "Manager returned failure") if isinstance(result, dict) else "Manager returned failure"
             logger.error("Failed to create port forward '%s'. Reason: %s", validated_data['name'], error_msg)
             return {"success": False, "error": f"Failed to create port forward '{validated_data['name']}'. {error_msg}"}
 
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:
-        logger.error("Error creating port forward '%s': %s", validated_data.get('name', 'unknown'), e, exc_info=True)
+        _log_err(e, "Error creating port forward '%s'", validated_data.get('name', 'unknown'))
         return {"success": False, "error": str(e)}
 
 # --- NEW UPDATE TOOL ---
@@ -375,18 +541,20 @@ async def update_port_forward(
         "details": { ... updated rule details ... }
     }
     """
-    if not parse_permission(getattr(config, 'permissions', {}), "port_forward", "update"):
+    # Cheap argument checks first: malformed calls return without touching
+    # permissions or the validator.
+    if not port_forward_id:
+        return _ERR_ID_REQUIRED
+    if not update_data:
+        return _ERR_EMPTY_UPDATE
+
+    if not _perm("update"):
         logger.warning("Permission denied for updating port forward (%s).", port_forward_id)
-        return {"success": False, "error": "Permission denied to update port forward."}
+        return _ERR_PERM_UPDATE
 
     if not confirm:
         logger.warning("Confirmation missing for updating port forward %s.", port_forward_id)
-        return {"success": False, "error": "Confirmation required. Set 'confirm' to true."}
-
-    if not port_forward_id:
-        return {"success": False, "error": "port_forward_id is required"}
-    if not update_data:
-        return {"success": False, "error": "update_data dictionary cannot be empty"}
+        return _ERR_CONFIRM
 
     # Validate the update data against the update schema
     is_valid, error_msg, validated_data = UniFiValidatorRegistry.validate("port_forward_update", update_data)
@@ -413,16 +581,8 @@ async def update_port_forward(
         updated_fields_list = []
         for key, value in validated_data.items():
             updated_fields_list.append(key)
-            if key == "protocol":
-                update_payload["proto"] = value.replace('_', '/')
-            elif key == "src_ip":
-                # Map src_ip to 'src', handle removal if empty string/null
-                update_payload["src"] = value if value else None
-            # Need to handle 'log' if it's part of the schema/manager
-            elif key == "log":
-                update_payload["log"] = value
-            else:
-                update_payload[key] = value
+            dst, transform = _UPDATE_MAP.get(key, (key, None))
+            update_payload[dst] = transform(value) if transform else value
 
         # Add potentially missing fields required by aiounifi update that aren't directly updatable via schema but needed for context?
         # e.g. _id should be passed in the ID parameter, site_id might be handled by manager
@@ -430,36 +590,35 @@ async def update_port_forward(
 
         logger.info("Attempting to update port forward '%s' (%s) with fields: %s", rule_name, port_forward_id, ', '.join(updated_fields_list))
 
-        # Assume firewall_manager.update_port_forward(id, data) exists
-        # It should handle merging the update_payload with the existing rule internally or send only the changed fields
-        success = await firewall_manager.update_port_forward(port_forward_id, update_payload)
+        # patch_port_forward merges + submits in one manager call and hands
+        # back the post-update rule, so no success-path re-fetch is needed.
+        success, updated_rule = await firewall_manager.patch_port_forward(port_forward_id, update_payload)
 
         if success:
-            # Fetch the rule again to return the updated state
-            updated_rule_obj = await firewall_manager.get_port_forward_by_id(port_forward_id)
-            updated_rule = updated_rule_obj.raw if (updated_rule_obj and hasattr(updated_rule_obj, "raw")) else {}
-
+            _invalidate_list_cache()
             logger.info("Successfully updated port forward '%s' (%s)", rule_name, port_forward_id)
             return {
                 "success": True,
                 "port_forward_id": port_forward_id,
                 "updated_fields": updated_fields_list,
-                "details": json.loads(json.dumps(updated_rule, default=str))
+                "details": _to_jsonable(updated_rule)
             }
         else:
             logger.error("Failed to update port forward '%s' (%s). Manager returned false.", rule_name, port_forward_id)
-            # Attempt to fetch rule again to see if partial update occurred? Or just report failure.
-            rule_after_update_obj = await firewall_manager.get_port_forward_by_id(port_forward_id)
-            rule_after_update = rule_after_update_obj.raw if (rule_after_update_obj and hasattr(rule_after_update_obj, "raw")) else {}
-            return {
+            response = {
                 "success": False,
                 "port_forward_id": port_forward_id,
                 "error": f"Failed to update port forward '{rule_name}'. Check server logs.",
-                "details_after_attempt": json.loads(json.dumps(rule_after_update, default=str)) # Provide state after failed attempt
             }
+            if _DEBUG_STATE:
+                # Fetch the rule again to see if a partial update occurred.
+                rule_after_update_obj = await firewall_manager.get_port_forward_by_id(port_forward_id)
+                rule_after_update = rule_after_update_obj.raw if (rule_after_update_obj and hasattr(rule_after_update_obj, "raw")) else {}
+                response["details_after_attempt"] = _to_jsonable(rule_after_update)
+            return response
 
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:
-        logger.error("Error updating port forward %s: %s", port_forward_id, e, exc_info=True)
+        _log_err(e, "Error updating port forward %s", port_forward_id)
         return {"success": False, "error": str(e)}
 
 @server.tool(
@@ -486,8 +645,8 @@ async def create_simple_port_forward(
     }
     """
 
-    if not parse_permission(getattr(config, 'permissions', {}), "port_forward", "create"):
-        return {"success": False, "error": "Permission denied."}
+    if not _perm("create"):
+        return _ERR_PERM
 
     ok, err, validated = UniFiValidatorRegistry.validate("port_forward_simple", rule)
     if not ok or validated is None:
@@ -501,11 +660,7 @@ async def create_simple_port_forward(
         "dst_port": str(r["ext_port"]),
         "fwd_port": str(r.get("int_port", r["ext_port"])),
         "fwd_ip": r["to_ip"],
-        "protocol": {
-            "tcp": "tcp",
-            "udp": "udp",
-            "both": "tcp_udp",
-        }.get(r.get("protocol", "both"), "tcp_udp"),
+        "protocol": _PROTO_MAP.get(r.get("protocol", "both"), "tcp_udp"),
         "enabled": r.get("enabled", True),
     }
 
@@ -516,8 +671,9 @@ async def create_simple_port_forward(
     if created is None or not isinstance(created, dict):
         return {"success": False, "error": "Controller rejected port forward creation. See logs."}
 
+    _invalidate_list_cache()
     return {
         "success": True,
         "port_forward_id": created.get("_id"),
-        "details": json.loads(json.dumps(created, default=str)),
+        "details": _to_jsonable(created),
     }
@@ -4,97 +4,338 @@ Unifi Network MCP statistics tools.
 This module provides MCP tools to fetch statistics from a Unifi Network Controller.
 """
 
+import asyncio
 import logging
+import os
+from itertools import islice
+from time import monotonic
 from typing import Dict, Any
 from aiounifi.errors import RequestError, ResponseError
 
-from src.runtime import server, stats_manager, client_manager, device_manager
+from src.runtime import server, stats_manager, client_manager, device_manager, system_manager
+from src.tools._errors import handle_error as _handle_error
+from src.utils.coalesce import coalesce_ttl
+from src.utils.prefetch import get_snapshot
+
+try:  # Optional: vectorized aggregation for large stats arrays
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
 logger = logging.getLogger(__name__)
 
+# Report window sizes, in hours, per duration keyword.
+_DURATION_HOURS = {"hourly": 1, "daily": 24, "weekly": 168, "monthly": 720}
+
+# Below this size the Python loop beats NumPy's array-construction overhead.
+_NUMPY_MIN = 64
+
+# Shared fallback for missing "stat" sub-dicts — never mutated, never
+# reallocated per device in the aggregation loop.
+_EMPTY: Dict[str, Any] = {}
+
+# Opt-out: start the health fallback concurrently with the report fetch
+# and discard it when the reports are usable. Costs one (snapshot-backed,
+# self-error-catching) request on the happy path; halves p95 latency when
+# controllers return empty report buckets.
+_SPECULATIVE_FALLBACK = os.environ.get(
+    "UNIFI_MCP_SPECULATIVE_FALLBACK", "1"
+).strip().lower() not in {"0", "false", "no", "off"}
+
+
+# (connection id, site) memo — the connection object is a process-lifetime
+# singleton, so one identity check replaces two getattr per response.
+_site_memo = None
+
+
+def _site() -> str:
+    """Resolve the site name used in tool responses."""
+    global _site_memo
+    conn = getattr(stats_manager, "_connection", None)
+    memo = _site_memo
+    if memo is not None and memo[0] == id(conn):
+        return memo[1]
+    site = getattr(conn, "site", "unknown")
+    _site_memo = (id(conn), site)
+    return site
+
+
+def _safe_get(obj, key, default=None):
+    """Get a value from either a dict or an object attribute."""
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    return getattr(obj, key, default)
+
+
+def _raw_of(obj):
+    """Unwrap an aiounifi object to its raw dict, passing dicts through.
+
+    getattr with a default costs one lookup; the hasattr-then-access
+    pattern it replaces paid two.
+    """
+    r = getattr(obj, "raw", None)
+    return r if r is not None else obj
+
+
+# Short-TTL coalescing caches for per-client/device detail lookups:
+# dashboards poll the same identifiers every few seconds, so steady-state
+# polling skips the remote fetch, and concurrent identical lookups share
+# one round trip.
+@coalesce_ttl(ttl=30.0, maxsize=256)
+async def _cached_client_details(mac: str):
+    """client_manager.get_client_details with a coalescing TTL memo."""
+    return await client_manager.get_client_details(mac)
+
+
+@coalesce_ttl(ttl=30.0, maxsize=256)
+async def _cached_device_details(device_id: str):
+    """device_manager.get_device_details with a coalescing TTL memo."""
+    return await device_manager.get_device_details(device_id)
+
+
+def _serialize_list(items, limit=None):
+    """Unwrap a homogeneous list of aiounifi objects to raw dicts.
+
+    aiounifi collections hold one type, so the hasattr probe (a try/except
+    under the hood) runs once on the first element instead of per item.
+    An optional limit is applied via islice so callers never materialize an
+    intermediate sliced copy.
+    """
+    source = islice(items, limit) if limit is not None else items
+    if items and hasattr(items[0], "raw"):
+        return [item.raw for item in source]
+    return list(source)
+
+
+def _summarize(stats):
+    """Single-pass totals over a client/device stats list.
+
+    Returns (total_rx, total_tx, total_bytes, sta_sum, sta_max) from one
+    traversal, instead of one generator expression (and full pass) per
+    total.
+    """
+    if np is not None and len(stats) >= _NUMPY_MIN:
+        return _summarize_np(stats)
+    total_rx = total_tx = total_bytes = sta_sum = sta_max = 0
+    for e in stats:
+        e_get = e.get
+        rx = e_get("rx_bytes", 0) or 0
+        tx = e_get("tx_bytes", 0) or 0
+        total_rx += rx
+        total_tx += tx
+        b = e_get("bytes")
+        total_bytes += b if b is not None else rx + tx
+        sta = e_get("num_sta", 0) or 0
+        sta_sum += sta
+        if sta > sta_max:
+            sta_max = sta
+    return total_rx, total_tx, total_bytes, sta_sum, sta_max
+
+
+def _summarize_np(stats):
+    """NumPy variant of _summarize for large stats lists.
+
+    C-level reductions instead of a Python loop; worthwhile from
+    _NUMPY_MIN elements (e.g. monthly buckets). The -1 sentinel marks a
+    missing "bytes" field so a legitimate 0 is still respected.
+    """
+    n = len(stats)
+    rx = np.fromiter((e.get("rx_bytes", 0) or 0 for e in stats), dtype=np.int64, count=n)
+    tx = np.fromiter((e.get("tx_bytes", 0) or 0 for e in stats), dtype=np.int64, count=n)
+    b = np.fromiter(
+        (v if (v := e.get("bytes")) is not None else -1 for e in stats),
+        dtype=np.int64, count=n
+    )
+    sta = np.fromiter((e.get("num_sta", 0) or 0 for e in stats), dtype=np.int64, count=n)
+    return (
+        int(rx.sum()),
+        int(tx.sum()),
+        int(np.where(b >= 0, b, rx + tx).sum()),
+        int(sta.sum()),
+        int(sta.max()),
+    )
+
+
+def _summarize_wan(stats):
+    """Single-pass WAN totals over a site-report stats list.
+
+    Returns (total_rx, total_tx, sta_sum) using the wan/wan2 byte keys the
+    site report exposes.
+    """
+    total_rx = total_tx = sta_sum = 0
+    for e in stats:
+        e_get = e.get
+        # The controller reports these as numbers already; `or 0` covers
+        # None/missing without an int() round-trip per element.
+        total_rx += (e_get("wan-rx_bytes") or 0) + (e_get("wan2-rx_bytes") or 0)
+        total_tx += (e_get("wan-tx_bytes") or 0) + (e_get("wan2-tx_bytes") or 0)
+        sta_sum += e_get("num_sta") or 0
+    return total_rx, total_tx, sta_sum
+
+
+async def _fetch_health_wan():
+    """Fallback 1: WAN byte counters from the /stat/health summary.
+
+    Returns the WAN subsystem dict, or None on failure — errors are caught
+    here so the two fallback strategies can run under one gather.
+    """
+    try:
+        health = get_snapshot("network_health")
+        if health is None:
+            health = await system_manager.get_network_health()
+        items = health.get("items") if isinstance(health, dict) else health
+        if isinstance(health, dict) and items is None:
+            items = [health]
+        for item in items or ():
+            if isinstance(item, dict) and item.get("subsystem") == "wan":
+                return item
+    except (RequestError, ResponseError, ConnectionError, asyncio.TimeoutError, ValueError, TypeError):
+        logger.debug("Health fallback for network stats failed", exc_info=False)
+    return None
+
+
+# Short-TTL, single-flight cache for the device list used by the stats
+# fallback: the fallback fires on every poll against degenerate
+# controllers, which is exactly when a full device dump per poll hurts.
+_DEVICES_TTL = 10.0
+_devices_cache = None
+_devices_lock = asyncio.Lock()
+
+
+async def _cached_devices():
+    """device_manager.get_devices with a TTL memo and request coalescing."""
+    global _devices_cache
+    cached = _devices_cache
+    if cached is not None and monotonic() - cached[0] < _DEVICES_TTL:
+        return cached[1]
+    async with _devices_lock:
+        # Re-check under the lock: a concurrent caller may have refreshed.
+        cached = _devices_cache
+        if cached is not None and monotonic() - cached[0] < _DEVICES_TTL:
+            return cached[1]
+        devices = await device_manager.get_devices()
+        _devices_cache = (monotonic(), devices)
+        return devices
+
+
+async def _aggregate_device_totals():
+    """Fallback 2: sum rx/tx counters across adopted devices.
+
+    Returns (rx_total, tx_total), or None when nothing useful was found.
+    """
+    try:
+        devices = await _cached_devices()
+        rx_total = tx_total = 0
+        for dev in devices:
+            raw = getattr(dev, "raw", dev)
+            if not isinstance(raw, dict):
+                continue
+            g = raw.get
+            stat_get = (g("stat") or _EMPTY).get
+            rx_total += stat_get("rx_bytes") or g("rx_bytes") or 0
+            tx_total += stat_get("tx_bytes") or g("tx_bytes") or 0
+        if rx_total or tx_total:
+            return rx_total, tx_total
+    except (RequestError, ResponseError, ConnectionError, asyncio.TimeoutError, ValueError, TypeError):
+        logger.debug("Device-aggregation fallback for network stats failed", exc_info=False)
+    return None
+
 @server.tool(
     name="unifi_get_network_stats",
     description="Get network statistics from the Unifi Network controller"
 )
-async def get_network_stats(duration: str = "hourly") -> Dict[str, Any]:
-    """Implementation for getting network stats."""
+async def get_network_stats(duration: str = "hourly", raw: bool = False) -> Dict[str, Any]:
+    """Implementation for getting network stats.
+
+    The per-bucket report list is only included when ``raw`` is set; the
+    default response carries just the fused summary, which keeps large
+    (e.g. monthly) payloads off the MCP wire.
+    """
     try:
-        duration_hours = {
-            "hourly": 1, "daily": 24, "weekly": 168, "monthly": 720
-        }.get(duration, 1)
-        stats = await stats_manager.get_network_stats(duration_hours=duration_hours)
-        def _first_non_none(*values):
-            for v in values:
-                if v is not None:
-                    return v
-            return 0
-
-        # Aggregate WAN bytes from network stats
-        total_rx = sum(
-            int(e.get("wan-rx_bytes", 0) or 0) + int(e.get("wan2-rx_bytes", 0) or 0)
-            for e in stats
-        )
-        total_tx = sum(
-            int(e.get("wan-tx_bytes", 0) or 0) + int(e.get("wan2-tx_bytes", 0) or 0)
-            for e in stats
+        duration_hours = _DURATION_HOURS.get(duration, 1)
+        health_task = (
+            asyncio.create_task(_fetch_health_wan())
+            if _SPECULATIVE_FALLBACK else None
         )
-        
+        try:
+            stats = await stats_manager.get_network_stats(duration_hours=duration_hours)
+
+            # Aggregate WAN bytes and client counts in one pass
+            total_rx, total_tx, sta_sum = _summarize_wan(stats)
+
+            # Some controllers return empty/zeroed report buckets; fall back
+            # to the health summary and device counters, fetched concurrently
+            # since the two strategies are independent.
+            stats_source = "reports"
+            if not stats or (total_rx == 0 and total_tx == 0):
+                health_wan, device_totals = await asyncio.gather(
+                    health_task if health_task is not None else _fetch_health_wan(),
+                    _aggregate_device_totals(),
+                )
+                health_task = None  # consumed by the gather
+                if health_wan and (health_wan.get("rx_bytes") or health_wan.get("tx_bytes")):
+                    total_rx = health_wan.get("rx_bytes") or 0
+                    total_tx = health_wan.get("tx_bytes") or 0
+                    stats_source = "health"
+                elif device_totals:
+                    total_rx, total_tx = device_totals
+                    stats_source = "devices"
+                # One aggregated record for the whole fallback, and only when
+                # INFO is actually emitted — not a log line per data source.
+                if stats_source != "reports" and logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Network stats served from %s fallback: rx=%s tx=%s",
+                        stats_source, total_rx, total_tx,
+                    )
+        finally:
+            if health_task is not None:
+                # Discard the speculative fetch whenever it went unconsumed —
+                # reports were usable, or the report fetch raised. It
+                # self-catches, so it would otherwise quietly keep running a
+                # controller request whose result is thrown away.
+                health_task.cancel()
+
         summary = {
             "total_rx_bytes": total_rx,
             "total_tx_bytes": total_tx,
             "total_bytes": total_rx + total_tx,
-            "avg_clients": int(
-                sum(
-                    _first_non_none(
-                        e.get("num_sta")
-                    )
-                    for e in stats
-                ) / max(1, len(stats))
-            ) if stats else 0,
+            "avg_clients": int(sta_sum / max(1, len(stats))) if stats else 0,
         }
-        return {
+        response = {
             "success": True,
-            "site": getattr(
-                getattr(stats_manager, "_connection", None), "site", "unknown"
-            ),
+            "site": _site(),
             "duration": duration,
+            "stats_source": stats_source,
             "summary": summary,
-            "stats": stats
         }
+        if raw:
+            response["stats"] = stats
+        return response
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
-        logger.error("Error getting network stats: %s", e, exc_info=True)
-        return {"success": False, "error": str(e)}
+        return _handle_error(e, "getting network stats")
 
 @server.tool(
     name="unifi_get_client_stats",
     description="Get statistics for a specific client/device"
 )
-async def get_client_stats(client_id: str, duration: str = "hourly") -> Dict[str, Any]:
-    """Implementation for getting client stats."""
+async def get_client_stats(client_id: str, duration: str = "hourly", raw: bool = False) -> Dict[str, Any]:
+    """Implementation for getting client stats.
+
+    Raw per-bucket entries are included only when ``raw`` is set.
+    """
     try:
-        duration_hours = {
-            "hourly": 1, "daily": 24, "weekly": 168, "monthly": 720
-        }.get(duration, 1)
-        client_details = await client_manager.get_client_details(client_id)
+        duration_hours = _DURATION_HOURS.get(duration, 1)
+        client_details = await _cached_client_details(client_id)
         if not client_details:
             return {"success": False, "error": f"Client '{client_id}' not found"}
 
         # Support aiounifi Client objects as well as dicts
-        client_raw = (
-            client_details.raw if hasattr(client_details, "raw")
-            else client_details
-        )
-
-        # Handle both dict and object types
-        def safe_get(obj, key, default=None):
-            if isinstance(obj, dict):
-                return obj.get(key, default)
-            return getattr(obj, key, default)
+        client_raw = _raw_of(client_details)
 
-        client_mac = safe_get(client_raw, "mac", client_id)
+        client_mac = _safe_get(client_raw, "mac", client_id)
         client_name = (
-            safe_get(client_raw, "name")
-            or safe_get(client_raw, "hostname")
+            _safe_get(client_raw, "name")
+            or _safe_get(client_raw, "hostname")
             or client_mac
         )
 
@@ -102,93 +343,76 @@ async def get_client_stats(client_id: str, duration: str = "hourly") -> Dict[str
         stats = await stats_manager.get_client_stats(
             client_mac, duration_hours=duration_hours
         )
+        total_rx, total_tx, total_bytes, _sta_sum, _sta_max = _summarize(stats)
         summary = {
-            "total_rx_bytes": sum(e.get("rx_bytes", 0) for e in stats),
-            "total_tx_bytes": sum(e.get("tx_bytes", 0) for e in stats),
-            "total_bytes": sum(
-                e.get("bytes", e.get("rx_bytes", 0) + e.get("tx_bytes", 0))
-                for e in stats
-            ),
+            "total_rx_bytes": total_rx,
+            "total_tx_bytes": total_tx,
+            "total_bytes": total_bytes,
         }
-        return {
+        response = {
             "success": True,
-            "site": getattr(
-                getattr(stats_manager, "_connection", None), "site", "unknown"
-            ),
+            "site": _site(),
             "client_id": client_id,
             "client_name": client_name,
             "duration": duration,
             "summary": summary,
-            "stats": stats
         }
+        if raw:
+            response["stats"] = stats
+        return response
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
-        logger.error(
-            "Error getting client stats for %s: %s", client_id, e, exc_info=True
-        )
-        return {"success": False, "error": str(e)}
+        return _handle_error(e, f"getting client stats for {client_id}")
 
 @server.tool(
     name="unifi_get_device_stats",
     description="Get statistics for a specific device (access point, switch, etc.)"
 )
-async def get_device_stats(device_id: str, duration: str = "hourly") -> Dict[str, Any]:
-    """Implementation for getting device stats."""
+async def get_device_stats(device_id: str, duration: str = "hourly", raw: bool = False) -> Dict[str, Any]:
+    """Implementation for getting device stats.
+
+    Raw per-bucket entries are included only when ``raw`` is set.
+    """
     try:
-        duration_hours = {
-            "hourly": 1, "daily": 24, "weekly": 168, "monthly": 720
-        }.get(duration, 1)
-        device_details = await device_manager.get_device_details(device_id)
+        duration_hours = _DURATION_HOURS.get(duration, 1)
+        device_details = await _cached_device_details(device_id)
         if not device_details:
             return {"success": False, "error": f"Device '{device_id}' not found"}
 
-        # Handle both dict and object types for device details
-        def safe_get_device(obj, key, default=None):
-            if isinstance(obj, dict):
-                return obj.get(key, default)
-            return getattr(obj, key, default)
-
         device_name = (
-            safe_get_device(device_details, "name")
-            or safe_get_device(device_details, "model", "Unknown")
+            _safe_get(device_details, "name")
+            or _safe_get(device_details, "model", "Unknown")
         )
-        device_mac = safe_get_device(device_details, "mac", device_id)
-        device_type = safe_get_device(device_details, "type", "unknown")
+        device_mac = _safe_get(device_details, "mac", device_id)
+        device_type = _safe_get(device_details, "type", "unknown")
 
         # Use MAC address for stats API call
         stats = await stats_manager.get_device_stats(
             device_mac, duration_hours=duration_hours
         )
+        total_rx, total_tx, total_bytes, sta_sum, sta_max = _summarize(stats)
         summary = {
-            "total_rx_bytes": sum(e.get("rx_bytes", 0) for e in stats),
-            "total_tx_bytes": sum(e.get("tx_bytes", 0) for e in stats),
-            "total_bytes": sum(
-                e.get("bytes", e.get("rx_bytes", 0) + e.get("tx_bytes", 0))
-                for e in stats
-            ),
+            "total_rx_bytes": total_rx,
+            "total_tx_bytes": total_tx,
+            "total_bytes": total_bytes,
         }
         if device_type == "uap" and stats:
-            summary["avg_clients"] = int(
-                sum(e.get("num_sta", 0) for e in stats) / max(1, len(stats))
-            )
-            summary["max_clients"] = max(e.get("num_sta", 0) for e in stats)
+            summary["avg_clients"] = int(sta_sum / max(1, len(stats)))
+            summary["max_clients"] = sta_max
 
-        return {
+        response = {
             "success": True,
-            "site": getattr(
-                getattr(stats_manager, "_connection", None), "site", "unknown"
-            ),
+            "site": _site(),
             "device_id": device_id,
             "device_name": device_name,
             "device_type": device_type,
             "duration": duration,
             "summary": summary,
-            "stats": stats
         }
+        if raw:
+            response["stats"] = stats
+        return response
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
-        logger.error(
-            "Error getting device stats for %s: %s", device_id, e, exc_info=True
-        )
-        return {"success": False, "error": str(e)}
+        return _handle_error(e, f"getting device stats for {device_id}")
 
 @server.tool(
     name="unifi_get_top_clients",
@@ -199,35 +423,31 @@ async def get_top_clients(duration: str = "daily", limit: int = 10) -> Dict[str,
     try:
         top_client_stats = await stats_manager.get_top_clients(limit=limit)
 
+        # One bulk fetch instead of a lookup per entry: resolve names by
+        # joining against the MAC-keyed client map in-process.
+        mac_map = await client_manager.get_clients_by_mac()
+
         enhanced_clients = []
         for entry in top_client_stats:
             mac = entry.get("mac")
             name = "Unknown"
             if mac:
-                details = await client_manager.get_client_details(mac)
-                if details:
-                    raw = details.raw if hasattr(details, "raw") else details
-                    # Handle both dict and object types
-                    def safe_get(obj, key, default=None):
-                        if isinstance(obj, dict):
-                            return obj.get(key, default)
-                        return getattr(obj, key, default)
-                    name = safe_get(raw, "name") or safe_get(raw, "hostname") or mac
+                details = mac_map.get(mac)
+                if details is not None:
+                    raw = _raw_of(details)
+                    name = _safe_get(raw, "name") or _safe_get(raw, "hostname") or mac
             entry["name"] = name
             enhanced_clients.append(entry)
 
         return {
             "success": True,
-            "site": getattr(
-                getattr(stats_manager, "_connection", None), "site", "unknown"
-            ),
+            "site": _site(),
             "duration": duration,
             "limit": limit,
             "top_clients": enhanced_clients
         }
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
-        logger.error("Error getting top clients: %s", e, exc_info=True)
-        return {"success": False, "error": str(e)}
+        return _handle_error(e, "getting top clients")
 
 @server.tool(
     name="unifi_get_dpi_stats",
@@ -241,29 +461,19 @@ async def get_dpi_stats() -> Dict[str, Any]:
     try:
         dpi_stats_result = await stats_manager.get_dpi_stats()
 
-        def serialize_dpi(item):
-            return item.raw if hasattr(item, 'raw') else item
-
-        serialized_apps = [
-            serialize_dpi(app) for app in dpi_stats_result.get("applications", [])
-        ]
-        serialized_cats = [
-            serialize_dpi(cat) for cat in dpi_stats_result.get("categories", [])
-        ]
+        serialized_apps = _serialize_list(dpi_stats_result.get("applications", []))
+        serialized_cats = _serialize_list(dpi_stats_result.get("categories", []))
 
         return {
             "success": True,
-            "site": getattr(
-                getattr(stats_manager, "_connection", None), "site", "unknown"
-            ),
+            "site": _site(),
             "dpi_stats": {
                 "applications": serialized_apps,
                 "categories": serialized_cats
             }
         }
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
-        logger.error("Error getting DPI stats: %s", e, exc_info=True)
-        return {"success": False, "error": str(e)}
+        return _handle_error(e, "getting DPI stats")
 
 @server.tool(
     name="unifi_get_alerts",
@@ -272,26 +482,18 @@ async def get_dpi_stats() -> Dict[str, Any]:
 async def get_alerts(limit: int = 10, include_archived: bool = False) -> Dict[str, Any]:
     """Implementation for getting alerts."""
     try:
-        alerts = await stats_manager.get_alerts(include_archived=include_archived)
-        # Apply limit manually since the manager doesn't support it
-        if limit and len(alerts) > limit:
-            alerts = alerts[:limit]
-        
-        # Serialize Event objects to dicts using their .raw attribute
-        serialized_alerts = [
-            event.raw if hasattr(event, 'raw') else event
-            for event in alerts
-        ]
+        alerts = await stats_manager.get_alerts(
+            include_archived=include_archived, limit=limit or None
+        )
+        # The manager bounds the fetch; the islice here is only a safety net.
+        serialized_alerts = _serialize_list(alerts, limit=limit or None)
         
         return {
             "success": True,
-            "site": getattr(
-                getattr(stats_manager, "_connection", None), "site", "unknown"
-            ),
+            "site": _site(),
             "limit": limit,
             "include_archived": include_archived,
             "alerts": serialized_alerts
         }
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
-        logger.error("Error getting alerts: %s", e, exc_info=True)
-        return {"success": False, "error": str(e)}
+        return _handle_error(e, "getting alerts")
@@ -8,12 +8,31 @@ from typing import Any, Dict
 from aiounifi.errors import RequestError, ResponseError
 
 from src.runtime import server, system_manager
+from src.tools._errors import handle_error as _handle_error
+from src.utils.prefetch import get_snapshot
 
 logger = logging.getLogger(__name__)
 
 # Explicitly retrieve and log the server instance to confirm it's being used
 logger.info("System tools module loaded, server instance: %s", server)
 
+# (connection id, site) memo — the connection object is a process-lifetime
+# singleton, so one identity check replaces the double getattr per response.
+_site_memo = None
+
+
+def _site():
+    """Resolve the site name used in tool responses."""
+    global _site_memo
+    conn = (getattr(system_manager, "connection", None) or
+            getattr(system_manager, "_connection", None))
+    memo = _site_memo
+    if memo is not None and memo[0] == id(conn):
+        return memo[1]
+    site = getattr(conn, "site", None) if conn else None
+    _site_memo = (id(conn), site)
+    return site
+
 @server.tool(
     name="unifi_get_system_info",
     description="Get general system information from the Unifi Network controller (version, uptime, etc)."
@@ -22,14 +41,13 @@ async def get_system_info() -> Dict[str, Any]:
     """Implementation for getting system info."""
     logger.info("unifi_get_system_info tool called")
     try:
-        info = await system_manager.get_system_info()
-        connection = (getattr(system_manager, "connection", None) or
-                     getattr(system_manager, "_connection", None))
-        site = getattr(connection, "site", None) if connection else None
+        info = get_snapshot("system_info")
+        if info is None:
+            info = await system_manager.get_system_info()
+        site = _site()
         return {"success": True, "site": site, "system_info": info}
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001  # pylint: disable=broad-exception-caught
-        logger.error("Error getting system info: %s", e, exc_info=True)
-        return {"success": False, "error": str(e)}
+        return _handle_error(e, "getting system info")
 
 @server.tool(
     name="unifi_get_network_health",
@@ -39,14 +57,13 @@ async def get_network_health() -> Dict[str, Any]:
     """Implementation for getting network health."""
     logger.info("unifi_get_network_health tool called")
     try:
-        health = await system_manager.get_network_health()
-        connection = (getattr(system_manager, "connection", None) or
-                     getattr(system_manager, "_connection", None))
-        site = getattr(connection, "site", None) if connection else None
+        health = get_snapshot("network_health")
+        if health is None:
+            health = await system_manager.get_network_health()
+        site = _site()
         return {"success": True, "site": site, "health_summary": health}
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001  # pylint: disable=broad-exception-caught
-        logger.error("Error getting network health: %s", e, exc_info=True)
-        return {"success": False, "error": str(e)}
+        return _handle_error(e, "getting network health")
 
 @server.tool(
     name="unifi_get_site_settings",
@@ -59,14 +76,13 @@ async def get_site_settings() -> Dict[str, Any]:
     """Implementation for getting site settings."""
     logger.info("unifi_get_site_settings tool called")
     try:
-        settings = await system_manager.get_site_settings()
-        connection = (getattr(system_manager, "connection", None) or
-                     getattr(system_manager, "_connection", None))
-        site = getattr(connection, "site", None) if connection else None
+        settings = get_snapshot("site_settings")
+        if settings is None:
+            settings = await system_manager.get_site_settings()
+        site = _site()
         return {"success": True, "site": site, "site_settings": settings}
     except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:  # noqa: BLE001  # pylint: disable=broad-exception-caught
-        logger.error("Error getting site settings: %s", e, exc_info=True)
-        return {"success": False, "error": str(e)}
+        return _handle_error(e, "getting site settings")
 
 # Print confirmation that all tools have been registered
 logger.info(
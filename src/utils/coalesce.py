@@ -0,0 +1,66 @@
+"""TTL caching with request coalescing for async lookups.
+
+Wraps an async function so that results are memoized for a short TTL and
+concurrent calls with the same arguments share one in-flight request
+instead of each hitting the controller. All state lives on a single event
+loop, so no locking beyond the in-flight future map is needed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from functools import wraps
+from time import monotonic
+from typing import Any, Callable, Dict, Tuple
+
+
+def coalesce_ttl(ttl: float = 30.0, maxsize: int = 256) -> Callable:
+    """Decorate an async function with a TTL memo and in-flight coalescing.
+
+    Args:
+        ttl: seconds a cached result stays fresh.
+        maxsize: cache entry bound; the cache is cleared wholesale when
+            full (entries all expire within one TTL anyway).
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+        inflight: Dict[Tuple, asyncio.Future] = {}
+
+        @wraps(func)
+        async def wrapper(*args: Any) -> Any:
+            key = args
+            hit = cache.get(key)
+            if hit is not None and monotonic() - hit[0] < ttl:
+                return hit[1]
+
+            pending = inflight.get(key)
+            if pending is not None:
+                return await pending
+
+            future: asyncio.Future = asyncio.get_running_loop().create_future()
+            inflight[key] = future
+            try:
+                result = await func(*args)
+            except BaseException as e:
+                future.set_exception(e)
+                # Consume the exception so an un-awaited future doesn't
+                # log "exception was never retrieved".
+                future.exception()
+                raise
+            finally:
+                inflight.pop(key, None)
+            if len(cache) >= maxsize:
+                cache.clear()
+            cache[key] = (monotonic(), result)
+            future.set_result(result)
+            return result
+
+        def invalidate() -> None:
+            """Drop all cached results (in-flight requests are unaffected)."""
+            cache.clear()
+
+        wrapper.invalidate = invalidate  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
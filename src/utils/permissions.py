@@ -2,6 +2,7 @@
 Utility functions for MCP tools.
 """
 
+import functools
 import logging
 from typing import Dict, Any
 from collections.abc import Mapping
@@ -77,3 +78,40 @@ def parse_permission(permissions: Dict[str, Any], category: str, action: str) ->
         f"and action '{action}', nor in defaults. Denying action."
     )
     return False
+
+
+@functools.lru_cache(maxsize=None)
+def _resolved(category: str, action: str) -> bool:
+    """Resolve a permission once per (category, action) pair.
+
+    Permissions come from the config singleton and do not change during a
+    process's lifetime, so the walk through parse_permission only needs to
+    happen on first use.
+    """
+    from src.runtime import config  # local import to avoid a cycle at import time
+    return parse_permission(getattr(config, "permissions", {}), category, action)
+
+
+def require_permission(category: str, action: str, denied_error: str = "Permission denied."):
+    """Decorator for mutating tools: permission check plus confirm gate.
+
+    Replaces the per-tool parse_permission/confirm boilerplate. The wrapped
+    tool keeps its signature (FastMCP introspects it via __wrapped__); the
+    `confirm` keyword is still forwarded to the tool.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if not _resolved(category, action):
+                logger.warning(
+                    "Permission denied for %s (%s/%s).", fn.__name__, category, action
+                )
+                return {"success": False, "error": denied_error}
+            if not kwargs.get("confirm", False):
+                return {
+                    "success": False,
+                    "error": "Confirmation required. Set confirm=true.",
+                }
+            return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,77 @@
+"""Background prefetch of slow-changing controller state.
+
+Network health, site settings, and system info change on the order of
+minutes, but MCP clients re-query them constantly. A single background
+task refreshes them on a timer into an in-memory snapshot so tool calls
+become a dict lookup instead of an HTTP round trip. Readers fall back to
+a live fetch whenever the snapshot is missing or stale (more than two
+refresh intervals old), so the server degrades gracefully if the task
+dies or was never started.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
+
+from aiounifi.errors import RequestError, ResponseError
+
+logger = logging.getLogger("unifi-network-mcp")
+
+REFRESH_INTERVAL = 60.0
+_STALE_AFTER = REFRESH_INTERVAL * 2
+
+# key -> (value, monotonic timestamp of the fetch)
+_snapshot: Dict[str, Tuple[Any, float]] = {}
+_task: Optional[asyncio.Task] = None
+
+
+def get_snapshot(key: str) -> Any:
+    """Return the prefetched value for *key*, or None if missing/stale."""
+    hit = _snapshot.get(key)
+    if hit is not None and monotonic() - hit[1] < _STALE_AFTER:
+        return hit[0]
+    return None
+
+
+async def _refresh_once() -> None:
+    # Imported here so the module stays importable before runtime wiring.
+    from src.runtime import system_manager
+
+    sources = (
+        ("network_health", system_manager.get_network_health),
+        ("site_settings", system_manager.get_site_settings),
+        ("system_info", system_manager.get_system_info),
+    )
+    for key, fetch in sources:
+        try:
+            _snapshot[key] = (await fetch(), monotonic())
+        except (RequestError, ResponseError, ConnectionError,
+                asyncio.TimeoutError, ValueError, TypeError) as e:
+            # Keep any previous (possibly stale) entry; readers fall back
+            # to a live fetch once it ages out.
+            logger.debug("Prefetch of %s failed: %s", key, e)
+
+
+async def _refresh_loop() -> None:
+    while True:
+        await _refresh_once()
+        await asyncio.sleep(REFRESH_INTERVAL)
+
+
+def start_prefetch() -> None:
+    """Spawn the refresh task on the running loop (idempotent)."""
+    global _task
+    if _task is None or _task.done():
+        _task = asyncio.create_task(_refresh_loop())
+        logger.info("Background prefetch task started (every %ss)", REFRESH_INTERVAL)
+
+
+def stop_prefetch() -> None:
+    """Cancel the refresh task, e.g. on server shutdown."""
+    global _task
+    if _task is not None:
+        _task.cancel()
+        _task = None
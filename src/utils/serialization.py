@@ -0,0 +1,73 @@
+"""Iterative serialization of aiounifi payloads to JSON primitives.
+
+Controller responses mix plain dicts, lists, and aiounifi model objects
+exposing a ``raw`` dict, nested arbitrarily deep. The walker here uses an
+explicit work queue instead of recursion: no Python frame per node and no
+RecursionError on pathologically nested payloads.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+def serialize_aiounifi_object(obj: Any) -> Any:
+    """Coerce *obj* into JSON-serializable primitives.
+
+    Primitives pass through untouched, model objects are unwrapped via
+    ``raw``, containers are walked once breadth-first (preserving dict
+    key order), and any other leaf (datetimes etc.) is stringified.
+
+    JSON-parsed payloads are overwhelmingly leaves of exact primitive
+    types, so each node pays a type-identity check first; the ``raw``
+    probe and the isinstance fallback (for primitive subclasses) only
+    run for the rare non-primitive node.
+    """
+    t = type(obj)
+    if t is str or t is int or t is float or t is bool or obj is None:
+        return obj
+    if t is not dict and t is not list and t is not tuple:
+        raw = getattr(obj, "raw", None)
+        if raw is not None:
+            obj = raw
+            t = type(obj)
+        elif isinstance(obj, _PRIMITIVES):
+            return obj
+        else:
+            return str(obj)
+    if t is dict:
+        root: Any = {}
+        queue = deque((v, root, str(k)) for k, v in obj.items())
+    elif t is list or t is tuple:
+        root = [None] * len(obj)
+        queue = deque((v, root, i) for i, v in enumerate(obj))
+    else:
+        return obj if isinstance(obj, _PRIMITIVES) else str(obj)
+
+    while queue:
+        src, dst, key = queue.popleft()
+        t = type(src)
+        if t is str or t is int or t is float or t is bool or src is None:
+            dst[key] = src
+        elif t is dict:
+            child: Any = {}
+            dst[key] = child
+            queue.extend((v, child, str(k)) for k, v in src.items())
+        elif t is list or t is tuple:
+            child = [None] * len(src)
+            dst[key] = child
+            queue.extend((v, child, i) for i, v in enumerate(src))
+        else:
+            raw = getattr(src, "raw", None)
+            if raw is not None:
+                # Re-queue the unwrapped payload so it takes the normal
+                # container/primitive dispatch above.
+                queue.appendleft((raw, dst, key))
+            elif isinstance(src, _PRIMITIVES):
+                dst[key] = src
+            else:
+                dst[key] = str(src)
+    return root
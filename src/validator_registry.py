@@ -20,7 +20,7 @@ from src.schemas import (
     WLAN_SCHEMA,
     WLAN_UPDATE_SCHEMA,
 )
-from src.validators import ResourceValidator
+from src.validators import ResourceValidator, ValidationFailed, make_validator
 
 
 class UniFiValidatorRegistry:
@@ -77,6 +77,13 @@ class UniFiValidatorRegistry:
         )
     }
 
+    # Closure counterparts of _validators for the hot validate() path;
+    # built from the same schemas, so the compiled functions are shared.
+    _validate_fns = {
+        resource_type: make_validator(v.schema, v.resource_name)
+        for resource_type, v in _validators.items()
+    }
+
     @classmethod
     def get_validator(cls, resource_type: str) -> Optional[ResourceValidator]:
         """Get validator for a resource type."""
@@ -95,11 +102,44 @@ class UniFiValidatorRegistry:
         Returns:
             Tuple of (is_valid, error_message, validated_params)
         """
+        fn = cls._validate_fns.get(resource_type)
+        if fn:
+            return fn(params)
+        return (
+            False,
+            f"No validator found for resource type: {resource_type}",
+            None
+        )
+
+    @classmethod
+    def parse(cls, resource_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Return validated params or raise ValidationFailed.
+
+        Allocation-free on success; unknown resource types raise too.
+        """
+        validator = cls.get_validator(resource_type)
+        if validator is None:
+            raise ValidationFailed(
+                f"No validator found for resource type: {resource_type}"
+            )
+        return validator.parse(params)
+
+    @classmethod
+    async def validate_async(
+        cls, resource_type: str, params: Dict[str, Any]
+    ) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        """validate() for async callers; offloads the slow fallback path."""
         validator = cls.get_validator(resource_type)
         if validator:
-            return validator.validate(params)
+            return await validator.validate_async(params)
         return (
             False,
             f"No validator found for resource type: {resource_type}",
             None
         )
+
+    @classmethod
+    def is_valid(cls, resource_type: str, params: Dict[str, Any]) -> bool:
+        """Boolean-only validation; skips error-message construction."""
+        validator = cls.get_validator(resource_type)
+        return validator.is_valid(params) if validator else False
@@ -1,72 +1,432 @@
 """Validators for UniFi Network resource creation and validation."""
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional, Tuple
-from aiounifi.errors import RequestError, ResponseError
+import re
+from functools import lru_cache
+from hashlib import sha256
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
+import orjson
 from jsonschema import ValidationError, validate
 
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - declared dependency; guard for safety
+    fastjsonschema = None
+
+try:
+    # Validators compiled ahead of time by devtools/build_validators.py;
+    # keyed by schema digest so a stale module just misses the lookup.
+    from src import _generated_validators as _precompiled
+except ImportError:  # pragma: no cover - regenerate via devtools/build_validators.py
+    _precompiled = None
+
 logger = logging.getLogger("unifi-network-mcp")
 
+# Resolved once so the per-call except clause is a LOAD_FAST/LOAD_CONST
+# instead of two attribute lookups on the module.
+_FAST_ERR = fastjsonschema.JsonSchemaException if fastjsonschema else ()
+
+# Unambiguous alias for default-arg binding inside the class body, where
+# the bare name would resolve to the validate() method being defined.
+_jsonschema_validate = validate
+
+
+# Custom formats used by the schemas in src/schemas.py. Each is one
+# precompiled-regex fullmatch baked into the generated validator, instead
+# of (as with undeclared formats) no check at all.
+_FORMATS = {
+    "mac": re.compile(r"[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5}").fullmatch,
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(schema_dump: bytes):
+    """Compile a canonically-dumped schema once per distinct schema."""
+    return fastjsonschema.compile(orjson.loads(schema_dump), formats=_FORMATS)
+
+
+# id -> (schema, canonical dump) memo. Holding the schema itself keeps its
+# id from being reused, so identity lookups are safe; repeated
+# ResourceValidator construction over the same schema dict then skips both
+# the re-serialization and the recompile.
+_dump_memo: Dict[int, Tuple[Dict[str, Any], bytes]] = {}
+
+
+class ValidationFailed(Exception):
+    """Raised by parse() when parameters do not satisfy their schema.
+
+    The exception message is the same user-facing string validate()
+    returns; the original jsonschema/fastjsonschema error is chained.
+    """
+
+    __slots__ = ()
+
+
+def _compiled_for(schema: Dict[str, Any]):
+    """Return the shared compiled validator for *schema*."""
+    key = id(schema)
+    hit = _dump_memo.get(key)
+    if hit is not None and hit[0] is schema:
+        dump = hit[1]
+    else:
+        if len(_dump_memo) >= 256:
+            _dump_memo.clear()
+        dump = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+        _dump_memo[key] = (schema, dump)
+    if _precompiled is not None:
+        fn = _precompiled.VALIDATORS.get(sha256(dump).hexdigest())
+        if fn is not None:
+            return fn
+    return _compile_cached(dump)
+
 class ResourceValidator:
     """Base validator for UniFi Network resource creation."""
 
+    __slots__ = ("schema", "resource_name", "_compiled", "_seen", "_required")
+
+    # Bound on the per-validator memo of already-validated dicts.
+    _SEEN_MAX = 128
+
     def __init__(self, schema: Dict[str, Any], resource_name: str):
         self.schema = schema
         self.resource_name = resource_name
+        # id -> params memo of dicts that already passed validation, so
+        # layered defensive validate() calls on the same object are a
+        # dict probe. Holding the dict itself keeps its id from being
+        # reused; callers must not mutate params after validation.
+        self._seen: Dict[int, Dict[str, Any]] = {}
+        # Prefilter data for object schemas: an isinstance plus a
+        # frozenset-subset check rejects non-dicts and missing required
+        # keys without entering the compiled validator. None disables
+        # the prefilter for non-object schemas.
+        self._required: Optional[frozenset] = (
+            frozenset(schema.get("required") or ())
+            if schema.get("type") == "object" else None
+        )
+        # Compile once at registration time when fastjsonschema is present;
+        # jsonschema.validate re-walks the schema on every call otherwise.
+        self._compiled = None
+        if fastjsonschema is not None:
+            try:
+                self._compiled = _compiled_for(schema)
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                logger.warning(
+                    "Could not compile schema for %s (%s); falling back to jsonschema.",
+                    resource_name, e
+                )
 
     def validate(
-        self, params: Dict[str, Any]
+        self, params: Dict[str, Any],
+        _fast_err=_FAST_ERR, _run=_jsonschema_validate, _schema_err=ValidationError,
     ) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
         """Validate parameters against schema.
 
+        The underscore defaults pre-bind module globals so the per-call
+        lookups are LOAD_FAST; callers pass only ``params``.
+
         Args:
             params: The parameters to validate
 
         Returns:
             Tuple of (is_valid, error_message, validated_params)
         """
+        seen = self._seen
+        if seen.get(id(params)) is params:
+            return True, None, params
+
+        required = self._required
+        if required is not None and (
+            not isinstance(params, dict)
+            or (required and not required.issubset(params))
+        ):
+            msg = self._reject_msg(params)
+            logger.error("%s", msg)
+            return False, msg, None
+
+        if self._compiled is not None:
+            try:
+                self._compiled(params)
+                self._mark_seen(params)
+                return True, None, params
+            except _fast_err as e:
+                # Format once; the same string is logged and returned.
+                msg = f"{self.resource_name} validation error: {e.message}"
+                logger.error("%s", msg)
+                return False, msg, None
+
         try:
             # Validate against JSON schema
-            validate(instance=params, schema=self.schema)
+            _run(instance=params, schema=self.schema)
 
             # Additional custom validation could be added here
 
+            self._mark_seen(params)
+            return True, None, params
+        except _schema_err as e:
+            msg = f"{self.resource_name} validation error: {e.message}"
+            logger.error("%s", msg)
+            return False, msg, None
+        except (ValueError, TypeError) as e:
+            msg = f"Unexpected error validating {self.resource_name}: {e}"
+            logger.error("%s", msg, exc_info=True)
+            return False, msg, None
+
+    def parse(
+        self, params: Dict[str, Any],
+        _fast_err=_FAST_ERR, _run=_jsonschema_validate, _schema_err=ValidationError,
+    ) -> Dict[str, Any]:
+        """Return *params* validated, raising ValidationFailed otherwise.
+
+        Exception-based counterpart of validate(): the success path hands
+        back the dict itself with no result-tuple allocation, and the
+        error string is built only on the rare failure branch. Failures
+        are not logged here; the raised message is for the caller.
+        """
+        seen = self._seen
+        if seen.get(id(params)) is params:
+            return params
+
+        required = self._required
+        if required is not None and (
+            not isinstance(params, dict)
+            or (required and not required.issubset(params))
+        ):
+            raise ValidationFailed(self._reject_msg(params))
+
+        if self._compiled is not None:
+            try:
+                self._compiled(params)
+            except _fast_err as e:
+                raise ValidationFailed(
+                    f"{self.resource_name} validation error: {e.message}"
+                ) from e
+            self._mark_seen(params)
+            return params
+
+        try:
+            _run(instance=params, schema=self.schema)
+        except _schema_err as e:
+            raise ValidationFailed(
+                f"{self.resource_name} validation error: {e.message}"
+            ) from e
+        except (ValueError, TypeError) as e:
+            raise ValidationFailed(
+                f"Unexpected error validating {self.resource_name}: {e}"
+            ) from e
+        self._mark_seen(params)
+        return params
+
+    async def validate_async(
+        self, params: Dict[str, Any]
+    ) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        """validate() without blocking the event loop on the slow path.
+
+        Compiled validators run in microseconds on this repo's schemas,
+        so that path stays synchronous; only the jsonschema fallback,
+        which re-walks the schema per call, is pushed to the default
+        executor.
+        """
+        if self._compiled is not None:
+            return self.validate(params)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.validate, params
+        )
+
+    def _reject_msg(self, params: Any) -> str:
+        """Error text for a prefilter rejection; runs only on failures.
+
+        Mirrors the wording of the compiled validator so callers see the
+        same message either way.
+        """
+        if not isinstance(params, dict):
+            return f"{self.resource_name} validation error: data must be object"
+        missing = sorted(self._required.difference(params))
+        return (
+            f"{self.resource_name} validation error: "
+            f"data must contain {missing} properties"
+        )
+
+    def _mark_seen(self, params: Dict[str, Any]) -> None:
+        """Record *params* as validated (bounded; wholesale clear on full)."""
+        seen = self._seen
+        if len(seen) >= self._SEEN_MAX:
+            seen.clear()
+        seen[id(params)] = params
+
+    def is_valid(
+        self, params: Dict[str, Any],
+        _fast_err=_FAST_ERR, _run=_jsonschema_validate, _schema_err=ValidationError,
+    ) -> bool:
+        """Boolean-only validation for callers that discard the error.
+
+        Skips error-string construction and logging on the invalid path;
+        use validate() where the message is surfaced to the caller.
+        """
+        required = self._required
+        if required is not None and (
+            not isinstance(params, dict)
+            or (required and not required.issubset(params))
+        ):
+            return False
+        if self._compiled is not None:
+            try:
+                self._compiled(params)
+                return True
+            except _fast_err:
+                return False
+        try:
+            _run(instance=params, schema=self.schema)
+            return True
+        except (_schema_err, ValueError, TypeError):
+            return False
+
+
+def make_validator(schema: Dict[str, Any], resource_name: str):
+    """Build a plain ``validate(params)`` closure for hot call sites.
+
+    Behaves like ``ResourceValidator.validate`` but keeps its state
+    (compiled validator, resource name, seen-memo) in free variables, so
+    each call is a direct function call with LOAD_DEREF lookups instead
+    of bound-method creation plus attribute loads on self. The compiled
+    function comes from the same shared cache as the class, and the
+    fast/fallback branch is resolved once here rather than per call.
+    """
+    seen: Dict[int, Dict[str, Any]] = {}
+    required: Optional[frozenset] = (
+        frozenset(schema.get("required") or ())
+        if schema.get("type") == "object" else None
+    )
+
+    def _mark_seen(params: Dict[str, Any]) -> None:
+        if len(seen) >= ResourceValidator._SEEN_MAX:
+            seen.clear()
+        seen[id(params)] = params
+
+    def _reject_msg(params: Any) -> str:
+        if not isinstance(params, dict):
+            return f"{resource_name} validation error: data must be object"
+        missing = sorted(required.difference(params))
+        return (
+            f"{resource_name} validation error: "
+            f"data must contain {missing} properties"
+        )
+
+    compiled = None
+    if fastjsonschema is not None:
+        try:
+            compiled = _compiled_for(schema)
+        except fastjsonschema.JsonSchemaDefinitionException as e:
+            logger.warning(
+                "Could not compile schema for %s (%s); falling back to jsonschema.",
+                resource_name, e
+            )
+
+    if compiled is not None:
+        def validate_params(
+            params: Dict[str, Any], _fast_err=_FAST_ERR,
+        ) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+            if seen.get(id(params)) is params:
+                return True, None, params
+            if required is not None and (
+                not isinstance(params, dict)
+                or (required and not required.issubset(params))
+            ):
+                msg = _reject_msg(params)
+                logger.error("%s", msg)
+                return False, msg, None
+            try:
+                compiled(params)
+            except _fast_err as e:
+                msg = f"{resource_name} validation error: {e.message}"
+                logger.error("%s", msg)
+                return False, msg, None
+            _mark_seen(params)
             return True, None, params
-        except ValidationError as e:
-            error_msg = "%s validation error: %s"
-            logger.error(error_msg, self.resource_name, e.message)
-            return False, error_msg % (self.resource_name, e.message), None
-        except (RequestError, ResponseError, ConnectionError, ValueError, TypeError) as e:
-            error_msg = "Unexpected error validating %s: %s"
-            logger.error(error_msg, self.resource_name, str(e), exc_info=True)
-            return False, error_msg % (self.resource_name, str(e)), None
+        return validate_params
+
+    def validate_params(
+        params: Dict[str, Any],
+        _run=_jsonschema_validate, _schema_err=ValidationError,
+    ) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+        if seen.get(id(params)) is params:
+            return True, None, params
+        if required is not None and (
+            not isinstance(params, dict)
+            or (required and not required.issubset(params))
+        ):
+            msg = _reject_msg(params)
+            logger.error("%s", msg)
+            return False, msg, None
+        try:
+            _run(instance=params, schema=schema)
+        except _schema_err as e:
+            msg = f"{resource_name} validation error: {e.message}"
+            logger.error("%s", msg)
+            return False, msg, None
+        except (ValueError, TypeError) as e:
+            msg = f"Unexpected error validating {resource_name}: {e}"
+            logger.error("%s", msg, exc_info=True)
+            return False, msg, None
+        _mark_seen(params)
+        return True, None, params
+    return validate_params
+
+
+# Specialized response builders: each is a single dict literal with no
+# isinstance or None branching, for call sites that already know which
+# shape they are producing.
+
+def ok_id(resource_id: str) -> Dict[str, Any]:
+    """Success response carrying a created resource's id."""
+    return {"success": True, "id": resource_id}
+
+
+def ok_data(data: Any) -> Dict[str, Any]:
+    """Success response carrying a resource object."""
+    return {"success": True, "data": data}
+
+
+def err(error: str) -> Dict[str, Any]:
+    """Failure response carrying an error message."""
+    return {"success": False, "error": error}
+
+
+# Shared immutable responses for the payload-free shapes: these are
+# serialized straight to JSON and never mutated, so one instance serves
+# every call instead of a fresh small-dict allocation each time.
+_OK_EMPTY = MappingProxyType({"success": True})
+_FAIL_EMPTY = MappingProxyType({"success": False})
+
+
+@lru_cache(maxsize=128)
+def _err_cached(error: str) -> Mapping[str, Any]:
+    """Immutable error response, shared across repeats of the same message."""
+    return MappingProxyType({"success": False, "error": error})
 
 
 def create_response(
                     success: bool,
                     data: Any = None,
                     error: Optional[str] = None
-) -> Dict[str, Any]:
+) -> Mapping[str, Any]:
     """Create a standardized response format for all creation operations.
 
+    Back-compat dispatcher over the specialized builders above; the
+    payload-free shapes come from shared immutable mappings.
+
     Args:
         success: Whether the operation was successful
         data: The data to include in the response (typically a resource ID or object)
         error: Error message if the operation failed
 
     Returns:
-        A standardized response dictionary
+        A standardized response mapping
     """
-    response: Dict[str, Any] = {"success": success}
-
-    if success and data is not None:
-        if isinstance(data, str):
-            response["id"] = data
-        else:
-            response["data"] = data
-
-    if not success and error:
-        response["error"] = error
-
-    return response
+    if success:
+        if data is None:
+            return _OK_EMPTY
+        return ok_id(data) if isinstance(data, str) else ok_data(data)
+    return _err_cached(error) if error else _FAIL_EMPTY